@@ -6,9 +6,10 @@ FastAPI application for the smart home protection system.
 from __future__ import annotations
 
 import asyncio
+import json
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,12 +19,16 @@ from loguru import logger
 
 from ..core import (
     AlertSeverity,
+    DeliveryMode,
     EventType,
     GasType,
+    OverflowPolicy,
+    create_transport,
     get_config,
     get_event_bus,
     init_db,
 )
+from ..core.database import to_naive_utc
 from ..core.monitor import LuxxHausMonitor, create_default_monitor
 
 
@@ -127,42 +132,91 @@ class AcknowledgeAlertRequest(BaseModel):
 # =============================================================================
 
 
+_BROADCAST_PREFIXES = ("sensor.", "valve.", "alert.")
+
+
 class WebSocketManager:
     """Manages WebSocket connections for real-time updates."""
 
     def __init__(self):
         self.active_connections: List[WebSocket] = []
+        self.batch_connections: Set[WebSocket] = set()  # opted in with ?format=batch
         self._setup_event_handlers()
 
     def _setup_event_handlers(self):
         """Subscribe to events for broadcasting."""
-        event_bus = get_event_bus()
-        event_bus.subscribe("sensor.*", self._broadcast_event)
-        event_bus.subscribe("valve.*", self._broadcast_event)
-        event_bus.subscribe("alert.*", self._broadcast_event)
+        # Queued so a slow client never stalls the sensors publishing events;
+        # under backlog the oldest updates are dropped. Batched so a backlog
+        # is serialized once and, for clients that opt in, sent as one message.
+        # One subscription, filtered in the handler: each pattern would get
+        # its own queue and worker, and they would interleave their sends.
+        get_event_bus().subscribe(
+            "*",
+            self._broadcast_events,
+            mode=DeliveryMode.QUEUED,
+            overflow=OverflowPolicy.DROP_OLDEST,
+            batch=True,
+        )
+
+    async def _broadcast_events(self, events):
+        """
+        Broadcast events to all connected clients.
+
+        Clients get one JSON object per event, in order. Clients that
+        connected with ``?format=batch`` always get one JSON array per
+        delivery instead, even when it holds a single event.
+
+        The queue drains urgent events first; each delivery is put back in
+        publication order, so only a backlog larger than one delivery lets
+        an alert overtake older readings.
+        """
+        payloads = [
+            event.to_dict()
+            for event in sorted(events, key=lambda event: event.epoch)
+            if event.type.value.startswith(_BROADCAST_PREFIXES)
+        ]
+        if not payloads:
+            return
+        messages = [json.dumps(payload) for payload in payloads]
+        batch_message = json.dumps(payloads) if self.batch_connections else None
 
-    async def _broadcast_event(self, event):
-        """Broadcast event to all connected clients."""
-        await self.broadcast(event.to_dict())
+        disconnected = []
+        for connection in self.active_connections:
+            try:
+                if connection in self.batch_connections:
+                    await connection.send_text(batch_message)
+                else:
+                    for message in messages:
+                        await connection.send_text(message)
+            except Exception:
+                disconnected.append(connection)
+
+        for conn in disconnected:
+            self.disconnect(conn)
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, batch: bool = False):
         """Accept a new WebSocket connection."""
         await websocket.accept()
         self.active_connections.append(websocket)
+        if batch:
+            self.batch_connections.add(websocket)
         logger.info(f"WebSocket connected. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        self.batch_connections.discard(websocket)
         logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
 
     async def broadcast(self, data: Dict[str, Any]):
         """Broadcast data to all connected clients."""
+        # Serialize once rather than once per connection
+        message = json.dumps(data)
         disconnected = []
         for connection in self.active_connections:
             try:
-                await connection.send_json(data)
+                await connection.send_text(message)
             except Exception:
                 disconnected.append(connection)
         
@@ -181,24 +235,41 @@ ws_manager: Optional[WebSocketManager] = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan handler."""
+    """
+    Application lifespan handler.
+    
+    With several uvicorn workers, run one with ``api.drive_sensors`` (the
+    monitor, whose transport becomes the hub) and start the others with
+    ``api.drive_sensors = False``: they skip the monitor and only bridge
+    hub events to their WebSocket clients, so sensors are driven once.
+    REST endpoints that need the monitor return 503 on those workers.
+    """
     global monitor, ws_manager
     
     # Startup
     logger.info("Starting LUXX HAUS API...")
+    config = get_config()
+    
+    # Start WebSocket manager
+    ws_manager = WebSocketManager()
+    
+    if not config.api.drive_sensors:
+        bridge = create_transport(get_event_bus(), config.transport, role="client")
+        await bridge.start()
+        logger.info(f"Bridge-only API worker relaying events from {config.transport.socket_path}")
+        yield
+        logger.info("Shutting down LUXX HAUS API...")
+        await bridge.stop()
+        return
     
     # Initialize database
     init_db()
     
     # Create monitor
-    config = get_config()
     monitor = create_default_monitor(
         simulation_mode=config.system.simulation_mode
     )
     
-    # Start WebSocket manager
-    ws_manager = WebSocketManager()
-    
     # Start monitoring in background
     monitor_task = asyncio.create_task(monitor.start())
     
@@ -315,8 +386,26 @@ async def get_sensor(sensor_id: str):
 
 
 @app.get("/api/v1/sensors/{sensor_id}/readings", tags=["Sensors"])
-async def get_sensor_readings(sensor_id: str, limit: int = 100):
-    """Get recent readings for a sensor."""
+async def get_sensor_readings(
+    sensor_id: str,
+    limit: int = 100,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_points: int = 500,
+    before_ts: Optional[datetime] = None,
+    after_ts: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+):
+    """
+    Get readings for a sensor.
+
+    Without ``start``, returns the most recent in-memory readings. With a
+    time range, returns stored history at the finest resolution (raw, 1m,
+    15m or 1h rollups) that fits within ``max_points``. With ``before_ts``
+    or ``after_ts`` (plus the matching ``before_id``/``after_id``), pages
+    through stored raw history by (timestamp, id) cursor.
+    """
     if not monitor:
         raise HTTPException(status_code=503, detail="Monitor not initialized")
     
@@ -324,6 +413,48 @@ async def get_sensor_readings(sensor_id: str, limit: int = 100):
     if not sensor:
         raise HTTPException(status_code=404, detail="Sensor not found")
     
+    if start is not None:
+        if max_points < 1:
+            raise HTTPException(status_code=400, detail="max_points must be positive")
+        start = to_naive_utc(start)
+        end = to_naive_utc(end) if end is not None else datetime.utcnow()
+        if start >= end:
+            raise HTTPException(status_code=400, detail="start must be before end")
+        series = await monitor._db.get_reading_series(
+            sensor_id, start=start, end=end, max_points=max_points
+        )
+        return {"sensor_id": sensor_id, **series}
+    
+    if before_ts is not None or after_ts is not None:
+        rows = await monitor._db.get_readings_page(
+            sensor_id,
+            limit=limit,
+            before_ts=before_ts,
+            after_ts=after_ts,
+            before_id=before_id,
+            after_id=after_id,
+        )
+        return {
+            "sensor_id": sensor_id,
+            "readings": [
+                {
+                    "sensor_id": r.sensor_id,
+                    "sensor_type": r.sensor_type,
+                    "value": r.value,
+                    "unit": r.unit,
+                    "timestamp": r.timestamp.isoformat(),
+                    "is_alert": r.is_alert,
+                    "severity": r.severity,
+                }
+                for r in rows
+            ],
+            # Cursors for the next older / newer page
+            "next_before_ts": rows[-1].timestamp.isoformat() if rows else None,
+            "next_before_id": rows[-1].id if rows else None,
+            "next_after_ts": rows[0].timestamp.isoformat() if rows else None,
+            "next_after_id": rows[0].id if rows else None,
+        }
+    
     return {
         "sensor_id": sensor_id,
         "readings": [r.to_dict() for r in sensor.readings[-limit:]],
@@ -511,13 +642,21 @@ async def acknowledge_alert(alert_id: int, request: AcknowledgeAlertRequest):
 
 
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time updates."""
+async def websocket_endpoint(websocket: WebSocket, format: str = "event"):
+    """
+    WebSocket endpoint for real-time updates.
+    
+    Each message is one event object. Connect with ``?format=batch`` to
+    receive every delivery as an array of events instead.
+    """
     if not ws_manager:
         await websocket.close(code=1011)
         return
+    if format not in ("event", "batch"):
+        await websocket.close(code=1003)
+        return
     
-    await ws_manager.connect(websocket)
+    await ws_manager.connect(websocket, batch=format == "batch")
     
     try:
         while True:
@@ -0,0 +1,4 @@
+"""
+LUXX HAUS Benchmarks
+Micro-benchmarks for hot paths. Run a module with ``python -m src.benchmarks.<name>``.
+"""
@@ -0,0 +1,111 @@
+"""
+LUXX HAUS Insert Benchmark
+Compares reading insert throughput on SQLite:
+
+    orm_refresh   DatabaseManager.log_reading (ORM object, commit, refresh)
+    core_single   DatabaseManager.insert_row, one transaction per row
+    core_batch    DatabaseManager.insert_rows, executemany in batches
+
+Usage:
+    python -m src.benchmarks.db_inserts --rows 2000 --batch 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ..core import DatabaseManager, LuxxHausConfig, SensorReading, SensorType, set_config
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    """Build synthetic reading rows."""
+    return [
+        {
+            "sensor_id": f"BENCH-{i % 16:03d}",
+            "sensor_type": SensorType.WATER_PRESSURE.value,
+            "value": 40.0 + (i % 10),
+            "unit": "PSI",
+            "is_alert": False,
+            "severity": None,
+        }
+        for i in range(count)
+    ]
+
+
+async def bench_orm_refresh(db: DatabaseManager, rows: List[Dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        await db.log_reading(
+            sensor_id=row["sensor_id"],
+            sensor_type=SensorType(row["sensor_type"]),
+            value=row["value"],
+            unit=row["unit"],
+        )
+    return time.perf_counter() - start
+
+
+async def bench_core_single(db: DatabaseManager, rows: List[Dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        await db.insert_row(SensorReading, row)
+    return time.perf_counter() - start
+
+
+async def bench_core_batch(
+    db: DatabaseManager, rows: List[Dict[str, Any]], batch_size: int
+) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(rows), batch_size):
+        await db.insert_rows(SensorReading, rows[i : i + batch_size])
+    return time.perf_counter() - start
+
+
+async def run(row_count: int, batch_size: int) -> Dict[str, float]:
+    """Run each strategy against a fresh database file and return rows/sec."""
+    results: Dict[str, float] = {}
+    rows = make_rows(row_count)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("orm_refresh", "core_single", "core_batch"):
+            config = LuxxHausConfig()
+            config.database.url = f"sqlite:///{Path(tmp) / name}.db"
+            set_config(config)
+
+            db = DatabaseManager()
+            db.create_tables()
+
+            if name == "orm_refresh":
+                elapsed = await bench_orm_refresh(db, rows)
+            elif name == "core_single":
+                elapsed = await bench_core_single(db, rows)
+            else:
+                elapsed = await bench_core_batch(db, rows, batch_size)
+
+            await db.close()
+            db.engine.dispose()
+            results[name] = row_count / elapsed
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite reading insert benchmark")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=200)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.rows, args.batch))
+    baseline = results["orm_refresh"]
+
+    print(f"{'strategy':<14}{'rows/sec':>12}{'speedup':>10}")
+    for name, rate in results.items():
+        print(f"{name:<14}{rate:>12.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+LUXX HAUS Emergency Latency Benchmark
+Measures the delay from emit_emergency_shutoff() to
+LuxxHausMonitor._handle_emergency_shutoff() during a reading storm.
+
+A set of storm tasks publish SENSOR_READING events as fast as the loop
+allows, and a slow queued "*" subscriber (standing in for the WebSocket
+broadcaster) builds up a telemetry backlog. Emergencies are emitted at a
+fixed interval; the monitor handler latency and the queued subscriber's
+latency for the same emergencies are reported.
+
+Usage:
+    python -m src.benchmarks.emergency_latency --storm 8 --emergencies 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from ..core import (
+    DeliveryMode,
+    EventType,
+    LuxxHausConfig,
+    emit_emergency_shutoff,
+    emit_sensor_reading,
+    get_event_bus,
+    set_config,
+)
+from ..core.monitor import LuxxHausMonitor
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """p50/p99/max in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "p50": statistics.median(ordered) * 1000,
+        "p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+
+async def run(storm_tasks: int, emergencies: int, interval: float) -> Dict[str, Dict[str, float]]:
+    emitted_at: Dict[str, float] = {}
+    handler_latency: List[float] = []
+    queued_latency: List[float] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = LuxxHausConfig()
+        config.database.url = f"sqlite:///{Path(tmp) / 'latency'}.db"
+        config.system.simulation_mode = True
+        set_config(config)
+
+        monitor = LuxxHausMonitor(simulation_mode=True)
+
+        # Stop at the handler boundary: record arrival instead of closing valves
+        async def record_shutoff(triggered_by: str = "manual", reason: str = "") -> Dict[str, bool]:
+            handler_latency.append(time.perf_counter() - emitted_at[reason])
+            return {}
+
+        monitor.emergency_shutoff = record_shutoff
+
+        async def slow_observer(event) -> None:
+            if event.type == EventType.EMERGENCY_SHUTOFF:
+                queued_latency.append(time.perf_counter() - emitted_at[event.data["reason"]])
+            await asyncio.sleep(0.0005)
+
+        bus = get_event_bus()
+        bus.subscribe("*", slow_observer, mode=DeliveryMode.QUEUED, queue_size=5000)
+
+        running = True
+
+        async def storm(index: int) -> None:
+            sensor_id = f"STORM-{index:02d}"
+            while running:
+                await emit_sensor_reading(sensor_id, "water_pressure", 42.0, "PSI")
+                await asyncio.sleep(0)
+
+        tasks = [asyncio.create_task(storm(i)) for i in range(storm_tasks)]
+        await asyncio.sleep(interval)
+
+        for i in range(emergencies):
+            reason = f"bench-{i}"
+            emitted_at[reason] = time.perf_counter()
+            await emit_emergency_shutoff("benchmark", reason)
+            await asyncio.sleep(interval)
+
+        backlog = bus.get_subscriber_stats()[0]["depth"]
+
+        running = False
+        await asyncio.gather(*tasks)
+        await bus.close()
+        await monitor._db.close()
+
+    results = {
+        "monitor_handler": summarize(handler_latency),
+        "queued_subscriber": summarize(queued_latency),
+    }
+    results["queued_subscriber"]["backlog"] = backlog
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Emergency shutoff latency under load")
+    parser.add_argument("--storm", type=int, default=8, help="concurrent reading publishers")
+    parser.add_argument("--emergencies", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.02, help="seconds between emergencies")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.storm, args.emergencies, args.interval))
+
+    print(f"{'path':<20}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in results.items():
+        print(f"{name:<20}{stats['p50']:>10.3f}{stats['p99']:>10.3f}{stats['max']:>10.3f}")
+    print(f"telemetry backlog at end: {results['queued_subscriber']['backlog']:.0f} events")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+LUXX HAUS Sample Allocation Benchmark
+Measures the per-sample cost of the monitor hot path objects: one Reading
+plus one SENSOR_READING Event published to a bus that keeps history.
+
+    dataclass   the previous @dataclass Reading/Event (uuid4 + utcnow per event)
+    slotted     the current slotted Reading/Event (lazy id and timestamp)
+
+Reports retained bytes per sample once the bus history is full, and
+samples/sec with tracing off.
+
+Usage:
+    python -m src.benchmarks.sample_alloc --samples 20000 --history 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from uuid import uuid4
+
+from ..core import AlertSeverity, Event, EventBus, EventType, SensorType
+from ..sensors import Reading
+
+
+@dataclass
+class DataclassReading:
+    """Reading as it was defined before slotting."""
+
+    sensor_id: str
+    sensor_type: SensorType
+    value: float
+    unit: str
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    is_alert: bool = False
+    severity: Optional[AlertSeverity] = None
+
+
+@dataclass
+class DataclassEvent:
+    """Event as it was defined before slotting."""
+
+    type: EventType
+    data: Dict[str, Any]
+    source: str
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    event_id: str = field(default_factory=lambda: str(uuid4()))
+
+
+STRATEGIES: Dict[str, tuple] = {
+    "dataclass": (DataclassReading, DataclassEvent),
+    "slotted": (Reading, Event),
+}
+
+
+async def run_samples(bus: EventBus, count: int, reading_cls: Callable, event_cls: Callable) -> None:
+    """Build and publish ``count`` samples the way BaseSensor.take_reading does."""
+    for i in range(count):
+        value = 40.0 + (i % 10)
+        reading = reading_cls(
+            sensor_id="BENCH-001",
+            sensor_type=SensorType.WATER_PRESSURE,
+            value=value,
+            unit="PSI",
+        )
+        await bus.publish(
+            event_cls(
+                type=EventType.SENSOR_READING,
+                data={
+                    "sensor_id": reading.sensor_id,
+                    "sensor_type": reading.sensor_type.value,
+                    "value": reading.value,
+                    "unit": reading.unit,
+                    "is_alert": reading.is_alert,
+                },
+                source=reading.sensor_id,
+            )
+        )
+
+
+async def measure(name: str, samples: int, history: int) -> Dict[str, float]:
+    """Return retained bytes/sample and samples/sec for one strategy."""
+    reading_cls, event_cls = STRATEGIES[name]
+
+    # Memory: fill the history, then measure what the retained events cost
+    bus = EventBus(max_history=history)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    await run_samples(bus, history, reading_cls, event_cls)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Throughput, untraced
+    bus = EventBus(max_history=history)
+    start = time.perf_counter()
+    await run_samples(bus, samples, reading_cls, event_cls)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "bytes_per_sample": (after - before) / history,
+        "samples_per_sec": samples / elapsed,
+    }
+
+
+async def run(samples: int, history: int) -> Dict[str, Dict[str, float]]:
+    return {name: await measure(name, samples, history) for name in STRATEGIES}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-sample allocation benchmark")
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--history", type=int, default=1000)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.samples, args.history))
+
+    print(f"{'strategy':<12}{'bytes/sample':>14}{'samples/sec':>14}")
+    for name, stats in results.items():
+        print(f"{name:<12}{stats['bytes_per_sample']:>14.0f}{stats['samples_per_sec']:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -117,7 +117,7 @@ class BaseValveController(ABC):
             self.last_triggered_by = triggered_by
             
             # Log to database
-            await self._db.log_valve_action(
+            await self._db.record_valve_action(
                 valve_id=self.valve_id,
                 valve_type=self.valve_type,
                 action="open",
@@ -142,7 +142,7 @@ class BaseValveController(ABC):
             
         except Exception as e:
             logger.error(f"Failed to open {self.valve_id}: {e}")
-            await self._db.log_valve_action(
+            await self._db.record_valve_action(
                 valve_id=self.valve_id,
                 valve_type=self.valve_type,
                 action="open",
@@ -185,7 +185,7 @@ class BaseValveController(ABC):
             self.last_triggered_by = triggered_by
             
             # Log to database
-            await self._db.log_valve_action(
+            await self._db.record_valve_action(
                 valve_id=self.valve_id,
                 valve_type=self.valve_type,
                 action="close",
@@ -210,7 +210,7 @@ class BaseValveController(ABC):
             
         except Exception as e:
             logger.error(f"Failed to close {self.valve_id}: {e}")
-            await self._db.log_valve_action(
+            await self._db.record_valve_action(
                 valve_id=self.valve_id,
                 valve_type=self.valve_type,
                 action="close",
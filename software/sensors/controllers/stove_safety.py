@@ -248,7 +248,7 @@ class StoveSafetyController:
         )
 
         # Log to database
-        await self._db.log_alert(
+        await self._db.record_alert(
             sensor_id=self.controller_id,
             sensor_type=SensorType.STOVE_HEAT,
             value=seconds_unattended,
@@ -309,7 +309,7 @@ class StoveSafetyController:
         )
 
         # Log to database
-        await self._db.log_alert(
+        await self._db.record_alert(
             sensor_id=self.controller_id,
             sensor_type=SensorType.STOVE_HEAT,
             value=seconds_unattended,
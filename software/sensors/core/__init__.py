@@ -16,6 +16,9 @@ from .database import (
     Alert,
     Base,
     DatabaseManager,
+    ReadingRollup,
+    ReadingWriteBuffer,
+    RetentionManager,
     SensorReading,
     SystemEvent,
     ValveAction,
@@ -23,17 +26,38 @@ from .database import (
     init_db,
 )
 from .events import (
+    DeliveryMode,
     Event,
     EventBus,
+    EventPriority,
     EventType,
+    OverflowPolicy,
+    SubscriberQueue,
     emit_alert,
+    emit_alert_escalated,
+    emit_alert_renotified,
+    emit_alert_resolved,
     emit_emergency_shutoff,
     emit_sensor_reading,
     emit_valve_action,
     get_event_bus,
     on_event,
+    sensor_reading_event,
 )
-from .monitor import LuxxHausMonitor, create_default_monitor, run_demo
+from .fusion import FusionEngine, FusionRule
+from .journal import EventJournal, restore_database
+from .hardware_io import IOExecutor, LoopLagMonitor, get_io_executor
+from .transport import (
+    EventTransport,
+    HubAlreadyRunning,
+    UnixSocketBridge,
+    UnixSocketHub,
+    create_transport,
+    decode_event,
+    encode_event,
+    start_transport,
+)
+from .monitor import LuxxHausMonitor, SamplingScheduler, create_default_monitor, run_demo
 
 __all__ = [
     # Config
@@ -51,20 +75,51 @@ __all__ = [
     "ValveAction",
     "SystemEvent",
     "DatabaseManager",
+    "ReadingRollup",
+    "ReadingWriteBuffer",
+    "RetentionManager",
     "get_db",
     "init_db",
     # Events
     "Event",
     "EventType",
+    "EventPriority",
     "EventBus",
+    "DeliveryMode",
+    "OverflowPolicy",
+    "SubscriberQueue",
     "get_event_bus",
     "on_event",
     "emit_sensor_reading",
+    "sensor_reading_event",
     "emit_alert",
+    "emit_alert_escalated",
+    "emit_alert_renotified",
+    "emit_alert_resolved",
     "emit_valve_action",
     "emit_emergency_shutoff",
+    # Fusion
+    "FusionEngine",
+    "FusionRule",
+    # Journal
+    "EventJournal",
+    "restore_database",
+    # Hardware I/O
+    "IOExecutor",
+    "LoopLagMonitor",
+    "get_io_executor",
+    # Transport
+    "EventTransport",
+    "UnixSocketHub",
+    "UnixSocketBridge",
+    "HubAlreadyRunning",
+    "create_transport",
+    "start_transport",
+    "encode_event",
+    "decode_event",
     # Monitor
     "LuxxHausMonitor",
+    "SamplingScheduler",
     "create_default_monitor",
     "run_demo",
 ]
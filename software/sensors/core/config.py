@@ -106,6 +106,107 @@ class StoveSafetyConfig(BaseModel):
     gas_valve_gpio_pin: int = 27
 
 
+class ADCConfig(BaseModel):
+    """Shared MCP3008 analog-to-digital converter."""
+
+    chip_select: str = "D5"  # board pin name
+    vref: float = Field(default=3.3, gt=0, le=5.5)
+    sweep_max_age_ms: int = Field(default=50, ge=0, le=1000)  # reuse a sweep within one tick
+
+
+class CalibrationConfig(BaseModel):
+    """MQ gas sensor calibration tables."""
+
+    persist: bool = True
+    directory: str = "calibration"  # one JSON file per sensor
+    # Compensate gas sensors for temperature/humidity sensors in their zone
+    ambient_compensation: bool = False
+    # Recompile compensated tables only when ambient moves this far
+    temperature_step_c: float = Field(default=1.0, gt=0, le=20)
+    humidity_step: float = Field(default=5.0, gt=0, le=50)
+
+
+class AdaptiveSamplingConfig(BaseModel):
+    """Sample-rate adaptation for one sensor type."""
+
+    enabled: bool = True
+    min_interval_seconds: Optional[float] = Field(default=None, gt=0)  # None = sensor's sample interval
+    max_interval_seconds: float = Field(default=10.0, gt=0, le=3600)
+    near_band: float = Field(default=0.25, ge=0, le=10)  # relative distance to threshold that counts as near
+    change_band: float = Field(default=0.05, ge=0, le=10)  # step (fraction of threshold) that counts as fast
+    settle_samples: int = Field(default=3, ge=1, le=1000)  # calm readings before slowing one step
+
+
+def _default_adaptive_sampling() -> Dict[str, AdaptiveSamplingConfig]:
+    # Water pressure, gas and smoke stay at their fixed rate: backing off
+    # would delay catching a sudden leak or fire
+    return {
+        SensorType.TEMPERATURE.value: AdaptiveSamplingConfig(max_interval_seconds=80.0),
+        SensorType.HUMIDITY.value: AdaptiveSamplingConfig(max_interval_seconds=120.0),
+        SensorType.STOVE_HEAT.value: AdaptiveSamplingConfig(max_interval_seconds=8.0),
+    }
+
+
+class EarlyWarningConfig(BaseModel):
+    """Streaming trend detector that warns before a sensor's threshold is crossed."""
+
+    enabled: bool = True
+    detector: str = "rate"  # rate, ewma or cusum
+    direction: str = "rising"  # rising, falling or both
+    # rate: units per minute; ewma: standard deviations; cusum: decision interval
+    limit: float = Field(default=4.0, gt=0)
+    smoothing: float = Field(default=0.2, gt=0, le=1)  # weight of the newest sample
+    drift: float = Field(default=0.5, ge=0)  # cusum slack, standard deviations
+    min_std: float = Field(default=0.0, ge=0)  # ewma/cusum noise floor, sensor units
+    warmup_samples: int = Field(default=10, ge=0, le=10000)
+    confirm_samples: int = Field(default=3, ge=1, le=1000)  # consecutive samples before warning
+
+    @field_validator("detector")
+    @classmethod
+    def validate_detector(cls, v: str) -> str:
+        v = v.lower()
+        if v not in {"rate", "ewma", "cusum"}:
+            raise ValueError(f"Invalid detector: {v}")
+        return v
+
+    @field_validator("direction")
+    @classmethod
+    def validate_direction(cls, v: str) -> str:
+        v = v.lower()
+        if v not in {"rising", "falling", "both"}:
+            raise ValueError(f"Invalid direction: {v}")
+        return v
+
+
+def _default_early_warning() -> Dict[str, EarlyWarningConfig]:
+    return {
+        # Pressure bleeding off faster than demand explains
+        SensorType.WATER_PRESSURE.value: EarlyWarningConfig(direction="falling", limit=6.0),
+        # Concentration ramping up toward the warning level
+        SensorType.GAS_LEAK.value: EarlyWarningConfig(direction="rising", limit=15.0),
+    }
+
+
+class AlertPolicyConfig(BaseModel):
+    """Debounce, hysteresis and re-notify policy for a sensor's alerts."""
+
+    enabled: bool = True
+    enter_samples: int = Field(default=1, ge=1, le=1000)  # alerting readings in a row to open (critical opens at once)
+    exit_samples: int = Field(default=3, ge=1, le=1000)  # clear readings in a row to resolve
+    exit_band: float = Field(default=0.05, ge=0, le=10)  # relative distance past the threshold that counts as clear
+    min_dwell_seconds: float = Field(default=30.0, ge=0, le=86400)  # shortest incident
+    renotify_seconds: float = Field(default=900.0, ge=0, le=86400)  # 0 = only on open and escalation
+    escalate_on_severity: bool = True  # escalate when a reading is worse than the incident so far
+    escalate_after_seconds: float = Field(default=0.0, ge=0, le=86400)  # step up an incident that persists this long; 0 = off
+
+
+def _default_alert_policies() -> Dict[str, AlertPolicyConfig]:
+    return {
+        # Opening a fixture dips line pressure for a sample or two
+        SensorType.WATER_PRESSURE.value: AlertPolicyConfig(enter_samples=2),
+    }
+
+
 class SensorsConfig(BaseModel):
     """Combined sensor configuration."""
 
@@ -114,6 +215,22 @@ class SensorsConfig(BaseModel):
     smoke: SmokeSensorConfig = SmokeSensorConfig()
     temperature: TemperatureSensorConfig = TemperatureSensorConfig()
     stove_safety: StoveSafetyConfig = StoveSafetyConfig()
+    adc: ADCConfig = ADCConfig()
+    calibration: CalibrationConfig = CalibrationConfig()
+    batch_min_sensors: int = Field(default=8, ge=1)  # ADC sensors in a round before NumPy evaluation pays off
+    # Keyed by sensor type; types not listed sample at a fixed rate
+    adaptive_sampling: Dict[str, AdaptiveSamplingConfig] = Field(
+        default_factory=_default_adaptive_sampling
+    )
+    # Keyed by sensor type; types not listed only alert on thresholds
+    early_warning: Dict[str, EarlyWarningConfig] = Field(
+        default_factory=_default_early_warning
+    )
+    alert_policy: AlertPolicyConfig = AlertPolicyConfig()
+    # Keyed by sensor type; types not listed use alert_policy
+    alert_policies: Dict[str, AlertPolicyConfig] = Field(
+        default_factory=_default_alert_policies
+    )
 
 
 # =============================================================================
@@ -211,6 +328,51 @@ class EmergencyContact(BaseModel):
 # =============================================================================
 
 
+class SQLiteTuningConfig(BaseModel):
+    """SQLite connection pragmas, applied to every new connection."""
+
+    enabled: bool = True
+    auto_vacuum: str = "INCREMENTAL"  # only takes effect before tables are created
+    journal_mode: str = "WAL"  # WAL lets API readers run alongside sensor writers
+    synchronous: str = "NORMAL"  # fsync at checkpoints instead of every commit
+    mmap_size: int = Field(default=64 * 1024 * 1024, ge=0)  # bytes
+    cache_size: int = -16000  # negative = KiB, positive = pages
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = Field(default=5000, ge=0)
+
+    @field_validator("auto_vacuum")
+    @classmethod
+    def validate_auto_vacuum(cls, v: str) -> str:
+        v = v.upper()
+        if v not in {"NONE", "FULL", "INCREMENTAL"}:
+            raise ValueError(f"Invalid auto_vacuum mode: {v}")
+        return v
+
+    @field_validator("journal_mode")
+    @classmethod
+    def validate_journal_mode(cls, v: str) -> str:
+        v = v.upper()
+        if v not in {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}:
+            raise ValueError(f"Invalid journal_mode: {v}")
+        return v
+
+    @field_validator("synchronous")
+    @classmethod
+    def validate_synchronous(cls, v: str) -> str:
+        v = v.upper()
+        if v not in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+            raise ValueError(f"Invalid synchronous mode: {v}")
+        return v
+
+    @field_validator("temp_store")
+    @classmethod
+    def validate_temp_store(cls, v: str) -> str:
+        v = v.upper()
+        if v not in {"DEFAULT", "FILE", "MEMORY"}:
+            raise ValueError(f"Invalid temp_store: {v}")
+        return v
+
+
 class DatabaseConfig(BaseModel):
     """Database configuration."""
 
@@ -219,6 +381,97 @@ class DatabaseConfig(BaseModel):
     pool_size: int = 5
     max_overflow: int = 10
 
+    # Write-behind buffer for sensor readings
+    write_batch_size: int = Field(default=200, ge=1, le=10000)
+    write_flush_interval_ms: int = Field(default=500, ge=10, le=60000)
+    write_queue_max: int = Field(default=10000, ge=1, le=1000000)
+
+    # Retention (0 = keep readings forever)
+    retention_days: int = Field(default=30, ge=0, le=3650)
+    prune_interval_minutes: float = Field(default=60.0, ge=1, le=10080)
+    prune_chunk_size: int = Field(default=5000, ge=100, le=1000000)
+    incremental_vacuum_pages: int = Field(default=2000, ge=0)
+    full_vacuum_interval_hours: float = Field(default=0.0, ge=0)  # 0 = never
+    rollup_retention_days: int = Field(default=365, ge=0, le=3650)  # 0 = keep forever
+
+    # SQLite performance profile (ignored for other backends)
+    sqlite: SQLiteTuningConfig = SQLiteTuningConfig()
+
+
+# =============================================================================
+# EVENT JOURNAL CONFIGURATION
+# =============================================================================
+
+
+class EventJournalConfig(BaseModel):
+    """Durable on-disk log of event bus traffic."""
+
+    enabled: bool = False
+    directory: str = "events"
+    segment_max_mb: float = Field(default=16.0, gt=0, le=1024)
+    max_segments: int = Field(default=64, ge=0)  # 0 = keep every segment
+    fsync_interval_ms: int = Field(default=200, ge=1, le=60000)
+    fsync_batch: int = Field(default=256, ge=1, le=100000)
+
+
+# =============================================================================
+# EVENT TRANSPORT CONFIGURATION
+# =============================================================================
+
+
+class EventTransportConfig(BaseModel):
+    """Cross-process event bus bridge over a Unix domain socket."""
+
+    enabled: bool = False
+    role: str = "auto"  # hub (owns the socket), client, or auto (hub unless one is running)
+    socket_path: str = "/tmp/luxx_haus_events.sock"
+    subscribe: List[str] = ["*"]  # patterns this process receives
+    publish: List[str] = ["*"]  # patterns this process sends out
+    max_buffer_kb: int = Field(default=1024, ge=16)  # per-peer unsent bytes before dropping
+    reconnect_interval: float = Field(default=1.0, gt=0)
+
+    @field_validator("role")
+    @classmethod
+    def validate_role(cls, v: str) -> str:
+        v = v.lower()
+        if v not in ("hub", "client", "auto"):
+            raise ValueError(f"Invalid transport role: {v}")
+        return v
+
+
+# =============================================================================
+# SENSOR FUSION CONFIGURATION
+# =============================================================================
+
+
+class FusionConfig(BaseModel):
+    """Cross-sensor correlation into composite alerts, per zone."""
+
+    enabled: bool = True
+    window_seconds: float = Field(default=120.0, gt=0, le=3600)
+    max_samples: int = Field(default=64, ge=2, le=10000)  # per signal per zone
+    max_zones: int = Field(default=1024, ge=1)  # least recently updated zones are dropped
+    min_confidence: float = Field(default=0.6, gt=0, le=1)  # emit a composite alert
+    clear_confidence: float = Field(default=0.4, ge=0, le=1)  # incident over below this
+    renotify_step: float = Field(default=0.2, gt=0, le=1)  # re-emit when confidence climbs this much
+    alert_samples: int = Field(default=2, ge=1)  # alerting samples that count as full evidence
+    temperature_rise_f: float = Field(default=15.0, gt=0)  # rise over the window that counts as full evidence
+    pressure_drop_psi: float = Field(default=10.0, gt=0)  # drop over the window that counts as full evidence
+
+
+# =============================================================================
+# HARDWARE I/O CONFIGURATION
+# =============================================================================
+
+
+class HardwareIOConfig(BaseModel):
+    """Blocking hardware reads and event loop stall monitoring."""
+
+    offload_reads: bool = True  # run blocking sensor reads on per-bus worker threads
+    read_timeout_seconds: float = Field(default=2.0, ge=0)  # 0 = wait forever
+    loop_lag_interval_ms: int = Field(default=100, ge=10, le=10000)
+    loop_lag_warn_ms: int = Field(default=50, ge=1)
+
 
 # =============================================================================
 # API CONFIGURATION
@@ -233,6 +486,9 @@ class APIConfig(BaseModel):
     debug: bool = False
     cors_origins: List[str] = ["*"]
     api_key: Optional[str] = None
+    # False: this worker does not run sensors; it only relays events from
+    # the hub (transport.socket_path) to WebSocket clients
+    drive_sensors: bool = True
 
 
 # =============================================================================
@@ -248,6 +504,7 @@ class SystemConfig(BaseModel):
     timezone: str = "America/Chicago"
     log_level: str = "INFO"
     simulation_mode: bool = False  # Set to True for testing without hardware
+    sensor_history_size: int = Field(default=1000, ge=10, le=1000000)  # points kept in memory per sensor
 
 
 # =============================================================================
@@ -264,6 +521,10 @@ class LuxxHausConfig(BaseModel):
     notifications: NotificationsConfig = NotificationsConfig()
     emergency_contacts: List[EmergencyContact] = []
     database: DatabaseConfig = DatabaseConfig()
+    journal: EventJournalConfig = EventJournalConfig()
+    transport: EventTransportConfig = EventTransportConfig()
+    io: HardwareIOConfig = HardwareIOConfig()
+    fusion: FusionConfig = FusionConfig()
     api: APIConfig = APIConfig()
 
     @classmethod
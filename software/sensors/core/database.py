@@ -6,8 +6,11 @@ SQLAlchemy models and database management.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-from typing import AsyncGenerator, List, Optional
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Sequence, Tuple, Type
+
+from loguru import logger
 
 from sqlalchemy import (
     Boolean,
@@ -16,16 +19,26 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
+    case,
     create_engine,
+    delete,
     event,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+    update,
 )
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker
 
-from .config import AlertSeverity, GasType, SensorType, get_config
+from .config import AlertSeverity, GasType, SensorType, SQLiteTuningConfig, get_config
 
 
 class Base(DeclarativeBase):
@@ -43,9 +56,13 @@ class SensorReading(Base):
     """Stores all sensor readings."""
 
     __tablename__ = "sensor_readings"
+    __table_args__ = (
+        # Per-sensor history: WHERE sensor_id = ? ORDER BY timestamp / range scans
+        Index("ix_sensor_readings_sensor_ts", "sensor_id", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    sensor_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    sensor_id: Mapped[str] = mapped_column(String(50), nullable=False)
     sensor_type: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
     value: Mapped[float] = mapped_column(Float, nullable=False)
     unit: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -59,10 +76,40 @@ class SensorReading(Base):
         return f"<SensorReading {self.sensor_id}: {self.value} {self.unit}>"
 
 
+class ReadingRollup(Base):
+    """Per-sensor aggregates of readings over fixed time buckets."""
+
+    __tablename__ = "reading_rollups"
+    __table_args__ = (
+        UniqueConstraint("sensor_id", "resolution", "bucket_start", name="uq_rollup_bucket"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    sensor_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    resolution: Mapped[int] = mapped_column(Integer, nullable=False)  # bucket width in seconds
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    value_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    min_value: Mapped[float] = mapped_column(Float, nullable=False)
+    max_value: Mapped[float] = mapped_column(Float, nullable=False)
+    alert_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    @property
+    def avg_value(self) -> float:
+        return self.value_sum / self.sample_count if self.sample_count else 0.0
+
+    def __repr__(self) -> str:
+        return f"<ReadingRollup {self.sensor_id} {self.resolution}s @ {self.bucket_start}>"
+
+
 class Alert(Base):
     """Stores triggered alerts."""
 
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Unacknowledged alert feed, newest first
+        Index("ix_alerts_ack_ts", "acknowledged", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     sensor_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
@@ -76,6 +123,9 @@ class Alert(Base):
     acknowledged_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     resolved: Mapped[bool] = mapped_column(Boolean, default=False)
     resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    notified_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=True
+    )
     timestamp: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False, index=True
     )
@@ -189,6 +239,485 @@ class Valve(Base):
         return f"<Valve {self.valve_id}: {'OPEN' if self.is_open else 'CLOSED'}>"
 
 
+# =============================================================================
+# SQLITE TUNING
+# =============================================================================
+
+
+def sqlite_pragmas(tuning: SQLiteTuningConfig) -> List[str]:
+    """Build the PRAGMA statements for a SQLite tuning profile."""
+    return [
+        f"PRAGMA auto_vacuum={tuning.auto_vacuum}",
+        f"PRAGMA journal_mode={tuning.journal_mode}",
+        f"PRAGMA synchronous={tuning.synchronous}",
+        f"PRAGMA mmap_size={int(tuning.mmap_size)}",
+        f"PRAGMA cache_size={int(tuning.cache_size)}",
+        f"PRAGMA temp_store={tuning.temp_store}",
+        f"PRAGMA busy_timeout={int(tuning.busy_timeout_ms)}",
+    ]
+
+
+def apply_sqlite_tuning(engine, tuning: SQLiteTuningConfig) -> None:
+    """
+    Register a connect listener that applies the tuning pragmas.
+
+    Works for both the sync engine and an async engine's ``sync_engine``,
+    since aiosqlite's adapted connection exposes the same cursor API.
+    """
+    pragmas = sqlite_pragmas(tuning)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+# =============================================================================
+# WRITE-BEHIND BUFFER
+# =============================================================================
+
+
+class ReadingWriteBuffer:
+    """
+    Write-behind ingestion queue for sensor readings.
+
+    Readings are queued in memory and written as one bulk INSERT per
+    ``batch_size`` rows or per ``flush_interval_ms``, whichever comes first.
+    The queue is bounded by ``max_pending``; producers wait for the flusher
+    to make room once it is full (backpressure).
+    """
+
+    def __init__(
+        self,
+        db: "DatabaseManager",
+        batch_size: int = 200,
+        flush_interval_ms: int = 500,
+        max_pending: int = 10000,
+    ):
+        self._db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max(max_pending, batch_size)
+
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+
+        # Statistics
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.flush_count = 0
+        self.backpressure_waits = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of readings waiting to be written."""
+        return len(self._pending)
+
+    def _ensure_started(self) -> None:
+        """Start the background flusher on first use."""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+            self._space = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+        if self._task is None or self._task.done():
+            self._closed = False
+            self._task = asyncio.create_task(self._run(), name="reading_write_buffer")
+
+    async def put(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a reading row for writing.
+
+        Returns immediately unless the queue is full, in which case it
+        waits until the flusher has drained a batch.
+        """
+        self._ensure_started()
+
+        while len(self._pending) >= self.max_pending:
+            self.backpressure_waits += 1
+            self._space.clear()
+            self._wakeup.set()
+            await self._space.wait()
+
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Background loop flushing on size or time triggers."""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Reading write buffer flush failed: {e}")
+
+    async def flush(self) -> int:
+        """
+        Write all queued readings.
+
+        Returns:
+            Number of rows written
+        """
+        if self._flush_lock is None:
+            return 0
+
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                count = min(self.batch_size, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(count)]
+                self._space.set()
+
+                try:
+                    await self._write(batch)
+                except Exception as e:
+                    # Drop the batch rather than stall every sensor behind it
+                    self.rows_dropped += len(batch)
+                    logger.error(f"Dropped {len(batch)} readings after write failure: {e}")
+                    continue
+
+                written += len(batch)
+
+        return written
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch of rows in a single transaction."""
+        await self._db.write_readings(batch)
+
+        self.rows_written += len(batch)
+        self.flush_count += 1
+
+    async def close(self) -> None:
+        """Stop the flusher and write everything still queued."""
+        self._closed = True
+
+        # Let the flusher finish its current batch instead of cancelling
+        # it mid-write, which would lose the rows it already dequeued
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        await self.flush()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get buffer statistics."""
+        return {
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "batch_size": self.batch_size,
+            "flush_interval_ms": int(self.flush_interval * 1000),
+            "rows_written": self.rows_written,
+            "rows_dropped": self.rows_dropped,
+            "flush_count": self.flush_count,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+
+# =============================================================================
+# ROLLUPS
+# =============================================================================
+
+# Rollup bucket widths in seconds, finest first
+ROLLUP_RESOLUTIONS: Tuple[int, ...] = (60, 900, 3600)
+ROLLUP_LABELS = {0: "raw", 60: "1m", 900: "15m", 3600: "1h"}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_naive_utc(timestamp: datetime) -> datetime:
+    """Convert an aware timestamp to the naive UTC the tables store; naive ones pass through."""
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def bucket_start(timestamp: datetime, resolution: int) -> datetime:
+    """Floor a naive UTC timestamp to the start of its bucket."""
+    seconds = int((timestamp - _EPOCH).total_seconds())
+    return _EPOCH + timedelta(seconds=seconds - seconds % resolution)
+
+
+def aggregate_rollups(
+    rows: Sequence[Dict[str, Any]],
+    resolutions: Sequence[int] = ROLLUP_RESOLUTIONS,
+) -> List[Dict[str, Any]]:
+    """
+    Fold a batch of reading rows into per-bucket partial aggregates.
+
+    The result is merged into reading_rollups with an upsert, so a batch
+    costs one row per touched (sensor, resolution, bucket).
+    """
+    buckets: Dict[Tuple[str, int, datetime], Dict[str, Any]] = {}
+
+    for row in rows:
+        value = row["value"]
+        alert = 1 if row.get("is_alert") else 0
+        ts = row.get("timestamp") or datetime.utcnow()
+
+        for resolution in resolutions:
+            key = (row["sensor_id"], resolution, bucket_start(ts, resolution))
+            agg = buckets.get(key)
+            if agg is None:
+                buckets[key] = {
+                    "sensor_id": key[0],
+                    "resolution": resolution,
+                    "bucket_start": key[2],
+                    "sample_count": 1,
+                    "value_sum": value,
+                    "min_value": value,
+                    "max_value": value,
+                    "alert_count": alert,
+                }
+            else:
+                agg["sample_count"] += 1
+                agg["value_sum"] += value
+                if value < agg["min_value"]:
+                    agg["min_value"] = value
+                if value > agg["max_value"]:
+                    agg["max_value"] = value
+                agg["alert_count"] += alert
+
+    return list(buckets.values())
+
+
+def rollup_upsert(dialect_name: str):
+    """
+    Build the INSERT ... ON CONFLICT merge statement for rollup rows.
+
+    Returns None for backends without ON CONFLICT support.
+    """
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        logger.warning(f"Reading rollups are not supported on {dialect_name}")
+        return None
+
+    table = ReadingRollup.__table__
+    stmt = dialect_insert(table)
+    new = stmt.excluded
+
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.sensor_id, table.c.resolution, table.c.bucket_start],
+        set_={
+            "sample_count": table.c.sample_count + new.sample_count,
+            "value_sum": table.c.value_sum + new.value_sum,
+            "min_value": case(
+                (new.min_value < table.c.min_value, new.min_value),
+                else_=table.c.min_value,
+            ),
+            "max_value": case(
+                (new.max_value > table.c.max_value, new.max_value),
+                else_=table.c.max_value,
+            ),
+            "alert_count": table.c.alert_count + new.alert_count,
+        },
+    )
+
+
+# =============================================================================
+# RETENTION
+# =============================================================================
+
+
+class RetentionManager:
+    """
+    Rolling retention for sensor readings.
+
+    Rows older than ``retention_days`` are deleted oldest-first in bounded
+    chunks located through the timestamp index, so each pass costs roughly
+    the number of rows expired rather than the size of the table. Freed
+    pages are handed back with incremental vacuum; a full VACUUM can also
+    be scheduled.
+    """
+
+    def __init__(
+        self,
+        db: "DatabaseManager",
+        retention_days: int = 30,
+        prune_interval_minutes: float = 60.0,
+        chunk_size: int = 5000,
+        incremental_vacuum_pages: int = 2000,
+        full_vacuum_interval_hours: float = 0.0,
+        rollup_retention_days: int = 365,
+    ):
+        self._db = db
+        self.retention_days = retention_days
+        self.rollup_retention_days = rollup_retention_days
+        self.prune_interval = prune_interval_minutes * 60
+        self.chunk_size = chunk_size
+        self.incremental_vacuum_pages = incremental_vacuum_pages
+        self.full_vacuum_interval = full_vacuum_interval_hours * 3600
+
+        self._task: Optional[asyncio.Task] = None
+        self._last_full_vacuum: Optional[datetime] = None
+
+        # Statistics
+        self.rows_pruned = 0
+        self.last_prune_at: Optional[datetime] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.retention_days > 0
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self._db.db_url.startswith("sqlite")
+
+    def cutoff(self, now: Optional[datetime] = None) -> datetime:
+        """Oldest timestamp that is still retained."""
+        return (now or datetime.utcnow()) - timedelta(days=self.retention_days)
+
+    async def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Delete expired readings.
+
+        Each chunk commits in its own short transaction and yields to the
+        event loop, so writers are never locked out for the whole pass.
+
+        Returns:
+            Number of rows deleted
+        """
+        if not self.enabled:
+            return 0
+
+        now = now or datetime.utcnow()
+        cutoff = self.cutoff(now)
+        total = await self._prune_table(SensorReading, SensorReading.timestamp, cutoff)
+
+        if self.rollup_retention_days:
+            rollup_cutoff = now - timedelta(days=self.rollup_retention_days)
+            await self._prune_table(ReadingRollup, ReadingRollup.bucket_start, rollup_cutoff)
+
+        self.rows_pruned += total
+        self.last_prune_at = datetime.utcnow()
+        if total:
+            logger.info(f"Retention pruned {total} readings older than {cutoff.isoformat()}")
+        return total
+
+    async def _prune_table(self, model: Type[Base], column, cutoff: datetime) -> int:
+        """Delete rows with ``column < cutoff`` in index-ordered chunks."""
+        expired = (
+            select(model.id).where(column < cutoff).order_by(column).limit(self.chunk_size)
+        )
+        stmt = delete(model).where(model.id.in_(expired))
+
+        total = 0
+        while True:
+            async with self._db.async_engine.begin() as conn:
+                result = await conn.execute(stmt)
+            total += result.rowcount
+            if result.rowcount < self.chunk_size:
+                break
+            await asyncio.sleep(0)
+        return total
+
+    async def vacuum(self, full: bool = False) -> None:
+        """
+        Return free pages to the filesystem.
+
+        Runs ``PRAGMA incremental_vacuum`` when the database was created
+        with auto_vacuum=INCREMENTAL, or a full VACUUM when requested.
+        """
+        if not self.is_sqlite:
+            return
+
+        async with self._db.async_engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+            if full:
+                await conn.execute(text("VACUUM"))
+                self._last_full_vacuum = datetime.utcnow()
+                logger.info("Full VACUUM completed")
+                return
+
+            mode = (await conn.execute(text("PRAGMA auto_vacuum"))).scalar()
+            if mode != 2 or not self.incremental_vacuum_pages:
+                return
+            # The pragma frees one page per step; drain the cursor to finish
+            result = await conn.execute(
+                text(f"PRAGMA incremental_vacuum({int(self.incremental_vacuum_pages)})")
+            )
+            if result.returns_rows:
+                result.fetchall()
+
+    def _full_vacuum_due(self) -> bool:
+        if not self.full_vacuum_interval:
+            return False
+        if self._last_full_vacuum is None:
+            self._last_full_vacuum = datetime.utcnow()
+            return False
+        elapsed = (datetime.utcnow() - self._last_full_vacuum).total_seconds()
+        return elapsed >= self.full_vacuum_interval
+
+    async def run_once(self) -> int:
+        """Prune, then vacuum whatever the prune freed."""
+        deleted = await self.prune()
+        if self._full_vacuum_due():
+            await self.vacuum(full=True)
+        elif deleted:
+            await self.vacuum()
+        return deleted
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Retention pass failed: {e}")
+            await asyncio.sleep(self.prune_interval)
+
+    def start(self) -> None:
+        """Start periodic pruning in the background."""
+        if not self.enabled or (self._task and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._run(), name="reading_retention")
+        logger.info(
+            f"Retention started: keeping {self.retention_days} days, "
+            f"pruning every {self.prune_interval / 60:.0f} min"
+        )
+
+    async def stop(self) -> None:
+        """Stop periodic pruning."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get retention statistics."""
+        return {
+            "enabled": self.enabled,
+            "retention_days": self.retention_days,
+            "rows_pruned": self.rows_pruned,
+            "last_prune_at": self.last_prune_at.isoformat() if self.last_prune_at else None,
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
 # =============================================================================
 # DATABASE MANAGER
 # =============================================================================
@@ -217,9 +746,45 @@ class DatabaseManager:
             bind=self.async_engine, class_=AsyncSession, expire_on_commit=False
         )
 
+        # Upsert used to keep reading_rollups current as readings arrive
+        self._rollup_upsert = rollup_upsert(self.async_engine.dialect.name)
+
+        # Rolling retention for sensor readings
+        self.retention = RetentionManager(
+            self,
+            retention_days=config.database.retention_days,
+            prune_interval_minutes=config.database.prune_interval_minutes,
+            chunk_size=config.database.prune_chunk_size,
+            incremental_vacuum_pages=config.database.incremental_vacuum_pages,
+            full_vacuum_interval_hours=config.database.full_vacuum_interval_hours,
+            rollup_retention_days=config.database.rollup_retention_days,
+        )
+
+        # SQLite pragmas (WAL, synchronous, mmap, ...) on both engines
+        tuning = config.database.sqlite
+        if self.db_url.startswith("sqlite") and tuning.enabled:
+            apply_sqlite_tuning(self.engine, tuning)
+            apply_sqlite_tuning(self.async_engine.sync_engine, tuning)
+
+        # Write-behind buffer for high-volume sensor readings
+        self.reading_buffer = ReadingWriteBuffer(
+            self,
+            batch_size=config.database.write_batch_size,
+            flush_interval_ms=config.database.write_flush_interval_ms,
+            max_pending=config.database.write_queue_max,
+        )
+
     def create_tables(self) -> None:
         """Create all database tables."""
         Base.metadata.create_all(self.engine)
+        self.ensure_indexes()
+
+    def ensure_indexes(self) -> None:
+        """Create indexes added after a table was first created."""
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
 
     async def async_create_tables(self) -> None:
         """Create all database tables asynchronously."""
@@ -239,10 +804,176 @@ class DatabaseManager:
         async with self.AsyncSessionLocal() as session:
             yield session
 
+    # =========================================================================
+    # CORE INSERT OPERATIONS
+    # =========================================================================
+
+    async def insert_rows(
+        self,
+        model: Type[Base],
+        rows: List[Dict[str, Any]],
+        return_ids: bool = False,
+    ) -> Optional[List[int]]:
+        """
+        Insert rows with a Core-level executemany.
+
+        Skips ORM object construction and the post-commit refresh that the
+        log_* methods pay for. Column defaults (e.g. timestamp) are applied
+        by the table definition.
+
+        Args:
+            model: Mapped model class whose table receives the rows
+            rows: Column/value dictionaries, one per row
+            return_ids: Return the new primary keys (uses INSERT ... RETURNING)
+
+        Returns:
+            List of primary keys if return_ids is True, otherwise None
+        """
+        if not rows:
+            return [] if return_ids else None
+
+        stmt = insert(model)
+        async with self.async_engine.begin() as conn:
+            if return_ids:
+                result = await conn.execute(stmt.returning(model.id), rows)
+                return list(result.scalars().all())
+            await conn.execute(stmt, rows)
+        return None
+
+    async def insert_row(
+        self,
+        model: Type[Base],
+        values: Dict[str, Any],
+        return_id: bool = False,
+    ) -> Optional[int]:
+        """Insert a single row. Returns its primary key only if requested."""
+        ids = await self.insert_rows(model, [values], return_ids=return_id)
+        return ids[0] if ids else None
+
+    async def record_alert(
+        self,
+        sensor_id: str,
+        sensor_type: SensorType | str,
+        value: float,
+        threshold: float,
+        severity: AlertSeverity,
+        message: str,
+        return_id: bool = False,
+    ) -> Optional[int]:
+        """Insert an alert row without building an ORM object."""
+        return await self.insert_row(
+            Alert,
+            {
+                "sensor_id": sensor_id,
+                "sensor_type": getattr(sensor_type, "value", sensor_type),
+                "value": value,
+                "threshold": threshold,
+                "severity": severity.value,
+                "message": message,
+            },
+            return_id=return_id,
+        )
+
+    async def update_open_alert(
+        self,
+        sensor_id: str,
+        value: float,
+        severity: AlertSeverity,
+        message: str,
+    ) -> int:
+        """
+        Re-notify a sensor's open incident in place: store its current
+        severity, value and message and stamp it notified now. Returns the
+        number of rows updated.
+        """
+        stmt = (
+            update(Alert)
+            .where(Alert.sensor_id == sensor_id, Alert.resolved == False)
+            .values(
+                value=value,
+                severity=severity.value,
+                message=message,
+                notified_at=datetime.utcnow(),
+            )
+        )
+        async with self.async_engine.begin() as conn:
+            result = await conn.execute(stmt)
+        return result.rowcount
+
+    async def resolve_alerts(self, sensor_id: str) -> int:
+        """Mark a sensor's unresolved alerts resolved. Returns the number updated."""
+        stmt = (
+            update(Alert)
+            .where(Alert.sensor_id == sensor_id, Alert.resolved == False)
+            .values(resolved=True, resolved_at=datetime.utcnow())
+        )
+        async with self.async_engine.begin() as conn:
+            result = await conn.execute(stmt)
+        return result.rowcount
+
+    async def record_valve_action(
+        self,
+        valve_id: str,
+        valve_type: str,
+        action: str,
+        triggered_by: str,
+        success: bool = True,
+        error_message: Optional[str] = None,
+        return_id: bool = False,
+    ) -> Optional[int]:
+        """Insert a valve action row without building an ORM object."""
+        return await self.insert_row(
+            ValveAction,
+            {
+                "valve_id": valve_id,
+                "valve_type": valve_type,
+                "action": action,
+                "triggered_by": triggered_by,
+                "success": success,
+                "error_message": error_message,
+            },
+            return_id=return_id,
+        )
+
+    async def record_event(
+        self,
+        event_type: str,
+        source: str,
+        message: str,
+        details: Optional[str] = None,
+        return_id: bool = False,
+    ) -> Optional[int]:
+        """Insert a system event row without building an ORM object."""
+        return await self.insert_row(
+            SystemEvent,
+            {
+                "event_type": event_type,
+                "source": source,
+                "message": message,
+                "details": details,
+            },
+            return_id=return_id,
+        )
+
     # =========================================================================
     # SENSOR READING OPERATIONS
     # =========================================================================
 
+    async def write_readings(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert reading rows and merge them into the rollup tables.
+
+        Both happen in one transaction, so rollups never drift from the
+        raw readings they summarize.
+        """
+        if not rows:
+            return
+
+        async with self.async_engine.begin() as conn:
+            await conn.execute(insert(SensorReading), rows)
+            if self._rollup_upsert is not None:
+                await conn.execute(self._rollup_upsert, aggregate_rollups(rows))
+
     async def log_reading(
         self,
         sensor_id: str,
@@ -263,26 +994,229 @@ class DatabaseManager:
                 severity=severity.value if severity else None,
             )
             session.add(reading)
+            await session.flush()
+            if self._rollup_upsert is not None:
+                await session.execute(
+                    self._rollup_upsert,
+                    aggregate_rollups([
+                        {
+                            "sensor_id": sensor_id,
+                            "value": value,
+                            "is_alert": is_alert,
+                            "timestamp": reading.timestamp,
+                        }
+                    ]),
+                )
             await session.commit()
             await session.refresh(reading)
             return reading
 
+    async def queue_reading(
+        self,
+        sensor_id: str,
+        sensor_type: SensorType,
+        value: float,
+        unit: str,
+        is_alert: bool = False,
+        severity: Optional[AlertSeverity] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """
+        Queue a sensor reading for a batched write.
+
+        Unlike log_reading(), this does not wait for the database. The
+        reading is timestamped now and written by the write-behind buffer.
+        """
+        await self.reading_buffer.put(
+            {
+                "sensor_id": sensor_id,
+                "sensor_type": sensor_type.value,
+                "value": value,
+                "unit": unit,
+                "is_alert": is_alert,
+                "severity": severity.value if severity else None,
+                "timestamp": timestamp or datetime.utcnow(),
+            }
+        )
+
+    async def flush_readings(self) -> int:
+        """Write all queued readings immediately."""
+        return await self.reading_buffer.flush()
+
+    async def close(self) -> None:
+        """Flush queued writes and release engine connections."""
+        await self.retention.stop()
+        await self.reading_buffer.close()
+        await self.async_engine.dispose()
+
     async def get_recent_readings(
         self,
         sensor_id: str,
         limit: int = 100,
     ) -> List[SensorReading]:
         """Get recent readings for a sensor."""
+        return await self.get_readings_page(sensor_id, limit=limit)
+
+    async def get_readings_page(
+        self,
+        sensor_id: str,
+        limit: int = 100,
+        before_ts: Optional[datetime] = None,
+        after_ts: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[SensorReading]:
+        """
+        Get a page of readings using keyset pagination.
+
+        Pages are seeks on the (sensor_id, timestamp) index, so deep pages
+        cost the same as the first one (no OFFSET scan). The cursor is the
+        (timestamp, id) of the last row seen: batched writes often share a
+        timestamp, and a timestamp-only cursor would skip the rest of a tie
+        at a page boundary.
+
+        Args:
+            sensor_id: Sensor to read
+            limit: Page size
+            before_ts: Return readings older than this cursor
+            after_ts: Return readings newer than this cursor
+            before_id: Row id paired with before_ts (None = whole timestamp)
+            after_id: Row id paired with after_ts (None = whole timestamp)
+
+        Returns:
+            Readings ordered newest first
+        """
+        if before_ts is not None:
+            before_ts = to_naive_utc(before_ts)
+        if after_ts is not None:
+            after_ts = to_naive_utc(after_ts)
+        key = tuple_(SensorReading.timestamp, SensorReading.id)
+        query = select(SensorReading).where(SensorReading.sensor_id == sensor_id)
+
+        if before_ts is not None:
+            if before_id is None:
+                query = query.where(SensorReading.timestamp < before_ts)
+            else:
+                query = query.where(key < tuple_(before_ts, before_id))
+
+        if after_ts is not None:
+            if after_id is None:
+                query = query.where(SensorReading.timestamp > after_ts)
+            else:
+                query = query.where(key > tuple_(after_ts, after_id))
+
+        forward = after_ts is not None and before_ts is None
+        if forward:
+            # Walk forward from the cursor, then flip to newest-first
+            query = query.order_by(SensorReading.timestamp.asc(), SensorReading.id.asc())
+        else:
+            query = query.order_by(SensorReading.timestamp.desc(), SensorReading.id.desc())
+        query = query.limit(limit)
+
         async with self.AsyncSessionLocal() as session:
-            from sqlalchemy import select
+            result = await session.execute(query)
+            readings = list(result.scalars().all())
 
-            result = await session.execute(
-                select(SensorReading)
-                .where(SensorReading.sensor_id == sensor_id)
-                .order_by(SensorReading.timestamp.desc())
-                .limit(limit)
+        if forward:
+            readings.reverse()
+        return readings
+
+    async def get_reading_series(
+        self,
+        sensor_id: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+        max_points: int = 500,
+    ) -> Dict[str, Any]:
+        """
+        Get readings for a time range within a point budget.
+
+        Aware ``start``/``end`` are converted to naive UTC first. Returns raw
+        readings when the range holds no more than max_points of them;
+        otherwise the finest rollup resolution whose bucket count fits the
+        budget (falling back to the coarsest rollup).
+
+        Returns:
+            {"resolution": "raw" | "1m" | "15m" | "1h", "points": [...]}
+        """
+        start = to_naive_utc(start)
+        end = to_naive_utc(end) if end is not None else datetime.utcnow()
+        resolution = await self._pick_resolution(sensor_id, start, end, max_points)
+
+        async with self.AsyncSessionLocal() as session:
+            if resolution == 0:
+                result = await session.execute(
+                    select(SensorReading)
+                    .where(
+                        SensorReading.sensor_id == sensor_id,
+                        SensorReading.timestamp >= start,
+                        SensorReading.timestamp < end,
+                    )
+                    .order_by(SensorReading.timestamp)
+                )
+                points = [
+                    {
+                        "timestamp": r.timestamp.isoformat(),
+                        "value": r.value,
+                        "is_alert": r.is_alert,
+                        "severity": r.severity,
+                    }
+                    for r in result.scalars()
+                ]
+            else:
+                result = await session.execute(
+                    select(ReadingRollup)
+                    .where(
+                        ReadingRollup.sensor_id == sensor_id,
+                        ReadingRollup.resolution == resolution,
+                        ReadingRollup.bucket_start >= bucket_start(start, resolution),
+                        ReadingRollup.bucket_start < end,
+                    )
+                    .order_by(ReadingRollup.bucket_start)
+                )
+                points = [
+                    {
+                        "timestamp": r.bucket_start.isoformat(),
+                        "min": r.min_value,
+                        "max": r.max_value,
+                        "avg": r.avg_value,
+                        "count": r.sample_count,
+                        "alert_count": r.alert_count,
+                    }
+                    for r in result.scalars()
+                ]
+
+        return {"resolution": ROLLUP_LABELS[resolution], "points": points}
+
+    async def _pick_resolution(
+        self,
+        sensor_id: str,
+        start: datetime,
+        end: datetime,
+        max_points: int,
+    ) -> int:
+        """Choose a resolution in seconds (0 = raw) for a range and budget."""
+        # Count raw rows, but stop looking once the budget is exceeded
+        probe = (
+            select(SensorReading.id)
+            .where(
+                SensorReading.sensor_id == sensor_id,
+                SensorReading.timestamp >= start,
+                SensorReading.timestamp < end,
             )
-            return list(result.scalars().all())
+            .limit(max_points + 1)
+            .subquery()
+        )
+        async with self.async_engine.connect() as conn:
+            raw_count = (await conn.execute(select(func.count()).select_from(probe))).scalar()
+        if raw_count <= max_points:
+            return 0
+
+        span = (end - start).total_seconds()
+        for resolution in ROLLUP_RESOLUTIONS:
+            if span / resolution <= max_points:
+                return resolution
+        return ROLLUP_RESOLUTIONS[-1]
 
     # =========================================================================
     # ALERT OPERATIONS
@@ -315,8 +1249,6 @@ class DatabaseManager:
     async def get_unacknowledged_alerts(self) -> List[Alert]:
         """Get all unacknowledged alerts."""
         async with self.AsyncSessionLocal() as session:
-            from sqlalchemy import select
-
             result = await session.execute(
                 select(Alert)
                 .where(Alert.acknowledged == False)
@@ -331,8 +1263,6 @@ class DatabaseManager:
     ) -> Optional[Alert]:
         """Acknowledge an alert."""
         async with self.AsyncSessionLocal() as session:
-            from sqlalchemy import select
-
             result = await session.execute(select(Alert).where(Alert.id == alert_id))
             alert = result.scalar_one_or_none()
 
@@ -7,14 +7,33 @@ from __future__ import annotations
 
 import asyncio
 import json
-from dataclasses import dataclass, field
+import time
+from collections import deque
 from datetime import datetime
-from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from enum import Enum, IntEnum
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 from uuid import uuid4
 
 from loguru import logger
 
+from .config import get_config
+
+if TYPE_CHECKING:
+    from .journal import EventJournal
+
 
 class EventType(str, Enum):
     """Event types for the LUXX HAUS system."""
@@ -36,6 +55,8 @@ class EventType(str, Enum):
     ALERT_ACKNOWLEDGED = "alert.acknowledged"
     ALERT_RESOLVED = "alert.resolved"
     ALERT_ESCALATED = "alert.escalated"
+    ALERT_RENOTIFIED = "alert.renotified"  # reminder for a still-open incident
+    ALERT_COMPOSITE = "alert.composite"  # multi-sensor fusion alert
 
     # Notification events
     NOTIFICATION_SENT = "notification.sent"
@@ -52,25 +73,124 @@ class EventType(str, Enum):
     WEBSOCKET_CONNECTED = "websocket.connected"
     WEBSOCKET_DISCONNECTED = "websocket.disconnected"
 
+    @property
+    def priority(self) -> "EventPriority":
+        """Delivery priority; lower values are drained first."""
+        return _EVENT_PRIORITIES.get(self, EventPriority.NORMAL)
+
+
+class EventPriority(IntEnum):
+    """Priority lanes for queued delivery, most urgent first."""
+
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    TELEMETRY = 3
+
+
+_EVENT_PRIORITIES: Dict[EventType, EventPriority] = {
+    EventType.EMERGENCY_SHUTOFF: EventPriority.CRITICAL,
+    EventType.SENSOR_ALERT: EventPriority.HIGH,
+    EventType.ALERT_TRIGGERED: EventPriority.HIGH,
+    EventType.ALERT_ESCALATED: EventPriority.HIGH,
+    EventType.ALERT_RENOTIFIED: EventPriority.HIGH,
+    EventType.ALERT_COMPOSITE: EventPriority.HIGH,
+    EventType.VALVE_CLOSED: EventPriority.HIGH,
+    EventType.VALVE_ERROR: EventPriority.HIGH,
+    EventType.SYSTEM_ERROR: EventPriority.HIGH,
+    EventType.SENSOR_READING: EventPriority.TELEMETRY,
+}
+
+
+_EPOCH = datetime(1970, 1, 1)
+
 
-@dataclass
 class Event:
-    """Represents an event in the system."""
+    """
+    Represents an event in the system.
+
+    Slotted, since one is created for every sensor sample and the bus keeps
+    a history of them. The event id and the datetime are only built when
+    first read, and the ISO timestamp is formatted once and cached.
+    """
+
+    __slots__ = ("type", "data", "source", "_created", "_timestamp", "_event_id", "_iso")
+
+    def __init__(
+        self,
+        type: EventType,
+        data: Dict[str, Any],
+        source: str,
+        timestamp: Optional[datetime] = None,
+        event_id: Optional[str] = None,
+    ):
+        self.type = type
+        self.data = data
+        self.source = source
+        self._created = time.time() if timestamp is None else 0.0
+        self._timestamp = timestamp
+        self._event_id = event_id
+        self._iso: Optional[str] = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time (naive UTC)."""
+        if self._timestamp is None:
+            self._timestamp = datetime.utcfromtimestamp(self._created)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+        self._iso = None
+
+    @property
+    def epoch(self) -> float:
+        """Creation time as epoch seconds, without building a datetime."""
+        if self._timestamp is None:
+            return self._created
+        return (self._timestamp - _EPOCH).total_seconds()
+
+    @property
+    def event_id(self) -> str:
+        """Unique event id, generated on first access."""
+        if self._event_id is None:
+            self._event_id = str(uuid4())
+        return self._event_id
+
+    @event_id.setter
+    def event_id(self, value: str) -> None:
+        self._event_id = value
+
+    def __repr__(self) -> str:
+        return (
+            f"Event(type={self.type!r}, data={self.data!r}, source={self.source!r}, "
+            f"timestamp={self.timestamp!r}, event_id={self.event_id!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return (
+            self.type == other.type
+            and self.data == other.data
+            and self.source == other.source
+            and self.timestamp == other.timestamp
+            and self.event_id == other.event_id
+        )
 
-    type: EventType
-    data: Dict[str, Any]
-    source: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    event_id: str = field(default_factory=lambda: str(uuid4()))
+    __hash__ = None  # mutable
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary."""
+        if self._iso is None:
+            self._iso = self.timestamp.isoformat()
         return {
             "event_id": self.event_id,
             "type": self.type.value,
             "data": self.data,
             "source": self.source,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._iso,
         }
 
     def to_json(self) -> str:
@@ -81,7 +201,7 @@ class Event:
     def from_dict(cls, data: Dict[str, Any]) -> "Event":
         """Create event from dictionary."""
         return cls(
-            event_id=data.get("event_id", str(uuid4())),
+            event_id=data.get("event_id"),
             type=EventType(data["type"]),
             data=data["data"],
             source=data["source"],
@@ -89,11 +209,249 @@ class Event:
         )
 
 
+def matches_pattern(event_key: str, pattern: str) -> bool:
+    """Check if an event key matches a subscription pattern (e.g. "sensor.*")."""
+    if pattern == "*":
+        return True
+
+    pattern_parts = pattern.split(".")
+    key_parts = event_key.split(".")
+
+    for i, part in enumerate(pattern_parts):
+        if part == "*":
+            return True
+        if i >= len(key_parts) or part != key_parts[i]:
+            return False
+
+    return len(pattern_parts) == len(key_parts)
+
+
 # Type alias for event handlers
 EventHandler = Callable[[Event], Any]
 AsyncEventHandler = Callable[[Event], Any]
 
 
+# =============================================================================
+# QUEUED DELIVERY
+# =============================================================================
+
+
+class DeliveryMode(str, Enum):
+    """How a subscriber receives events."""
+
+    INLINE = "inline"  # Called during publish; the publisher awaits it
+    QUEUED = "queued"  # Own bounded queue and worker task; publish only enqueues
+
+
+class OverflowPolicy(str, Enum):
+    """What a queued subscriber does when its queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"  # Publisher waits for space
+
+
+class BatchSubscriber:
+    """
+    Inline subscriber that takes a list of events per call.
+
+    ``publish`` hands it a one-element list; ``publish_many`` hands it every
+    matching event of the batch in a single call.
+    """
+
+    def __init__(self, handler: Callable[[List[Event]], Any]):
+        self.handler = handler
+
+    def __call__(self, event: Event) -> Any:
+        return self.handler([event])
+
+
+class SubscriberQueue:
+    """
+    Bounded, prioritized queue and worker task for one queued subscription.
+
+    The bus registers this object in place of the handler. Calling it
+    enqueues the event and returns immediately, except under the BLOCK
+    policy with a full queue, where it returns a coroutine that the
+    publisher awaits until the worker frees a slot.
+
+    Each EventPriority has its own lane and the worker always drains the
+    most urgent non-empty lane first, so a backlog of readings never delays
+    an emergency event. ``maxsize`` bounds all lanes together. When the
+    queue is full, the drop policies make room in the least urgent lane
+    that is no more urgent than the new event (oldest or newest entry,
+    respectively), and drop the new event only if everything queued is
+    more urgent than it; readings never evict an emergency.
+
+    With ``batch`` set, the handler takes a list: the worker hands it
+    everything queued (up to ``max_batch``) in one call.
+    """
+
+    def __init__(
+        self,
+        handler: AsyncEventHandler,
+        name: str,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        batch: bool = False,
+        max_batch: int = 100,
+    ):
+        if maxsize < 1:
+            raise ValueError("Subscriber queue size must be at least 1")
+
+        self.handler = handler
+        self.name = name
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.batch = batch
+        self.max_batch = max_batch
+
+        self._lanes: List[Deque[Tuple[float, Event]]] = [deque() for _ in EventPriority]
+        self._depth = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Metrics
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.max_lag_by_priority: List[float] = [0.0 for _ in EventPriority]
+
+    def __call__(self, event: Event) -> Optional[Awaitable[None]]:
+        if self._depth >= self.maxsize:
+            if self.overflow == OverflowPolicy.BLOCK:
+                return self._put_blocking(event)
+            self.dropped += 1
+            victim = self._victim_lane(event.type.priority)
+            if victim is None:
+                return None  # everything queued is more urgent
+            if self.overflow == OverflowPolicy.DROP_OLDEST:
+                victim.popleft()
+            elif victim is self._lanes[event.type.priority]:
+                return None  # the new event is the newest in its lane
+            else:
+                victim.pop()
+            self._depth -= 1
+        self._enqueue(event)
+        return None
+
+    def _victim_lane(self, priority: EventPriority) -> Optional[Deque[Tuple[float, Event]]]:
+        """Least urgent non-empty lane at or below ``priority``'s urgency."""
+        for lane in reversed(self._lanes[priority:]):
+            if lane:
+                return lane
+        return None
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def _enqueue(self, event: Event) -> None:
+        self._lanes[event.type.priority].append((time.monotonic(), event))
+        self._depth += 1
+        self.enqueued += 1
+        self._ensure_worker()
+        self._wakeup.set()
+
+    async def _put_blocking(self, event: Event) -> None:
+        while self._depth >= self.maxsize:
+            self._space.clear()
+            await self._space.wait()
+        self._enqueue(event)
+
+    def _ensure_worker(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = self._wakeup or asyncio.Event()
+            self._space = self._space or asyncio.Event()
+            self._closed = False
+            self._task = asyncio.create_task(self._run())
+
+    def _pop(self) -> Tuple[float, Event]:
+        """Take the oldest event from the most urgent non-empty lane."""
+        for lane in self._lanes:
+            if lane:
+                self._depth -= 1
+                return lane.popleft()
+        raise IndexError("pop from empty subscriber queue")
+
+    async def _run(self) -> None:
+        """Deliver queued events one at a time, most urgent lane first."""
+        while True:
+            while not self._depth:
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            take = min(self._depth, self.max_batch) if self.batch else 1
+            now = time.monotonic()
+            events: List[Event] = []
+            for _ in range(take):
+                enqueued_at, event = self._pop()
+                self._track_lag(now - enqueued_at, event.type.priority)
+                events.append(event)
+            self._space.set()
+
+            try:
+                result = self.handler(events if self.batch else events[0])
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error in queued event handler {self.name}: {e}")
+            self.delivered += take
+
+    def _track_lag(self, lag: float, priority: EventPriority) -> None:
+        self.last_lag = lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if lag > self.max_lag_by_priority[priority]:
+            self.max_lag_by_priority[priority] = lag
+
+    def stop(self) -> None:
+        """Let the worker drain what is queued, then exit."""
+        self._closed = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def close(self) -> None:
+        """Drain the queue and wait for the worker to exit."""
+        self.stop()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get queue depth and lag metrics."""
+        now = time.monotonic()
+        oldest_age = max((now - lane[0][0] for lane in self._lanes if lane), default=0.0)
+        return {
+            "name": self.name,
+            "depth": self._depth,
+            "depth_by_priority": {
+                priority.name.lower(): len(self._lanes[priority]) for priority in EventPriority
+            },
+            "maxsize": self.maxsize,
+            "overflow": self.overflow.value,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "oldest_age_ms": round(oldest_age * 1000, 3),
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "max_lag_ms_by_priority": {
+                priority.name.lower(): round(self.max_lag_by_priority[priority] * 1000, 3)
+                for priority in EventPriority
+            },
+        }
+
+
 class EventBus:
     """
     Async event bus for publishing and subscribing to events.
@@ -101,21 +459,39 @@ class EventBus:
     Supports:
     - Async event handlers
     - Wildcard subscriptions (e.g., "sensor.*")
+    - Queued subscribers with their own bounded queue and worker
     - Event history
     - Event filtering
+    - Optional durable journal with replay
     """
 
-    def __init__(self, max_history: int = 1000):
+    def __init__(self, max_history: int = 1000, journal: Optional["EventJournal"] = None):
+        self._journal = journal
         self._subscribers: Dict[str, Set[AsyncEventHandler]] = {}
         self._wildcard_subscribers: Dict[str, Set[AsyncEventHandler]] = {}
-        self._history: List[Event] = []
+        # Event key -> handlers (exact then wildcard), built on first publish
+        # of that key and dropped whenever subscriptions change
+        self._resolved: Dict[str, Tuple[AsyncEventHandler, ...]] = {}
+        # (event key, handler) -> queue or batch adapter registered in its place
+        self._queues: Dict[Tuple[str, AsyncEventHandler], SubscriberQueue] = {}
+        self._batch_adapters: Dict[Tuple[str, AsyncEventHandler], BatchSubscriber] = {}
         self._max_history = max_history
-        self._lock = asyncio.Lock()
+
+        # History is only touched from the event loop thread, so no lock.
+        # The per-type and per-source deques hold the same events in the
+        # same order, which makes eviction a popleft on each.
+        self._history: Deque[Event] = deque()
+        self._history_by_type: Dict[EventType, Deque[Event]] = {}
+        self._history_by_source: Dict[str, Deque[Event]] = {}
 
     def subscribe(
         self,
         event_type: EventType | str,
         handler: AsyncEventHandler,
+        mode: DeliveryMode = DeliveryMode.INLINE,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        batch: bool = False,
     ) -> None:
         """
         Subscribe to an event type.
@@ -123,8 +499,27 @@ class EventBus:
         Args:
             event_type: Event type to subscribe to. Can use wildcards (e.g., "sensor.*")
             handler: Async function to call when event is published
+            mode: INLINE handlers are awaited by the publisher; QUEUED
+                handlers get their own queue and worker task
+            queue_size: Queue bound for QUEUED mode
+            overflow: What to do when a QUEUED subscriber falls behind
+            batch: Handler takes a list of events (one list per
+                publish_many call, or per queue drain when QUEUED)
         """
         event_key = event_type.value if isinstance(event_type, EventType) else event_type
+        subscription_key = (event_key, handler)
+
+        if mode == DeliveryMode.QUEUED:
+            if subscription_key not in self._queues:
+                name = f"{event_key}:{getattr(handler, '__qualname__', repr(handler))}"
+                self._queues[subscription_key] = SubscriberQueue(
+                    handler, name, queue_size, overflow, batch=batch
+                )
+            handler = self._queues[subscription_key]
+        elif batch:
+            if subscription_key not in self._batch_adapters:
+                self._batch_adapters[subscription_key] = BatchSubscriber(handler)
+            handler = self._batch_adapters[subscription_key]
 
         if "*" in event_key:
             # Wildcard subscription
@@ -139,6 +534,8 @@ class EventBus:
             self._subscribers[event_key].add(handler)
             logger.debug(f"Subscribed to event: {event_key}")
 
+        self._resolved.clear()
+
     def unsubscribe(
         self,
         event_type: EventType | str,
@@ -147,6 +544,12 @@ class EventBus:
         """Unsubscribe from an event type."""
         event_key = event_type.value if isinstance(event_type, EventType) else event_type
 
+        queue = self._queues.pop((event_key, handler), None)
+        if queue is not None:
+            queue.stop()
+            handler = queue
+        handler = self._batch_adapters.pop((event_key, handler), handler)
+
         if "*" in event_key:
             if event_key in self._wildcard_subscribers:
                 self._wildcard_subscribers[event_key].discard(handler)
@@ -154,6 +557,8 @@ class EventBus:
             if event_key in self._subscribers:
                 self._subscribers[event_key].discard(handler)
 
+        self._resolved.clear()
+
     async def publish(self, event: Event) -> None:
         """
         Publish an event to all subscribers.
@@ -161,23 +566,13 @@ class EventBus:
         Args:
             event: Event to publish
         """
-        async with self._lock:
-            # Store in history
-            self._history.append(event)
-            if len(self._history) > self._max_history:
-                self._history = self._history[-self._max_history :]
+        self._record(event)
+        self._journal_event(event)
 
         event_key = event.type.value
-        handlers: List[AsyncEventHandler] = []
-
-        # Get exact match subscribers
-        if event_key in self._subscribers:
-            handlers.extend(self._subscribers[event_key])
-
-        # Get wildcard match subscribers
-        for pattern, pattern_handlers in self._wildcard_subscribers.items():
-            if self._matches_pattern(event_key, pattern):
-                handlers.extend(pattern_handlers)
+        handlers = self._resolved.get(event_key)
+        if handlers is None:
+            handlers = self._resolve(event_key)
 
         # Call all handlers concurrently
         if handlers:
@@ -195,21 +590,158 @@ class EventBus:
 
         logger.debug(f"Published event: {event_key} to {len(handlers)} handlers")
 
-    def _matches_pattern(self, event_key: str, pattern: str) -> bool:
-        """Check if event key matches a wildcard pattern."""
-        if pattern == "*":
-            return True
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """
+        Publish a batch of events, e.g. one sampling round.
+
+        Handlers are resolved once per event type, batch subscribers get
+        one list with every event they match, and all coroutines from the
+        batch are awaited in a single gather.
+
+        Args:
+            events: Events to publish, in order
+        """
+        if not events:
+            return
+
+        # Handler -> the events it should see, in publish order
+        deliveries: Dict[AsyncEventHandler, List[Event]] = {}
+        for event in events:
+            self._record(event)
+            self._journal_event(event)
+
+            event_key = event.type.value
+            handlers = self._resolved.get(event_key)
+            if handlers is None:
+                handlers = self._resolve(event_key)
+            for handler in handlers:
+                deliveries.setdefault(handler, []).append(event)
+
+        tasks = []
+        for handler, batch in deliveries.items():
+            if isinstance(handler, BatchSubscriber):
+                calls = [(handler.handler, batch)]
+            else:
+                calls = [(handler, event) for event in batch]
+            for func, arg in calls:
+                try:
+                    result = func(arg)
+                    if asyncio.iscoroutine(result):
+                        tasks.append(asyncio.create_task(result))
+                except Exception as e:
+                    logger.error(f"Error in event handler: {e}")
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.debug(f"Published {len(events)} events to {len(deliveries)} handlers")
+
+    def _journal_event(self, event: Event) -> None:
+        if self._journal is None:
+            return
+        try:
+            self._journal.append(event)
+        except OSError as e:
+            logger.error(f"Failed to journal event {event.type.value}: {e}")
+
+    def get_subscriber_stats(self) -> List[Dict[str, Any]]:
+        """Get depth and lag metrics for every queued subscriber."""
+        return [queue.get_status() for queue in self._queues.values()]
+
+    async def close(self) -> None:
+        """Drain every queued subscriber and stop its worker, then sync the journal."""
+        for queue in list(self._queues.values()):
+            await queue.close()
+        if self._journal is not None:
+            await self._journal.close()
+
+    @property
+    def journal(self) -> Optional["EventJournal"]:
+        return self._journal
+
+    def restore_history(self, since: Optional[datetime] = None) -> int:
+        """
+        Rebuild in-memory history from the journal, e.g. after a restart.
+
+        Returns:
+            Number of events loaded (only the newest max_history are kept)
+        """
+        if self._journal is None:
+            return 0
+        count = 0
+        for event in self._journal.replay(since=since):
+            self._record(event)
+            count += 1
+        return count
+
+    async def replay_to(
+        self,
+        handler: AsyncEventHandler,
+        since: Optional[datetime] = None,
+        event_types: Optional[List[EventType]] = None,
+    ) -> int:
+        """
+        Feed journaled events to a single handler, oldest first.
 
-        pattern_parts = pattern.split(".")
-        key_parts = event_key.split(".")
+        Lets a new subscriber catch up before it subscribes for live events.
 
-        for i, part in enumerate(pattern_parts):
-            if part == "*":
-                return True
-            if i >= len(key_parts) or part != key_parts[i]:
-                return False
+        Returns:
+            Number of events delivered
+        """
+        if self._journal is None:
+            return 0
+        count = 0
+        for event in self._journal.replay(since=since, event_types=event_types):
+            try:
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error replaying event to handler: {e}")
+            count += 1
+        return count
+
+    def _resolve(self, event_key: str) -> Tuple[AsyncEventHandler, ...]:
+        """Collect the handlers for an event key and cache them."""
+        handlers: List[AsyncEventHandler] = []
+
+        # Get exact match subscribers
+        if event_key in self._subscribers:
+            handlers.extend(self._subscribers[event_key])
+
+        # Get wildcard match subscribers
+        for pattern, pattern_handlers in self._wildcard_subscribers.items():
+            if self._matches_pattern(event_key, pattern):
+                handlers.extend(pattern_handlers)
 
-        return len(pattern_parts) == len(key_parts)
+        resolved = tuple(handlers)
+        self._resolved[event_key] = resolved
+        return resolved
+
+    def _record(self, event: Event) -> None:
+        """Append an event to history and its indexes, evicting the oldest."""
+        if self._max_history <= 0:
+            return
+
+        if len(self._history) >= self._max_history:
+            old = self._history.popleft()
+            self._evict_from(self._history_by_type, old.type)
+            self._evict_from(self._history_by_source, old.source)
+
+        self._history.append(event)
+        self._history_by_type.setdefault(event.type, deque()).append(event)
+        self._history_by_source.setdefault(event.source, deque()).append(event)
+
+    @staticmethod
+    def _evict_from(index: Dict[Any, Deque[Event]], key: Any) -> None:
+        bucket = index[key]
+        bucket.popleft()
+        if not bucket:
+            del index[key]
+
+    def _matches_pattern(self, event_key: str, pattern: str) -> bool:
+        """Check if event key matches a wildcard pattern."""
+        return matches_pattern(event_key, pattern)
 
     async def emit(
         self,
@@ -249,19 +781,35 @@ class EventBus:
         Returns:
             List of matching events
         """
-        events = self._history
-
-        if event_type:
-            events = [e for e in events if e.type == event_type]
-
-        if source:
-            events = [e for e in events if e.source == source]
+        if limit <= 0:
+            return []
+
+        if event_type and source:
+            by_type = self._history_by_type.get(event_type)
+            by_source = self._history_by_source.get(source)
+            if not by_type or not by_source:
+                return []
+            # Walk the smaller index newest-first, checking the other field
+            if len(by_type) <= len(by_source):
+                candidates, matches = by_type, (lambda e: e.source == source)
+            else:
+                candidates, matches = by_source, (lambda e: e.type == event_type)
+            newest = list(islice((e for e in reversed(candidates) if matches(e)), limit))
+        elif event_type:
+            newest = list(islice(reversed(self._history_by_type.get(event_type, ())), limit))
+        elif source:
+            newest = list(islice(reversed(self._history_by_source.get(source, ())), limit))
+        else:
+            newest = list(islice(reversed(self._history), limit))
 
-        return events[-limit:]
+        newest.reverse()
+        return newest
 
     def clear_history(self) -> None:
         """Clear event history."""
         self._history.clear()
+        self._history_by_type.clear()
+        self._history_by_source.clear()
 
 
 # Singleton event bus instance
@@ -272,7 +820,13 @@ def get_event_bus() -> EventBus:
     """Get the global event bus instance."""
     global _event_bus
     if _event_bus is None:
-        _event_bus = EventBus()
+        journal_config = get_config().journal
+        journal = None
+        if journal_config.enabled:
+            from .journal import EventJournal
+
+            journal = EventJournal.from_config(journal_config)
+        _event_bus = EventBus(journal=journal)
     return _event_bus
 
 
@@ -303,17 +857,17 @@ def on_event(event_type: EventType | str):
 # =============================================================================
 
 
-async def emit_sensor_reading(
+def sensor_reading_event(
     sensor_id: str,
     sensor_type: str,
     value: float,
     unit: str,
     is_alert: bool = False,
 ) -> Event:
-    """Emit a sensor reading event."""
-    return await get_event_bus().emit(
-        EventType.SENSOR_READING,
-        {
+    """Build a sensor reading event without publishing it."""
+    return Event(
+        type=EventType.SENSOR_READING,
+        data={
             "sensor_id": sensor_id,
             "sensor_type": sensor_type,
             "value": value,
@@ -324,6 +878,19 @@ async def emit_sensor_reading(
     )
 
 
+async def emit_sensor_reading(
+    sensor_id: str,
+    sensor_type: str,
+    value: float,
+    unit: str,
+    is_alert: bool = False,
+) -> Event:
+    """Emit a sensor reading event."""
+    event = sensor_reading_event(sensor_id, sensor_type, value, unit, is_alert)
+    await get_event_bus().publish(event)
+    return event
+
+
 async def emit_alert(
     sensor_id: str,
     sensor_type: str,
@@ -347,6 +914,75 @@ async def emit_alert(
     )
 
 
+async def emit_alert_escalated(
+    sensor_id: str,
+    sensor_type: str,
+    value: float,
+    threshold: float,
+    severity: str,
+    previous_severity: str,
+    message: str,
+) -> Event:
+    """Emit an alert escalated event."""
+    return await get_event_bus().emit(
+        EventType.ALERT_ESCALATED,
+        {
+            "sensor_id": sensor_id,
+            "sensor_type": sensor_type,
+            "value": value,
+            "threshold": threshold,
+            "severity": severity,
+            "previous_severity": previous_severity,
+            "message": message,
+        },
+        source=sensor_id,
+    )
+
+
+async def emit_alert_renotified(
+    sensor_id: str,
+    sensor_type: str,
+    value: float,
+    threshold: float,
+    severity: str,
+    message: str,
+) -> Event:
+    """Emit a reminder event for an alert that is still open."""
+    return await get_event_bus().emit(
+        EventType.ALERT_RENOTIFIED,
+        {
+            "sensor_id": sensor_id,
+            "sensor_type": sensor_type,
+            "value": value,
+            "threshold": threshold,
+            "severity": severity,
+            "message": message,
+        },
+        source=sensor_id,
+    )
+
+
+async def emit_alert_resolved(
+    sensor_id: str,
+    sensor_type: str,
+    value: float,
+    severity: str,
+    message: str,
+) -> Event:
+    """Emit an alert resolved event."""
+    return await get_event_bus().emit(
+        EventType.ALERT_RESOLVED,
+        {
+            "sensor_id": sensor_id,
+            "sensor_type": sensor_type,
+            "value": value,
+            "severity": severity,
+            "message": message,
+        },
+        source=sensor_id,
+    )
+
+
 async def emit_valve_action(
     valve_id: str,
     action: str,
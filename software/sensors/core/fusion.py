@@ -0,0 +1,405 @@
+"""
+LUXX HAUS Sensor Fusion
+Correlates readings across sensors in a zone into confidence-scored composite alerts.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from .config import AlertSeverity, FusionConfig, GasType, SensorType
+from .events import Event, EventBus, EventType, get_event_bus
+
+# Signal kinds beyond SensorType values
+CARBON_MONOXIDE = GasType.CARBON_MONOXIDE.value  # CO sensors report as gas_leak
+FIXTURE = "fixture"  # flow switches or anything else that means water is being used
+
+# Sensor kinds that explain a pressure drop by water use
+_USAGE_KINDS = (SensorType.MOTION.value, FIXTURE)
+
+
+# =============================================================================
+# WINDOWS
+# =============================================================================
+
+
+class SignalWindow:
+    """
+    Recent samples of one signal in one zone.
+
+    Bounded by both ``max_samples`` and ``window_seconds``. Min, max and
+    the number of alerting samples are maintained incrementally (min/max
+    with monotonic queues), so appends and queries are amortized O(1).
+    """
+
+    __slots__ = (
+        "window_seconds", "max_samples", "_samples", "_mins", "_maxes",
+        "_seq", "alerts", "last", "last_time",
+    )
+
+    def __init__(self, window_seconds: float, max_samples: int):
+        self.window_seconds = window_seconds
+        self.max_samples = max_samples
+        self._samples: Deque[Tuple[int, float, float, bool]] = deque()
+        self._mins: Deque[Tuple[int, float]] = deque()
+        self._maxes: Deque[Tuple[int, float]] = deque()
+        self._seq = 0
+        self.alerts = 0
+        self.last: Optional[float] = None
+        self.last_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def append(self, timestamp: float, value: float, is_alert: bool) -> None:
+        seq = self._seq
+        self._seq += 1
+        self._samples.append((seq, timestamp, value, is_alert))
+        self.alerts += is_alert
+        self.last, self.last_time = value, timestamp
+
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((seq, value))
+        while self._maxes and self._maxes[-1][1] <= value:
+            self._maxes.pop()
+        self._maxes.append((seq, value))
+
+        if len(self._samples) > self.max_samples:
+            self._evict()
+        self.expire(timestamp)
+
+    def expire(self, now: float) -> None:
+        """Drop samples older than the window."""
+        cutoff = now - self.window_seconds
+        while self._samples and self._samples[0][1] < cutoff:
+            self._evict()
+
+    def _evict(self) -> None:
+        seq, _, _, is_alert = self._samples.popleft()
+        self.alerts -= is_alert
+        if self._mins[0][0] == seq:
+            self._mins.popleft()
+        if self._maxes[0][0] == seq:
+            self._maxes.popleft()
+        if not self._samples:
+            self.last = None
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._mins[0][1] if self._mins else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._maxes[0][1] if self._maxes else None
+
+    @property
+    def active(self) -> bool:
+        """Any non-zero or alerting sample in the window (for on/off signals)."""
+        return self.alerts > 0 or (self.max is not None and self.max > 0)
+
+
+class ZoneState:
+    """Signal windows and open incidents for one zone."""
+
+    __slots__ = ("zone", "signals", "incidents")
+
+    def __init__(self, zone: str):
+        self.zone = zone
+        self.signals: Dict[str, SignalWindow] = {}
+        self.incidents: Dict[str, float] = {}  # rule -> confidence last emitted
+
+    def window(self, kind: str, now: float) -> Optional[SignalWindow]:
+        """A signal's window, expired to ``now``; None if it has no samples."""
+        window = self.signals.get(kind)
+        if window is None:
+            return None
+        window.expire(now)
+        return window if len(window) else None
+
+
+# =============================================================================
+# RULES
+# =============================================================================
+
+
+Evidence = Dict[str, float]
+
+
+class FusionRule(NamedTuple):
+    """
+    A composite alert built from several signals in one zone.
+
+    ``evidence`` returns named strengths in [0, 1] (or None when the rule's
+    primary signal is absent); confidence is their weighted sum.
+    """
+
+    name: str
+    kinds: FrozenSet[str]  # signals the rule reads; evaluated when one of them updates
+    weights: Dict[str, float]
+    evidence: Callable[[ZoneState, FusionConfig, float], Optional[Evidence]]
+    message: str  # formatted with zone and confidence
+
+
+def _clamp(value: float) -> float:
+    return min(max(value, 0.0), 1.0)
+
+
+def _alert_strength(window: Optional[SignalWindow], config: FusionConfig) -> float:
+    return _clamp(window.alerts / config.alert_samples) if window else 0.0
+
+
+def _fire_evidence(zone: ZoneState, config: FusionConfig, now: float) -> Optional[Evidence]:
+    smoke = zone.window(SensorType.SMOKE.value, now)
+    if smoke is None or not smoke.alerts:
+        return None
+    temperature = zone.window(SensorType.TEMPERATURE.value, now)
+    rise = 0.0
+    if temperature is not None:
+        rise = _clamp((temperature.last - temperature.min) / config.temperature_rise_f)
+    return {"smoke": _alert_strength(smoke, config), "heat": rise}
+
+
+def _gas_evidence(zone: ZoneState, config: FusionConfig, now: float) -> Optional[Evidence]:
+    gas = zone.window(SensorType.GAS_LEAK.value, now)
+    co = zone.window(CARBON_MONOXIDE, now)
+    if not ((gas and gas.alerts) or (co and co.alerts)):
+        return None
+    return {"gas": _alert_strength(gas, config), "carbon_monoxide": _alert_strength(co, config)}
+
+
+def _water_evidence(zone: ZoneState, config: FusionConfig, now: float) -> Optional[Evidence]:
+    # Low pressure or a falling-pressure early warning; demand alone is not enough
+    pressure = zone.window(SensorType.WATER_PRESSURE.value, now)
+    if pressure is None or not pressure.alerts:
+        return None
+    drop = _clamp((pressure.max - pressure.last) / config.pressure_drop_psi)
+
+    usage = [zone.window(kind, now) for kind in _USAGE_KINDS if kind in zone.signals]
+    if not usage:
+        idle = 0.5  # nothing in this zone can tell us whether water is in use
+    else:
+        idle = 0.0 if any(window is not None and window.active for window in usage) else 1.0
+    return {"low_pressure": _alert_strength(pressure, config), "pressure_drop": drop, "no_usage": idle}
+
+
+DEFAULT_RULES: Tuple[FusionRule, ...] = (
+    FusionRule(
+        name="fire",
+        kinds=frozenset({SensorType.SMOKE.value, SensorType.TEMPERATURE.value}),
+        weights={"smoke": 0.55, "heat": 0.45},
+        evidence=_fire_evidence,
+        message="Possible fire in {zone}: smoke with rising temperature ({confidence:.0%} confidence).",
+    ),
+    FusionRule(
+        name="combustion_gas",
+        kinds=frozenset({SensorType.GAS_LEAK.value, CARBON_MONOXIDE}),
+        weights={"gas": 0.5, "carbon_monoxide": 0.5},
+        evidence=_gas_evidence,
+        message=(
+            "Gas and carbon monoxide detected together in {zone} ({confidence:.0%} confidence). "
+            "Ventilate and evacuate."
+        ),
+    ),
+    FusionRule(
+        name="water_leak",
+        kinds=frozenset({SensorType.WATER_PRESSURE.value, *_USAGE_KINDS}),
+        weights={"low_pressure": 0.25, "pressure_drop": 0.3, "no_usage": 0.45},
+        evidence=_water_evidence,
+        message="Likely water leak in {zone}: pressure dropping with no water in use ({confidence:.0%} confidence).",
+    ),
+)
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+
+class FusionEngine:
+    """
+    Correlates sensor readings by zone and emits composite alerts.
+
+    Sensors are registered with a zone and a signal kind (their sensor
+    type, or ``carbon_monoxide``/``fixture`` where the type is ambiguous).
+    Each reading updates its zone's window for that kind and re-evaluates
+    only the rules that read it. A rule whose confidence reaches
+    ``min_confidence`` opens an incident and publishes an
+    ``ALERT_COMPOSITE`` event (sensor id ``fusion:<zone>``, sensor type =
+    rule name) with its confidence and evidence. Composite alerts are
+    derived from readings, so they are notified but not stored as alert
+    rows or restored from the journal. The incident re-alerts
+    only when confidence climbs by ``renotify_step`` and closes below
+    ``clear_confidence``.
+
+    State is bounded: every window holds at most ``max_samples`` samples
+    from the last ``window_seconds``, and at most ``max_zones`` zones are
+    tracked, the least recently updated being dropped first. Zone names
+    are free-form, so a multi-property deployment can use
+    "<property>/<room>".
+    """
+
+    def __init__(
+        self,
+        config: Optional[FusionConfig] = None,
+        event_bus: Optional[EventBus] = None,
+        rules: Sequence[FusionRule] = DEFAULT_RULES,
+    ):
+        self.config = config or FusionConfig()
+        self._event_bus = event_bus or get_event_bus()
+        self.rules = tuple(rules)
+        self._sensors: Dict[str, Tuple[str, str]] = {}  # sensor_id -> (zone, kind)
+        self._zones: "OrderedDict[str, ZoneState]" = OrderedDict()
+        self._rules_by_kind: Dict[str, List[FusionRule]] = {}
+        for rule in self.rules:
+            for kind in rule.kinds:
+                self._rules_by_kind.setdefault(kind, []).append(rule)
+
+        # Stats
+        self.readings = 0
+        self.evaluations = 0
+        self.alerts = 0
+        self.evicted_zones = 0
+
+    # =========================================================================
+    # REGISTRATION
+    # =========================================================================
+
+    def register(self, sensor_id: str, zone: str, kind: str) -> None:
+        """Correlate a sensor's readings with others in ``zone``."""
+        self._sensors[sensor_id] = (zone, kind)
+
+    def unregister(self, sensor_id: str) -> None:
+        self._sensors.pop(sensor_id, None)
+
+    def zone_of(self, sensor_id: str) -> Optional[str]:
+        """Zone a sensor is registered in, or None."""
+        registered = self._sensors.get(sensor_id)
+        return registered[0] if registered else None
+
+    def subscribe(self) -> None:
+        """Start consuming reading events from the bus."""
+        self._event_bus.subscribe(EventType.SENSOR_READING, self.handle_readings, batch=True)
+
+    def unsubscribe(self) -> None:
+        self._event_bus.unsubscribe(EventType.SENSOR_READING, self.handle_readings)
+
+    # =========================================================================
+    # PROCESSING
+    # =========================================================================
+
+    async def handle_readings(self, events: List[Event]) -> None:
+        """Bus handler: fold a batch of readings in and publish any composite alerts."""
+        alerts = []
+        for event in events:
+            alerts.extend(self.process(event))
+        if alerts:
+            await self._event_bus.publish_many(alerts)
+
+    def process(self, event: Event) -> List[Event]:
+        """Fold one reading event in; return the composite alerts it causes."""
+        data = event.data
+        registered = self._sensors.get(data.get("sensor_id"))
+        if registered is None:
+            return []
+        zone_name, kind = registered
+        self.readings += 1
+
+        now = event.epoch
+        zone = self._zone(zone_name)
+        window = zone.signals.get(kind)
+        if window is None:
+            window = SignalWindow(self.config.window_seconds, self.config.max_samples)
+            zone.signals[kind] = window
+        window.append(now, data["value"], bool(data.get("is_alert")))
+
+        alerts = []
+        for rule in self._rules_by_kind.get(kind, ()):
+            alert = self._evaluate(zone, rule, now)
+            if alert is not None:
+                alerts.append(alert)
+        return alerts
+
+    def _zone(self, name: str) -> ZoneState:
+        zone = self._zones.get(name)
+        if zone is None:
+            zone = ZoneState(name)
+            self._zones[name] = zone
+            if len(self._zones) > self.config.max_zones:
+                self._zones.popitem(last=False)
+                self.evicted_zones += 1
+        else:
+            self._zones.move_to_end(name)
+        return zone
+
+    def _evaluate(self, zone: ZoneState, rule: FusionRule, now: float) -> Optional[Event]:
+        self.evaluations += 1
+        evidence = rule.evidence(zone, self.config, now)
+        confidence = 0.0
+        if evidence is not None:
+            confidence = sum(rule.weights[name] * strength for name, strength in evidence.items())
+
+        previous = zone.incidents.get(rule.name)
+        if previous is not None and confidence < self.config.clear_confidence:
+            del zone.incidents[rule.name]
+            logger.info(f"Composite {rule.name} in {zone.zone} cleared")
+            return None
+        if confidence < self.config.min_confidence:
+            return None
+        if previous is not None and confidence < previous + self.config.renotify_step:
+            return None
+
+        zone.incidents[rule.name] = confidence
+        self.alerts += 1
+        return self._alert_event(zone, rule, confidence, evidence)
+
+    def _alert_event(
+        self, zone: ZoneState, rule: FusionRule, confidence: float, evidence: Evidence
+    ) -> Event:
+        if confidence >= 0.9:
+            severity = AlertSeverity.CRITICAL
+        elif confidence >= 0.75:
+            severity = AlertSeverity.DANGER
+        else:
+            severity = AlertSeverity.WARNING
+
+        message = rule.message.format(zone=zone.zone, confidence=confidence)
+        sensors = sorted(
+            sensor_id for sensor_id, (zone_name, kind) in self._sensors.items()
+            if zone_name == zone.zone and kind in rule.kinds
+        )
+        logger.warning(f"COMPOSITE ALERT [{zone.zone}] {rule.name}: {message}")
+        source = f"fusion:{zone.zone}"
+        return Event(
+            type=EventType.ALERT_COMPOSITE,
+            data={
+                "sensor_id": source,
+                "sensor_type": rule.name,
+                "value": round(confidence, 3),
+                "threshold": self.config.min_confidence,
+                "severity": severity.value,
+                "message": message,
+                "zone": zone.zone,
+                "confidence": round(confidence, 3),
+                "evidence": {name: round(strength, 3) for name, strength in evidence.items()},
+                "sensors": sensors,
+            },
+            source=source,
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "sensors": len(self._sensors),
+            "zones": len(self._zones),
+            "readings": self.readings,
+            "evaluations": self.evaluations,
+            "alerts": self.alerts,
+            "evicted_zones": self.evicted_zones,
+            "incidents": {
+                zone.zone: dict(zone.incidents)
+                for zone in self._zones.values() if zone.incidents
+            },
+        }
@@ -0,0 +1,204 @@
+"""
+LUXX HAUS Hardware I/O
+Runs blocking sensor reads off the event loop and measures loop stalls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+from .config import HardwareIOConfig, get_config
+
+
+class _BusStats:
+    """Call counters for one bus worker (seconds)."""
+
+    __slots__ = ("calls", "errors", "timeouts", "pending", "max_wait", "max_call", "total_call")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.pending = 0
+        self.max_wait = 0.0
+        self.max_call = 0.0
+        self.total_call = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "pending": self.pending,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "max_call_ms": round(self.max_call * 1000, 3),
+            "mean_call_ms": (
+                round(self.total_call / self.calls * 1000, 3) if self.calls else 0.0
+            ),
+        }
+
+
+class IOExecutor:
+    """
+    One worker thread per hardware bus.
+
+    SPI and I2C transactions on the same bus must not interleave, and a
+    DHT22 bit-bang read holds the CPU for milliseconds, so each bus name
+    ("spi0", "i2c1", "gpio", ...) gets its own single-thread executor:
+    reads on one bus run in order, reads on different buses overlap, and
+    none of them run on the event loop.
+
+    A read that exceeds ``timeout`` raises ``asyncio.TimeoutError`` to the
+    caller. The worker thread cannot be interrupted, so later reads on that
+    bus queue behind it; the queue wait shows up in the bus stats.
+    """
+
+    def __init__(self, timeout: Optional[float] = 2.0):
+        self.timeout = timeout
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._stats: Dict[str, _BusStats] = {}
+
+    def _executor(self, bus: str) -> ThreadPoolExecutor:
+        executor = self._executors.get(bus)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"luxx-io-{bus}")
+            self._executors[bus] = executor
+            self._stats[bus] = _BusStats()
+        return executor
+
+    async def run(self, bus: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(*args)`` on the bus worker and await its result."""
+        executor = self._executor(bus)
+        stats = self._stats[bus]
+        submitted = time.perf_counter()
+
+        def call() -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished = time.perf_counter()
+                wait = started - submitted
+                duration = finished - started
+                # Plain attribute updates; fine to race with status reads
+                stats.calls += 1
+                stats.total_call += duration
+                if wait > stats.max_wait:
+                    stats.max_wait = wait
+                if duration > stats.max_call:
+                    stats.max_call = duration
+
+        stats.pending += 1
+        try:
+            future = asyncio.get_running_loop().run_in_executor(executor, call)
+            return await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            logger.warning(f"I/O on bus {bus} exceeded {self.timeout:g}s")
+            raise
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.pending -= 1
+
+    def shutdown(self) -> None:
+        """Stop the bus workers; reads already running are left to finish."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Per-bus call counts, queue wait and call duration."""
+        return {bus: stats.to_dict() for bus, stats in self._stats.items()}
+
+
+class LoopLagMonitor:
+    """
+    Measures how long the event loop is blocked.
+
+    A probe task sleeps for ``interval`` and records how late it wakes up.
+    Any callback that holds the loop (a hardware read that was not offloaded,
+    a large JSON dump, a synchronous DB call) shows up as lag, so
+    ``max_lag_ms`` is an upper bound on how long an emergency event could
+    have waited to be handled.
+    """
+
+    def __init__(self, interval: float = 0.1, warn_threshold: float = 0.05):
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics (seconds)
+        self.probes = 0
+        self.stalls = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._lag_total = 0.0
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="loop_lag_monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(loop.time() - expected)
+
+    def record(self, lag: float) -> None:
+        lag = max(lag, 0.0)
+        self.probes += 1
+        self.last_lag = lag
+        self._lag_total += lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if lag >= self.warn_threshold:
+            self.stalls += 1
+            logger.warning(f"Event loop blocked for {lag * 1000:.1f} ms")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get event loop lag statistics."""
+        return {
+            "probes": self.probes,
+            "stalls": self.stalls,
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "mean_lag_ms": (
+                round(self._lag_total / self.probes * 1000, 3) if self.probes else 0.0
+            ),
+        }
+
+    @classmethod
+    def from_config(cls, config: HardwareIOConfig) -> "LoopLagMonitor":
+        return cls(
+            interval=config.loop_lag_interval_ms / 1000,
+            warn_threshold=config.loop_lag_warn_ms / 1000,
+        )
+
+
+# Global I/O executor instance
+_io_executor: Optional[IOExecutor] = None
+
+
+def get_io_executor() -> IOExecutor:
+    """Get the global hardware I/O executor."""
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = IOExecutor(timeout=get_config().io.read_timeout_seconds or None)
+    return _io_executor
@@ -0,0 +1,438 @@
+"""
+LUXX HAUS Event Journal
+Append-only, segmented on-disk log of event bus traffic with replay.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import mmap
+import os
+import struct
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from loguru import logger
+
+from .config import EventJournalConfig
+from .events import Event, EventType
+
+# Record header: payload length, CRC32 of payload, sequence number, epoch seconds
+_HEADER = struct.Struct("<IIQd")
+_SEGMENT_SUFFIX = ".seg"
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_epoch(value: Union[datetime, float]) -> float:
+    if isinstance(value, datetime):
+        return (value - _EPOCH).total_seconds()
+    return float(value)
+
+
+def _fsync_fd(fd: int) -> None:
+    """fsync a duplicated descriptor and close it (runs in a worker thread)."""
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class EventJournal:
+    """
+    Segmented append-only event log.
+
+    Each record is a fixed header followed by a compact JSON payload:
+
+        u32 length | u32 crc32 | u64 seq | f64 epoch seconds | payload
+
+    Segments are named after the first sequence number they hold and
+    rotate once they reach ``segment_max_bytes``. Appends go to a buffered
+    file; fsync runs in a worker thread once ``fsync_batch`` records are
+    pending or ``fsync_interval_ms`` has passed, and when a segment is
+    sealed, so publishers never wait on the disk. A torn record at the
+    tail (crash mid-write) fails its length or CRC check and is truncated
+    on open.
+
+    Replay mmaps each segment and walks the headers sequentially, decoding
+    only the payloads it returns.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        max_segments: int = 64,
+        fsync_interval_ms: int = 200,
+        fsync_batch: int = 256,
+    ):
+        self.directory = Path(directory)
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        self.fsync_interval = fsync_interval_ms / 1000
+        self.fsync_batch = fsync_batch
+
+        self._file = None
+        self._segment_size = 0
+        self._next_seq = 1
+        self._pending = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._sealing: Set[asyncio.Future] = set()
+
+        # Stats
+        self.appended = 0
+        self.fsyncs = 0
+        self.rotations = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._recover()
+
+    @classmethod
+    def from_config(cls, config: EventJournalConfig) -> "EventJournal":
+        return cls(
+            directory=config.directory,
+            segment_max_bytes=int(config.segment_max_mb * 1024 * 1024),
+            max_segments=config.max_segments,
+            fsync_interval_ms=config.fsync_interval_ms,
+            fsync_batch=config.fsync_batch,
+        )
+
+    # =========================================================================
+    # SEGMENTS
+    # =========================================================================
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.directory.glob(f"*{_SEGMENT_SUFFIX}"))
+
+    @staticmethod
+    def _scan(path: Path) -> Iterator[Tuple[int, int, float, bytes]]:
+        """
+        Yield (end_offset, seq, epoch, payload) for each intact record.
+
+        Stops at the first record whose header or CRC does not check out.
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                offset = 0
+                header_size = _HEADER.size
+                while offset + header_size <= size:
+                    length, crc, seq, epoch = _HEADER.unpack_from(mm, offset)
+                    start = offset + header_size
+                    end = start + length
+                    if end > size:
+                        return
+                    payload = mm[start:end]
+                    if zlib.crc32(payload) != crc:
+                        return
+                    offset = end
+                    yield offset, seq, epoch, payload
+
+    def _recover(self) -> None:
+        """Find the next sequence number and cut off a torn tail record."""
+        segments = self._segments()
+        if not segments:
+            return
+
+        last = segments[-1]
+        valid_end = 0
+        last_seq = int(last.stem) - 1
+        for end, seq, _, _ in self._scan(last):
+            valid_end = end
+            last_seq = seq
+
+        if valid_end < last.stat().st_size:
+            logger.warning(f"Event journal: truncating torn tail of {last.name} at byte {valid_end}")
+            with open(last, "r+b") as f:
+                f.truncate(valid_end)
+
+        self._next_seq = last_seq + 1
+
+    def _open_segment(self) -> None:
+        segments = self._segments()
+        if segments and segments[-1].stat().st_size < self.segment_max_bytes:
+            path = segments[-1]
+        else:
+            path = self.directory / f"{self._next_seq:020d}{_SEGMENT_SUFFIX}"
+        self._file = open(path, "ab")
+        self._segment_size = self._file.tell()
+
+    def _rotate(self) -> None:
+        """Seal the current segment and drop the oldest beyond max_segments."""
+        self._file.flush()
+        fd = os.dup(self._file.fileno())
+        self._file.close()
+        self._file = None
+        self._pending = 0
+        self.rotations += 1
+        self._seal(fd)
+
+        if self.max_segments:
+            segments = self._segments()
+            for path in segments[: max(0, len(segments) - self.max_segments)]:
+                path.unlink()
+                logger.debug(f"Event journal: removed segment {path.name}")
+
+    def _seal(self, fd: int) -> None:
+        """fsync a sealed segment on a worker thread, like sync()."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _fsync_fd(fd)  # No loop: no publisher is waiting on this thread
+            self.fsyncs += 1
+            return
+        future = loop.run_in_executor(None, _fsync_fd, fd)
+        self._sealing.add(future)
+        future.add_done_callback(self._sealed)
+
+    def _sealed(self, future: asyncio.Future) -> None:
+        self._sealing.discard(future)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Event journal fsync failed: {error}")
+        else:
+            self.fsyncs += 1
+
+    # =========================================================================
+    # APPEND
+    # =========================================================================
+
+    def append(self, event: Event) -> int:
+        """
+        Append an event and return its sequence number.
+
+        The record is written to the OS immediately and made durable by the
+        next batched fsync.
+        """
+        if self._file is None:
+            self._open_segment()
+
+        payload = json.dumps(
+            {
+                "id": event.event_id,
+                "type": event.type.value,
+                "source": event.source,
+                "data": event.data,
+            },
+            separators=(",", ":"),
+            default=str,
+        ).encode()
+
+        seq = self._next_seq
+        self._file.write(_HEADER.pack(len(payload), zlib.crc32(payload), seq, event.epoch))
+        self._file.write(payload)
+        self._next_seq = seq + 1
+        self._segment_size += _HEADER.size + len(payload)
+        self._pending += 1
+        self.appended += 1
+
+        if self._segment_size >= self.segment_max_bytes:
+            self._rotate()
+        else:
+            self._ensure_flusher()
+            if self._pending >= self.fsync_batch and self._wakeup is not None:
+                self._wakeup.set()
+        return seq
+
+    def _ensure_flusher(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: records are synced on rotation or close
+        self._wakeup = self._wakeup or asyncio.Event()
+        self._closed = False
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Batch fsyncs: every fsync_interval, or sooner when a batch fills."""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.fsync_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.sync()
+            except OSError as e:
+                logger.error(f"Event journal fsync failed: {e}")
+
+    async def sync(self) -> None:
+        """Flush buffered records and fsync them off the event loop."""
+        if self._file is None or not self._pending:
+            return
+        self._file.flush()
+        self._pending = 0
+        fd = os.dup(self._file.fileno())
+        await asyncio.get_running_loop().run_in_executor(None, _fsync_fd, fd)
+        self.fsyncs += 1
+
+    async def close(self) -> None:
+        """Stop the flusher, fsync what is pending and close the segment."""
+        self._closed = True
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.sync()
+        if self._sealing:
+            await asyncio.gather(*self._sealing, return_exceptions=True)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # =========================================================================
+    # REPLAY
+    # =========================================================================
+
+    def replay(
+        self,
+        since: Optional[Union[datetime, float]] = None,
+        after_seq: Optional[int] = None,
+        event_types: Optional[Iterable[EventType]] = None,
+    ) -> Iterator[Event]:
+        """
+        Yield journaled events in append order.
+
+        Args:
+            since: Only events created at or after this time (datetime or epoch)
+            after_seq: Only events with a larger sequence number
+            event_types: Only these event types
+        """
+        if self._file is not None:
+            self._file.flush()
+
+        since_epoch = _to_epoch(since) if since is not None else None
+        wanted = {t.value for t in event_types} if event_types else None
+
+        for path in self._segments():
+            for _, seq, epoch, payload in self._scan(path):
+                if after_seq is not None and seq <= after_seq:
+                    continue
+                if since_epoch is not None and epoch < since_epoch:
+                    continue
+                record = json.loads(payload)
+                if wanted is not None and record["type"] not in wanted:
+                    continue
+                yield Event(
+                    type=EventType(record["type"]),
+                    data=record["data"],
+                    source=record["source"],
+                    timestamp=datetime.utcfromtimestamp(epoch),
+                    event_id=record["id"],
+                )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get journal size and write statistics."""
+        segments = self._segments()
+        return {
+            "directory": str(self.directory),
+            "segments": len(segments),
+            "bytes": sum(path.stat().st_size for path in segments),
+            "next_seq": self._next_seq,
+            "pending_fsync": self._pending,
+            "appended": self.appended,
+            "fsyncs": self.fsyncs,
+            "rotations": self.rotations,
+        }
+
+
+# =============================================================================
+# DATABASE RECOVERY
+# =============================================================================
+
+
+async def restore_database(
+    journal: EventJournal,
+    db: Any,
+    since: Optional[Union[datetime, float]] = None,
+    batch_size: int = 1000,
+) -> Dict[str, int]:
+    """
+    Re-insert readings, alerts and valve actions from the journal.
+
+    Meant for recovering rows the database lost in a crash: pass ``since``
+    as the newest timestamp the database still has, or rows are duplicated.
+
+    Args:
+        journal: Journal to replay
+        db: DatabaseManager to write into
+        since: Only replay events from this time on
+        batch_size: Rows per insert
+
+    Returns:
+        Rows written per table
+    """
+    from .database import Alert, ValveAction
+
+    readings: List[Dict[str, Any]] = []
+    alerts: List[Dict[str, Any]] = []
+    valve_actions: List[Dict[str, Any]] = []
+    counts = {"sensor_readings": 0, "alerts": 0, "valve_actions": 0}
+
+    async def flush() -> None:
+        if readings:
+            await db.write_readings(readings)
+            counts["sensor_readings"] += len(readings)
+            readings.clear()
+        if alerts:
+            await db.insert_rows(Alert, alerts)
+            counts["alerts"] += len(alerts)
+            alerts.clear()
+        if valve_actions:
+            await db.insert_rows(ValveAction, valve_actions)
+            counts["valve_actions"] += len(valve_actions)
+            valve_actions.clear()
+
+    event_types = (
+        EventType.SENSOR_READING,
+        EventType.ALERT_TRIGGERED,
+        EventType.VALVE_OPENED,
+        EventType.VALVE_CLOSED,
+    )
+    for event in journal.replay(since=since, event_types=event_types):
+        data = event.data
+        if event.type == EventType.SENSOR_READING:
+            readings.append({
+                "sensor_id": data["sensor_id"],
+                "sensor_type": data["sensor_type"],
+                "value": data["value"],
+                "unit": data["unit"],
+                "is_alert": data.get("is_alert", False),
+                "severity": data.get("severity"),
+                "timestamp": event.timestamp,
+            })
+        elif event.type == EventType.ALERT_TRIGGERED:
+            alerts.append({
+                "sensor_id": data["sensor_id"],
+                "sensor_type": data["sensor_type"],
+                "value": data["value"],
+                "threshold": data["threshold"],
+                "severity": data["severity"],
+                "message": data.get("message"),
+                "timestamp": event.timestamp,
+            })
+        else:
+            valve_actions.append({
+                "valve_id": data["valve_id"],
+                "valve_type": data.get("valve_type", "unknown"),
+                "action": data["action"],
+                "triggered_by": data["triggered_by"],
+                "timestamp": event.timestamp,
+            })
+
+        if len(readings) + len(alerts) + len(valve_actions) >= batch_size:
+            await flush()
+
+    await flush()
+    logger.info(f"Restored from event journal: {counts}")
+    return counts
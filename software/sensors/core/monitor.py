@@ -6,23 +6,30 @@ Orchestrates all sensors, valves, and notifications.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import math
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple, Type
 
 from loguru import logger
 
 from .core import (
     AlertSeverity,
+    EventTransport,
     EventType,
+    FusionEngine,
     GasType,
+    LoopLagMonitor,
     LuxxHausConfig,
     SensorType,
     emit_emergency_shutoff,
     get_config,
     get_db,
     get_event_bus,
+    get_io_executor,
     init_db,
     load_config,
+    start_transport,
 )
 from .controllers import (
     GasSolenoidValve,
@@ -34,16 +41,289 @@ from .controllers import (
 from .notifications import NotificationManager, get_notification_manager
 from .sensors import (
     BaseSensor,
+    BatchEvaluator,
     CarbonMonoxideSensor,
     GasLeakSensor,
+    HumiditySensor,
     MotionSensor,
     SmokeSensor,
     StoveHeatSensor,
     TemperatureSensor,
     WaterPressureSensor,
+    get_adc_status,
 )
 
 
+# =============================================================================
+# SAMPLING SCHEDULER
+# =============================================================================
+
+
+class SamplingScheduler:
+    """
+    One task that samples every sensor on aligned, drift-free deadlines.
+
+    Sensors sharing a sample interval form a group with a single entry in
+    a deadline heap. Deadlines sit on a fixed grid (multiples of the
+    interval on the loop clock), so time spent processing a round never
+    accumulates as drift, and groups with harmonic intervals fire together.
+    A due group is sampled concurrently as one batch and its reading
+    events are published with a single ``publish_many``. When a group has
+    enough hardware ADC sensors, their voltages are converted and
+    classified together by a BatchEvaluator.
+
+    Rounds run as their own tasks so a slow group does not hold up the
+    others, and reads are tracked per sensor: a sensor whose previous read
+    is still running misses its deadline while the rest of its group is
+    sampled on time. A round publishes the readings that finish within one
+    interval together and any stragglers when they complete. Deadlines
+    missed by stuck sensors, or because the loop fell behind by whole
+    periods, are counted (per sensor) and skipped instead of being fired
+    back-to-back.
+
+    A sensor whose sample_interval changed during a round (adaptive
+    sampling) is moved to the group for its new interval afterwards.
+    """
+
+    def __init__(self, event_bus: Optional[Any] = None):
+        self._event_bus = event_bus or get_event_bus()
+        self._evaluator = BatchEvaluator(get_config().sensors.batch_min_sensors)
+        self._groups: Dict[float, Dict[str, BaseSensor]] = {}
+        self._heap: List[Tuple[float, int, float]] = []
+        self._seq = 0
+        self._rounds: Set[asyncio.Task] = set()
+        self._reads: Dict[str, asyncio.Task] = {}  # sensor id -> read in flight
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+        # Metrics (seconds)
+        self.fired = 0
+        self.rounds = 0
+        self.samples = 0
+        self.missed = 0
+        self.overruns = 0
+        self.rate_changes = 0
+        self.last_jitter = 0.0
+        self.max_jitter = 0.0
+        self._jitter_total = 0.0
+
+    # -------------------------------------------------------------------------
+    # Membership
+    # -------------------------------------------------------------------------
+
+    def add(self, sensor: BaseSensor) -> None:
+        """Schedule a sensor at its current sample_interval."""
+        interval = float(sensor.sample_interval)
+        if interval <= 0:
+            raise ValueError(f"Sample interval must be positive for {sensor.sensor_id}")
+
+        self.remove(sensor)
+        group = self._groups.get(interval)
+        if group is None:
+            group = self._groups[interval] = {}
+            if self._running:
+                self._push(self._first_deadline(interval), interval)
+        group[sensor.sensor_id] = sensor
+        sensor.is_monitoring = True
+
+    def remove(self, sensor: BaseSensor) -> None:
+        """Stop sampling a sensor. Its group entry is dropped when it empties."""
+        for group in self._groups.values():
+            if group.pop(sensor.sensor_id, None) is not None:
+                sensor.is_monitoring = False
+                break
+
+    def reschedule(self, sensor: BaseSensor) -> None:
+        """Move a sensor to the group for its (changed) sample_interval."""
+        self.add(sensor)
+
+    def _first_deadline(self, interval: float) -> float:
+        now = asyncio.get_running_loop().time()
+        return math.ceil(now / interval) * interval
+
+    def _push(self, deadline: float, interval: float) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (deadline, self._seq, interval))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # -------------------------------------------------------------------------
+    # Loop
+    # -------------------------------------------------------------------------
+
+    async def run(self) -> None:
+        """Run until stop() is called."""
+        loop = asyncio.get_running_loop()
+        self._running = True
+        self._wakeup = asyncio.Event()
+        self._heap.clear()
+        for interval in self._groups:
+            self._push(self._first_deadline(interval), interval)
+
+        try:
+            while self._running:
+                if not self._heap:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                deadline, _, interval = self._heap[0]
+                delay = deadline - loop.time()
+                if delay > 0:
+                    # Sleep until the deadline, or until a new group is added
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                heapq.heappop(self._heap)
+                group = self._groups.get(interval)
+                if not group:
+                    self._groups.pop(interval, None)
+                    continue
+
+                now = loop.time()
+                self._record_jitter(now - deadline)
+
+                # A sensor still busy with its last read misses this one
+                ready = []
+                for sensor in group.values():
+                    read = self._reads.get(sensor.sensor_id)
+                    if read is not None and not read.done():
+                        self.overruns += 1
+                        self.missed += 1
+                    else:
+                        ready.append(sensor)
+                if ready:
+                    task = asyncio.create_task(
+                        self._run_round(interval, ready),
+                        name=f"sample_round_{interval:g}s",
+                    )
+                    self._rounds.add(task)
+                    task.add_done_callback(self._rounds.discard)
+
+                # Next deadline on the grid; skip any periods already passed
+                next_deadline = deadline + interval
+                if next_deadline <= now:
+                    skipped = int((now - deadline) // interval)
+                    self.missed += skipped * len(group)
+                    next_deadline = deadline + (skipped + 1) * interval
+                self._push(next_deadline, interval)
+        except asyncio.CancelledError:
+            self._cancel_rounds()
+            raise
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """Stop the scheduler loop; await drain() for rounds still in flight."""
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """Wait for in-flight rounds to publish; cancel any still running after ``timeout``."""
+        if self._rounds:
+            await asyncio.wait(set(self._rounds), timeout=timeout)
+        self._cancel_rounds()
+
+    def _cancel_rounds(self) -> None:
+        for task in (*self._rounds, *self._reads.values()):
+            task.cancel()
+        self._rounds.clear()
+        self._reads.clear()
+
+    async def _run_round(self, interval: float, sensors: List[BaseSensor]) -> None:
+        """Sample a group concurrently and publish its readings together."""
+        # Hardware ADC sensors are converted and classified as one array
+        batched, single = self._evaluator.partition(sensors)
+        reads: Dict[asyncio.Task, List[BaseSensor]] = {}
+        for sensor in single:
+            reads[self._start_read(self._read_one(sensor), [sensor])] = [sensor]
+        if batched:
+            reads[self._start_read(self._evaluator.take_readings(batched), batched)] = batched
+
+        # Publish what finishes within the interval together; a sensor that
+        # hangs does not hold back the rest of its group
+        pending = set(reads)
+        timeout: Optional[float] = interval
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=timeout)
+            timeout = None
+            events = []
+            for task in done:
+                group = reads[task]
+                try:
+                    results = task.result()
+                except Exception as e:
+                    results = [e] * len(group)
+                for sensor, result in zip(group, results):
+                    if isinstance(result, BaseException):
+                        logger.error(f"Error reading sensor {sensor.sensor_id}: {result}")
+                        continue
+                    events.append(sensor.reading_event(result))
+
+            self.samples += len(events)
+            if events:
+                await self._event_bus.publish_many(events)
+        self.rounds += 1
+
+        # Sensors whose adaptive rate changed move to their new group
+        for sensor in sensors:
+            if sensor.is_monitoring and sensor.sample_interval != interval:
+                self.reschedule(sensor)
+                self.rate_changes += 1
+
+    @staticmethod
+    async def _read_one(sensor: BaseSensor) -> List[Any]:
+        return [await sensor.take_reading(emit=False)]
+
+    def _start_read(self, coro: Awaitable[List[Any]], sensors: List[BaseSensor]) -> asyncio.Task:
+        """Run a read as a task and mark its sensors busy until it finishes."""
+        task = asyncio.ensure_future(coro)
+        for sensor in sensors:
+            self._reads[sensor.sensor_id] = task
+
+        def finished(_: asyncio.Task) -> None:
+            for sensor in sensors:
+                if self._reads.get(sensor.sensor_id) is task:
+                    del self._reads[sensor.sensor_id]
+
+        task.add_done_callback(finished)
+        return task
+
+    def _record_jitter(self, jitter: float) -> None:
+        self.fired += 1
+        self.last_jitter = jitter
+        self._jitter_total += jitter
+        if jitter > self.max_jitter:
+            self.max_jitter = jitter
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get scheduling jitter and missed-deadline counts."""
+        return {
+            "groups": {f"{interval:g}s": len(group) for interval, group in self._groups.items()},
+            "rounds": self.rounds,
+            "samples": self.samples,
+            "missed_deadlines": self.missed,
+            "overruns": self.overruns,
+            "rate_changes": self.rate_changes,
+            "batch_evaluation": self._evaluator.get_status(),
+            "last_jitter_ms": round(self.last_jitter * 1000, 3),
+            "max_jitter_ms": round(self.max_jitter * 1000, 3),
+            "mean_jitter_ms": (
+                round(self._jitter_total / self.fired * 1000, 3) if self.fired else 0.0
+            ),
+        }
+
+
+# =============================================================================
+# MONITOR
+# =============================================================================
+
+
 class LuxxHausMonitor:
     """
     Central monitoring system for LUXX HAUS.
@@ -85,12 +365,21 @@ class LuxxHausMonitor:
         
         # State
         self.is_running = False
-        self._monitor_tasks: Dict[str, asyncio.Task] = {}
         self._start_time: Optional[datetime] = None
         
         # Event bus
         self._event_bus = get_event_bus()
+        self._transport: Optional[EventTransport] = None
         self._setup_event_handlers()
+
+        # Cross-sensor correlation into composite alerts
+        self._fusion = FusionEngine(self.config.fusion, self._event_bus)
+        if self.config.fusion.enabled:
+            self._fusion.subscribe()
+        
+        # Sensor sampling
+        self._scheduler = SamplingScheduler(self._event_bus)
+        self._loop_lag = LoopLagMonitor.from_config(self.config.io)
         
         logger.info(
             f"LUXX HAUS Monitor initialized "
@@ -126,6 +415,13 @@ class LuxxHausMonitor:
             EventType.EMERGENCY_SHUTOFF,
             self._handle_emergency_shutoff,
         )
+        # Ambient readings feed gas sensor calibration compensation
+        if self.config.sensors.calibration.ambient_compensation:
+            self._event_bus.subscribe(
+                EventType.SENSOR_READING,
+                self._handle_ambient_readings,
+                batch=True,
+            )
 
     async def _handle_emergency_shutoff(self, event) -> None:
         """Handle emergency shutoff event."""
@@ -135,16 +431,74 @@ class LuxxHausMonitor:
             reason=event.data.get("reason", "Unknown"),
         )
 
+    async def _handle_ambient_readings(self, events) -> None:
+        """Pass the latest temperature/humidity in each zone to that zone's gas sensors."""
+        ambient: Dict[str, List[Optional[float]]] = {}  # zone -> [temperature_c, humidity]
+        for event in events:
+            sensor = self.sensors.get(event.data["sensor_id"])
+            if not isinstance(sensor, (TemperatureSensor, HumiditySensor)):
+                continue
+            zone = self._fusion.zone_of(sensor.sensor_id)
+            if zone is None:
+                continue
+            conditions = ambient.setdefault(zone, [None, None])
+            if isinstance(sensor, TemperatureSensor):
+                conditions[0] = (event.data["value"] - 32) * 5 / 9
+                if sensor.humidity is not None:
+                    conditions[1] = sensor.humidity
+            else:
+                conditions[1] = event.data["value"]
+
+        if not ambient:
+            return
+        for sensor in self.sensors.values():
+            if isinstance(sensor, GasLeakSensor):
+                conditions = ambient.get(self._fusion.zone_of(sensor.sensor_id))
+                if conditions is not None:
+                    sensor.set_environment(*conditions)
+
     # =========================================================================
     # SENSOR MANAGEMENT
     # =========================================================================
 
-    def add_sensor(self, sensor: BaseSensor) -> BaseSensor:
-        """Add a sensor to the monitoring system."""
+    def add_sensor(self, sensor: BaseSensor, zone: Optional[str] = None) -> BaseSensor:
+        """
+        Add a sensor to the monitoring system.
+        
+        Args:
+            sensor: Sensor to add
+            zone: Area whose sensors are correlated with this one; defaults
+                to the sensor's location
+        """
         self.sensors[sensor.sensor_id] = sensor
+        self._fusion.register(
+            sensor.sensor_id,
+            zone or getattr(sensor, "location", None) or "default",
+            self._fusion_kind(sensor),
+        )
+        if self.is_running:
+            self._start_sensor(sensor)
         logger.info(f"Added sensor: {sensor.sensor_id} ({sensor.sensor_type.value})")
         return sensor
 
+    @staticmethod
+    def _fusion_kind(sensor: BaseSensor) -> str:
+        """Signal kind for fusion rules; CO sensors share the gas_leak type."""
+        if isinstance(sensor, GasLeakSensor) and sensor.gas_type == GasType.CARBON_MONOXIDE:
+            return GasType.CARBON_MONOXIDE.value
+        return sensor.sensor_type.value
+
+    def _start_sensor(self, sensor: BaseSensor) -> None:
+        """Arm edge detection for interrupt-driven sensors, schedule the rest."""
+        if sensor.edge_triggered:
+            sensor.arm()
+            logger.info(f"Started monitoring: {sensor.sensor_id} (on pin change)")
+        else:
+            self._scheduler.add(sensor)
+            logger.info(
+                f"Started monitoring: {sensor.sensor_id} (every {sensor.sample_interval:g}s)"
+            )
+
     def add_water_sensor(
         self,
         sensor_id: str = "LUXX-WPS-001",
@@ -162,7 +516,7 @@ class LuxxHausMonitor:
             simulation_mode=self.config.system.simulation_mode,
         )
         
-        return self.add_sensor(sensor)
+        return self.add_sensor(sensor, zone=location)
 
     def add_gas_sensor(
         self,
@@ -183,7 +537,7 @@ class LuxxHausMonitor:
             simulation_mode=self.config.system.simulation_mode,
         )
         
-        return self.add_sensor(sensor)
+        return self.add_sensor(sensor, zone=location)
 
     def add_co_sensor(
         self,
@@ -198,7 +552,7 @@ class LuxxHausMonitor:
             simulation_mode=self.config.system.simulation_mode,
         )
         
-        return self.add_sensor(sensor)
+        return self.add_sensor(sensor, zone=location)
 
     def add_smoke_sensor(
         self,
@@ -285,7 +639,9 @@ class LuxxHausMonitor:
         """Remove a sensor from the system."""
         if sensor_id in self.sensors:
             sensor = self.sensors[sensor_id]
+            self._scheduler.remove(sensor)
             sensor.stop_monitoring()
+            self._fusion.unregister(sensor_id)
             del self.sensors[sensor_id]
             logger.info(f"Removed sensor: {sensor_id}")
             return True
@@ -387,8 +743,22 @@ class LuxxHausMonitor:
         # Initialize notification manager
         self.notification_manager = get_notification_manager()
         
+        # Start background pruning of expired readings
+        self._db.retention.start()
+        
+        # Watch for callbacks that stall the event loop
+        self._loop_lag.start()
+        
+        # Bridge the event bus to other local processes
+        if self.config.transport.enabled:
+            try:
+                self._transport = await start_transport(self._event_bus, self.config.transport)
+            except OSError as e:
+                logger.error(f"Failed to start event transport: {e}")
+                self._transport = None
+        
         # Log system start
-        await self._db.log_event(
+        await self._db.record_event(
             event_type="system_start",
             source="monitor",
             message=f"LUXX HAUS started with {len(self.sensors)} sensors",
@@ -410,20 +780,16 @@ class LuxxHausMonitor:
         logger.info(f"  Simulation: {self.config.system.simulation_mode}")
         logger.info("=" * 60)
         
-        # Start monitoring tasks for each sensor
-        for sensor_id, sensor in self.sensors.items():
-            task = asyncio.create_task(
-                sensor.start_monitoring(),
-                name=f"monitor_{sensor_id}",
-            )
-            self._monitor_tasks[sensor_id] = task
-            logger.info(f"Started monitoring: {sensor_id}")
+        # Schedule polled sensors on the shared sampling scheduler; arm the
+        # edge-triggered ones
+        for sensor in self.sensors.values():
+            self._start_sensor(sensor)
         
-        # Wait for all tasks (or until stopped)
+        # Run until stopped
         try:
-            await asyncio.gather(*self._monitor_tasks.values())
+            await self._scheduler.run()
         except asyncio.CancelledError:
-            logger.info("Monitoring tasks cancelled")
+            logger.info("Monitoring cancelled")
 
     async def stop(self) -> None:
         """Stop all monitoring."""
@@ -433,18 +799,18 @@ class LuxxHausMonitor:
         logger.info("Stopping LUXX HAUS monitoring...")
         self.is_running = False
         
-        # Stop all sensors
+        # Stop sampling; rounds in flight finish so their readings get queued
+        self._scheduler.stop()
         for sensor in self.sensors.values():
+            self._scheduler.remove(sensor)
             sensor.stop_monitoring()
+        await self._scheduler.drain()
         
-        # Cancel all tasks
-        for task in self._monitor_tasks.values():
-            task.cancel()
-        
-        self._monitor_tasks.clear()
+        # Stop loop lag probing
+        await self._loop_lag.stop()
         
         # Log system stop
-        await self._db.log_event(
+        await self._db.record_event(
             event_type="system_stop",
             source="monitor",
             message="LUXX HAUS stopped",
@@ -457,6 +823,22 @@ class LuxxHausMonitor:
             "monitor",
         )
         
+        # Disconnect from other processes, then drain queued subscribers
+        if self._transport is not None:
+            await self._transport.stop()
+            self._transport = None
+        await self._event_bus.close()
+        
+        # Stop retention pruning and the write-behind flusher, write the
+        # readings still queued and release the engine
+        try:
+            await self._db.close()
+        except Exception as e:
+            logger.error(f"Failed to close database: {e}")
+        
+        # Release the hardware bus workers
+        get_io_executor().shutdown()
+        
         logger.info("LUXX HAUS monitoring stopped")
 
     # =========================================================================
@@ -488,6 +870,19 @@ class LuxxHausMonitor:
                 self.notification_manager.get_status()
                 if self.notification_manager else None
             ),
+            "event_subscribers": self._event_bus.get_subscriber_stats(),
+            "event_journal": (
+                self._event_bus.journal.get_status()
+                if self._event_bus.journal else None
+            ),
+            "event_transport": (
+                self._transport.get_status() if self._transport else None
+            ),
+            "scheduler": self._scheduler.get_status(),
+            "io": get_io_executor().get_status(),
+            "adc": get_adc_status(),
+            "fusion": self._fusion.get_status(),
+            "event_loop": self._loop_lag.get_status(),
         }
 
     def get_sensor_readings(self) -> Dict[str, Any]:
@@ -0,0 +1,459 @@
+"""
+LUXX HAUS Event Transport
+Bridges EventBus traffic between local processes over a Unix domain socket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import json
+import os
+import struct
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from .config import EventTransportConfig
+from .events import Event, EventBus, EventType, matches_pattern
+
+# Frame: u32 length of everything after it, u8 kind
+_FRAME = struct.Struct("!IB")
+# Event body head: epoch seconds, id/type/source byte lengths; JSON data follows
+_EVENT_HEAD = struct.Struct("!dBBH")
+
+FRAME_EVENT = 1
+FRAME_SUBSCRIBE = 2
+
+MAX_FRAME_BYTES = 4 * 1024 * 1024
+
+
+class HubAlreadyRunning(OSError):
+    """Another live hub owns the socket path."""
+
+
+def encode_event(event: Event) -> bytes:
+    """Encode an event as one EVENT frame."""
+    event_id = event.event_id.encode()
+    event_type = event.type.value.encode()
+    source = event.source.encode()
+    data = json.dumps(event.data, separators=(",", ":"), default=str).encode()
+
+    body = b"".join((
+        _EVENT_HEAD.pack(event.epoch, len(event_id), len(event_type), len(source)),
+        event_id,
+        event_type,
+        source,
+        data,
+    ))
+    return _FRAME.pack(len(body) + 1, FRAME_EVENT) + body
+
+
+def decode_event(body: bytes) -> Event:
+    """Decode the body of an EVENT frame."""
+    epoch, id_len, type_len, source_len = _EVENT_HEAD.unpack_from(body)
+    offset = _EVENT_HEAD.size
+    event_id = body[offset : offset + id_len].decode()
+    offset += id_len
+    event_type = body[offset : offset + type_len].decode()
+    offset += type_len
+    source = body[offset : offset + source_len].decode()
+    offset += source_len
+
+    return Event(
+        type=EventType(event_type),
+        data=json.loads(body[offset:]),
+        source=source,
+        timestamp=datetime.utcfromtimestamp(epoch),
+        event_id=event_id,
+    )
+
+
+def encode_subscribe(patterns: Iterable[str]) -> bytes:
+    """Encode a SUBSCRIBE frame listing the patterns a peer wants."""
+    body = json.dumps(list(patterns)).encode()
+    return _FRAME.pack(len(body) + 1, FRAME_SUBSCRIBE) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """Read one frame; returns (kind, body)."""
+    length, kind = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    if length < 1 or length > MAX_FRAME_BYTES:
+        raise ValueError(f"Invalid frame length: {length}")
+    body = await reader.readexactly(length - 1)
+    return kind, body
+
+
+class _PatternFilter:
+    """Pattern list with a per-event-key match cache."""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.set(patterns)
+
+    def set(self, patterns: Iterable[str]) -> None:
+        self.patterns: List[str] = list(patterns)
+        self._cache: Dict[str, bool] = {}
+
+    def __call__(self, event_key: str) -> bool:
+        matched = self._cache.get(event_key)
+        if matched is None:
+            matched = any(matches_pattern(event_key, p) for p in self.patterns)
+            self._cache[event_key] = matched
+        return matched
+
+
+class _Peer:
+    """One connected socket and what it wants to receive."""
+
+    def __init__(self, writer: asyncio.StreamWriter, max_buffer: int, patterns: Iterable[str] = ()):
+        self.writer = writer
+        self.max_buffer = max_buffer
+        self.wants = _PatternFilter(patterns)
+        self.sent = 0
+        self.dropped = 0
+
+    def send(self, frame: bytes) -> None:
+        """Queue a frame, dropping it if the peer is not keeping up."""
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > self.max_buffer:
+            self.dropped += 1
+            return
+        self.writer.write(frame)
+        self.sent += 1
+
+
+class EventTransport(ABC):
+    """
+    Bridges a local EventBus to other processes.
+
+    Local events that match ``publish_patterns`` are sent out; events that
+    arrive from elsewhere are published on the local bus. Arriving events
+    are tagged while they are being republished so they are not echoed
+    back out.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        publish_patterns: Iterable[str] = ("*",),
+        max_buffer_bytes: int = 1024 * 1024,
+    ):
+        self.bus = bus
+        self.exports = _PatternFilter(publish_patterns)
+        self.max_buffer_bytes = max_buffer_bytes
+        self._inbound: Set[int] = set()
+        self.received = 0
+
+    async def start(self) -> None:
+        self.bus.subscribe("*", self._on_local_event)
+        await self._start()
+
+    async def stop(self) -> None:
+        self.bus.unsubscribe("*", self._on_local_event)
+        await self._stop()
+
+    def _on_local_event(self, event: Event) -> None:
+        # Inline and synchronous: frames are buffered, never awaited
+        if id(event) in self._inbound or not self.exports(event.type.value):
+            return
+        self._send(event)
+
+    async def _deliver_local(self, event: Event) -> None:
+        self.received += 1
+        self._inbound.add(id(event))
+        try:
+            await self.bus.publish(event)
+        finally:
+            self._inbound.discard(id(event))
+
+    @abstractmethod
+    async def _start(self) -> None:
+        ...
+
+    @abstractmethod
+    async def _stop(self) -> None:
+        ...
+
+    @abstractmethod
+    def _send(self, event: Event) -> None:
+        ...
+
+    @abstractmethod
+    def get_status(self) -> Dict[str, Any]:
+        ...
+
+
+class UnixSocketHub(EventTransport):
+    """
+    Owns the socket and relays events between all connected processes.
+
+    Each client announces the patterns it wants with a SUBSCRIBE frame and
+    only matching events are written to it, so filtering happens before
+    anything crosses the socket. Events from one client are relayed to the
+    others as the same frame bytes, without re-encoding.
+
+    The hub holds an exclusive lock on ``<path>.lock`` while it runs, and
+    an existing socket is only replaced once the lock is taken and nothing
+    answers on it. A second hub on the same path raises HubAlreadyRunning
+    instead of taking the socket from a live one.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        path: str,
+        subscribe_patterns: Iterable[str] = ("*",),
+        publish_patterns: Iterable[str] = ("*",),
+        max_buffer_bytes: int = 1024 * 1024,
+    ):
+        super().__init__(bus, publish_patterns, max_buffer_bytes)
+        self.path = path
+        self.imports = _PatternFilter(subscribe_patterns)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._peers: List[_Peer] = []
+        self._lock_fd: Optional[int] = None
+
+    async def start(self) -> None:
+        # Claim the socket before subscribing, so a refused start leaves no trace
+        await self._start()
+        self.bus.subscribe("*", self._on_local_event)
+
+    async def _start(self) -> None:
+        self._acquire_lock()
+        try:
+            if os.path.exists(self.path):
+                if await _socket_alive(self.path):
+                    raise HubAlreadyRunning(f"An event hub is already listening on {self.path}")
+                os.unlink(self.path)  # Stale socket from an unclean exit
+            self._server = await asyncio.start_unix_server(self._handle_client, path=self.path)
+        except BaseException:
+            self._release_lock()
+            raise
+        logger.info(f"Event hub listening on {self.path}")
+
+    def _acquire_lock(self) -> None:
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise HubAlreadyRunning(f"An event hub already owns {self.path}") from None
+        self._lock_fd = fd
+
+    def _release_lock(self) -> None:
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)  # closing drops the flock
+            self._lock_fd = None
+
+    async def _stop(self) -> None:
+        # Close clients first: wait_closed() waits for their handlers to exit
+        for peer in list(self._peers):
+            peer.writer.close()
+        self._peers.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._release_lock()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        peer = _Peer(writer, self.max_buffer_bytes)
+        self._peers.append(peer)
+        logger.info(f"Event hub: client connected ({len(self._peers)} total)")
+        try:
+            while True:
+                kind, body = await read_frame(reader)
+                if kind == FRAME_SUBSCRIBE:
+                    peer.wants.set(json.loads(body))
+                elif kind == FRAME_EVENT:
+                    event = decode_event(body)
+                    self._relay(event, body, origin=peer)
+                    if self.imports(event.type.value):
+                        await self._deliver_local(event)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Event hub: dropping client after bad frame: {e}")
+        finally:
+            if peer in self._peers:
+                self._peers.remove(peer)
+            writer.close()
+            logger.info(f"Event hub: client disconnected ({len(self._peers)} total)")
+
+    def _relay(self, event: Event, body: bytes, origin: _Peer) -> None:
+        key = event.type.value
+        frame = None
+        for peer in self._peers:
+            if peer is origin or not peer.wants(key):
+                continue
+            if frame is None:
+                frame = _FRAME.pack(len(body) + 1, FRAME_EVENT) + body
+            peer.send(frame)
+
+    def _send(self, event: Event) -> None:
+        key = event.type.value
+        frame = None
+        for peer in self._peers:
+            if not peer.wants(key):
+                continue
+            if frame is None:
+                frame = encode_event(event)
+            peer.send(frame)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "role": "hub",
+            "path": self.path,
+            "clients": len(self._peers),
+            "received": self.received,
+            "sent": sum(peer.sent for peer in self._peers),
+            "dropped": sum(peer.dropped for peer in self._peers),
+        }
+
+
+class UnixSocketBridge(EventTransport):
+    """
+    Connects a process to a hub, reconnecting if the hub goes away.
+
+    ``subscribe_patterns`` is sent to the hub so it only forwards what this
+    process wants; ``publish_patterns`` limits what this process sends.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        path: str,
+        subscribe_patterns: Iterable[str] = ("*",),
+        publish_patterns: Iterable[str] = ("*",),
+        max_buffer_bytes: int = 1024 * 1024,
+        reconnect_interval: float = 1.0,
+    ):
+        super().__init__(bus, publish_patterns, max_buffer_bytes)
+        self.path = path
+        self.subscribe_patterns = list(subscribe_patterns)
+        self.reconnect_interval = reconnect_interval
+        self._peer: Optional[_Peer] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+
+    async def _start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def _stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._peer is not None:
+            self._peer.writer.close()
+            self._peer = None
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> None:
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            except (FileNotFoundError, ConnectionError) as e:
+                logger.debug(f"Event bridge: hub not reachable at {self.path}: {e}")
+                await asyncio.sleep(self.reconnect_interval)
+                continue
+
+            peer = _Peer(writer, self.max_buffer_bytes)
+            writer.write(encode_subscribe(self.subscribe_patterns))
+            self._peer = peer
+            self._connected.set()
+            logger.info(f"Event bridge connected to {self.path}")
+
+            try:
+                while True:
+                    kind, body = await read_frame(reader)
+                    if kind == FRAME_EVENT:
+                        await self._deliver_local(decode_event(body))
+            except (asyncio.IncompleteReadError, ConnectionError):
+                logger.warning("Event bridge: hub disconnected")
+            except ValueError as e:
+                logger.error(f"Event bridge: bad frame from hub: {e}")
+            finally:
+                self._connected.clear()
+                self._peer = None
+                writer.close()
+
+            await asyncio.sleep(self.reconnect_interval)
+
+    def _send(self, event: Event) -> None:
+        if self._peer is not None:
+            self._peer.send(encode_event(event))
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "role": "client",
+            "path": self.path,
+            "connected": self._peer is not None,
+            "received": self.received,
+            "sent": self._peer.sent if self._peer else 0,
+            "dropped": self._peer.dropped if self._peer else 0,
+        }
+
+
+async def _socket_alive(path: str) -> bool:
+    """True if something accepts connections on a Unix socket path."""
+    try:
+        _, writer = await asyncio.open_unix_connection(path)
+    except (FileNotFoundError, ConnectionError):
+        return False
+    writer.close()
+    return True
+
+
+def create_transport(
+    bus: EventBus, config: EventTransportConfig, role: Optional[str] = None
+) -> EventTransport:
+    """Build the transport described by the config ("auto" builds a hub)."""
+    max_buffer = config.max_buffer_kb * 1024
+    if (role or config.role) in ("hub", "auto"):
+        return UnixSocketHub(
+            bus,
+            config.socket_path,
+            subscribe_patterns=config.subscribe,
+            publish_patterns=config.publish,
+            max_buffer_bytes=max_buffer,
+        )
+    return UnixSocketBridge(
+        bus,
+        config.socket_path,
+        subscribe_patterns=config.subscribe,
+        publish_patterns=config.publish,
+        max_buffer_bytes=max_buffer,
+        reconnect_interval=config.reconnect_interval,
+    )
+
+
+async def start_transport(bus: EventBus, config: EventTransportConfig) -> EventTransport:
+    """
+    Build and start the configured transport.
+
+    With role "auto" the first process to start becomes the hub and the
+    rest connect to it as clients.
+    """
+    transport = create_transport(bus, config)
+    try:
+        await transport.start()
+    except HubAlreadyRunning:
+        if config.role != "auto":
+            raise
+        logger.info(f"Event hub already running on {config.socket_path}; connecting as a client")
+        transport = create_transport(bus, config, role="client")
+        await transport.start()
+    return transport
@@ -13,7 +13,15 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
-from ..core import AlertSeverity, EventType, get_config, get_event_bus, on_event
+from ..core import (
+    AlertSeverity,
+    DeliveryMode,
+    EventType,
+    OverflowPolicy,
+    get_config,
+    get_event_bus,
+    on_event,
+)
 
 
 @dataclass
@@ -321,6 +329,15 @@ This is an automated alert from your LUXX HAUS smart home protection system.
             return False
 
 
+# Alert events that send a notification (acknowledged/resolved do not)
+_NOTIFY_EVENTS = frozenset({
+    EventType.ALERT_TRIGGERED,
+    EventType.ALERT_ESCALATED,
+    EventType.ALERT_RENOTIFIED,
+    EventType.ALERT_COMPOSITE,
+})
+
+
 class NotificationManager:
     """
     Central notification manager.
@@ -360,16 +377,30 @@ class NotificationManager:
 
     def _setup_event_handlers(self) -> None:
         """Subscribe to relevant events."""
-        event_bus = get_event_bus()
-        event_bus.subscribe(EventType.ALERT_TRIGGERED, self._handle_alert_event)
+        # Queued so SMTP/SMS latency does not hold up the alerting sensor;
+        # alerts are never dropped, the publisher waits if the queue fills.
+        # One subscription so an incident's notifications go out in order.
+        get_event_bus().subscribe(
+            "alert.*",
+            self._handle_alert_event,
+            mode=DeliveryMode.QUEUED,
+            overflow=OverflowPolicy.BLOCK,
+        )
 
     async def _handle_alert_event(self, event) -> None:
         """Handle incoming alert events."""
+        if event.type not in _NOTIFY_EVENTS:
+            return
         data = event.data
         severity = AlertSeverity(data.get("severity", "warning"))
+        title = f"{data.get('sensor_type', 'Sensor').replace('_', ' ').title()} Alert"
+        if event.type == EventType.ALERT_ESCALATED:
+            title += " Escalated"
+        elif event.type == EventType.ALERT_RENOTIFIED:
+            title += " (still active)"
         
         await self.send_alert(
-            title=f"{data.get('sensor_type', 'Sensor').replace('_', ' ').title()} Alert",
+            title=title,
             message=data.get("message", "Alert triggered"),
             severity=severity,
         )
@@ -3,7 +3,20 @@ LUXX HAUS / ALEXANDER one.1 Sensors Module
 All sensor implementations for the smart home protection system.
 """
 
-from .base import BaseSensor, Reading
+from .adc import ADCChannel, SharedMCP3008, get_adc, get_adc_status
+from .alerting import AlertPolicy
+from .base import BaseSensor, EdgeTriggeredSensor, Reading
+from .batch import BatchEvaluator, BatchSpec, LinearScale, MQCurve, ThresholdBands
+from .calibration import CalibrationStore, CalibrationTable, Compensation, GasCalibration
+from .detectors import (
+    CUSUMDetector,
+    Detection,
+    EWMADetector,
+    RateOfChangeDetector,
+    StreamingDetector,
+)
+from .gpio import GPIOBackend, RPiGPIO, SimulatedGPIO
+from .history import ReadingHistory
 from .gas_leak import (
     CarbonMonoxideSensor,
     GasLeakSensor,
@@ -19,7 +32,37 @@ from .water_pressure import HoneywellPX2Sensor, WaterPressureSensor
 __all__ = [
     # Base
     "BaseSensor",
+    "EdgeTriggeredSensor",
     "Reading",
+    "ReadingHistory",
+    # Batch evaluation
+    "BatchEvaluator",
+    "BatchSpec",
+    "LinearScale",
+    "MQCurve",
+    "ThresholdBands",
+    # Gas calibration
+    "CalibrationStore",
+    "CalibrationTable",
+    "Compensation",
+    "GasCalibration",
+    # Early-warning detectors
+    "StreamingDetector",
+    "RateOfChangeDetector",
+    "EWMADetector",
+    "CUSUMDetector",
+    "Detection",
+    # Alert policy
+    "AlertPolicy",
+    # GPIO
+    "GPIOBackend",
+    "RPiGPIO",
+    "SimulatedGPIO",
+    # Shared ADC
+    "ADCChannel",
+    "SharedMCP3008",
+    "get_adc",
+    "get_adc_status",
     # Water
     "WaterPressureSensor",
     "HoneywellPX2Sensor",
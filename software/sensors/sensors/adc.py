@@ -0,0 +1,216 @@
+"""
+LUXX HAUS Shared ADC
+One MCP3008 driver per SPI bus/chip-select, shared by every analog sensor on it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from ..core import get_config
+
+MCP3008_CHANNELS = 8
+MCP3008_MAX_COUNT = 1023
+
+
+class ADCChannel:
+    """
+    One input of a shared ADC.
+
+    Has the ``voltage``/``value`` attributes of adafruit's AnalogIn, so a
+    sensor's read path does not care whether it owns the chip or shares it.
+    """
+
+    __slots__ = ("adc", "channel")
+
+    def __init__(self, adc: "SharedMCP3008", channel: int):
+        self.adc = adc
+        self.channel = channel
+
+    @property
+    def counts(self) -> int:
+        """Raw 10-bit conversion result (0-1023)."""
+        return self.adc.read_counts(self.channel)
+
+    @property
+    def voltage(self) -> float:
+        return self.counts * self.adc.vref / MCP3008_MAX_COUNT
+
+    @property
+    def value(self) -> int:
+        """16-bit scaled value, as AnalogIn.value reports it."""
+        return self.counts << 6
+
+
+class SharedMCP3008:
+    """
+    An MCP3008 shared by every sensor wired to it.
+
+    Channels are registered by the sensors that use them. The first read in
+    a sampling tick converts every registered channel in one sweep, holding
+    the SPI device (and its chip-select) once, and caches the counts; the
+    other sensors sampled in the same tick get their channel from that
+    sweep. A sweep older than ``max_age`` seconds is redone on the next
+    read.
+
+    Reads are expected on the bus's I/O worker thread; a lock guards the
+    cache in case a read path runs elsewhere.
+    """
+
+    def __init__(
+        self,
+        bus: str = "spi0",
+        chip_select: str = "D5",
+        vref: float = 3.3,
+        max_age: float = 0.05,
+        device: Optional[Any] = None,
+    ):
+        self.bus = bus
+        self.chip_select = chip_select
+        self.vref = vref
+        self.max_age = max_age
+
+        self._device = device if device is not None else self._open_device()
+        self._lock = threading.Lock()
+        self._channels: List[int] = []
+        self._counts: Dict[int, int] = {}
+        self._swept_at = 0.0
+
+        # MCP3008 single-ended command per channel: start bit, SGL|channel, pad
+        self._out = bytearray(3)
+        self._in = bytearray(3)
+
+        # Stats
+        self.sweeps = 0
+        self.transfers = 0
+        self.reads = 0
+        self.cached_reads = 0
+
+    def _open_device(self) -> Any:
+        """Create the SPI device for this bus/chip-select."""
+        import board
+        import busio
+        from adafruit_bus_device.spi_device import SPIDevice
+        from digitalio import DigitalInOut
+
+        pins = {
+            "spi0": (board.SCK, board.MOSI, board.MISO),
+            "spi1": (board.SCK_1, board.MOSI_1, board.MISO_1),
+        }
+        if self.bus not in pins:
+            raise ValueError(f"Unknown SPI bus: {self.bus}")
+        clock, mosi, miso = pins[self.bus]
+        spi = busio.SPI(clock=clock, MOSI=mosi, MISO=miso)
+        cs = DigitalInOut(getattr(board, self.chip_select))
+        logger.info(f"MCP3008 opened on {self.bus} CS={self.chip_select}")
+        return SPIDevice(spi, cs, baudrate=1_000_000)
+
+    # =========================================================================
+    # CHANNELS
+    # =========================================================================
+
+    def channel(self, channel: int) -> ADCChannel:
+        """Register a channel for sweeping and return a handle to it."""
+        if not 0 <= channel < MCP3008_CHANNELS:
+            raise ValueError(f"MCP3008 channel out of range: {channel}")
+        with self._lock:
+            if channel not in self._channels:
+                self._channels.append(channel)
+                self._channels.sort()
+                self._swept_at = 0.0  # next read picks up the new channel
+        return ADCChannel(self, channel)
+
+    def release(self, channel: int) -> None:
+        """Stop sweeping a channel."""
+        with self._lock:
+            if channel in self._channels:
+                self._channels.remove(channel)
+            self._counts.pop(channel, None)
+
+    @property
+    def channels(self) -> Tuple[int, ...]:
+        return tuple(self._channels)
+
+    # =========================================================================
+    # READS
+    # =========================================================================
+
+    def sweep(self) -> Dict[int, int]:
+        """Convert every registered channel in one SPI session."""
+        with self._lock:
+            return self._sweep()
+
+    def _sweep(self) -> Dict[int, int]:
+        out, buf = self._out, self._in
+        counts = self._counts
+        with self._device as spi:
+            for channel in self._channels:
+                out[0] = 0x01
+                out[1] = (0x08 | channel) << 4
+                out[2] = 0x00
+                spi.write_readinto(out, buf)
+                counts[channel] = ((buf[1] & 0x03) << 8) | buf[2]
+        self._swept_at = time.monotonic()
+        self.sweeps += 1
+        self.transfers += len(self._channels)
+        return dict(counts)
+
+    def read_counts(self, channel: int) -> int:
+        """Counts for a channel, from this tick's sweep if it is fresh."""
+        with self._lock:
+            self.reads += 1
+            if (
+                channel in self._counts
+                and time.monotonic() - self._swept_at < self.max_age
+            ):
+                self.cached_reads += 1
+                return self._counts[channel]
+            if channel not in self._channels:
+                raise ValueError(f"Channel {channel} is not registered on {self.bus}/{self.chip_select}")
+            return self._sweep()[channel]
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get sweep and SPI transfer counts."""
+        return {
+            "bus": self.bus,
+            "chip_select": self.chip_select,
+            "channels": list(self._channels),
+            "sweeps": self.sweeps,
+            "spi_transfers": self.transfers,
+            "reads": self.reads,
+            "cached_reads": self.cached_reads,
+        }
+
+
+# Shared ADCs, keyed by (bus, chip_select)
+_adcs: Dict[Tuple[str, str], SharedMCP3008] = {}
+
+
+def get_adc(bus: str = "spi0", chip_select: Optional[str] = None) -> SharedMCP3008:
+    """
+    Get the shared MCP3008 on a bus/chip-select, opening it on first use.
+
+    Raises ImportError when the hardware libraries are missing, like the
+    drivers it replaces, so sensors can fall back to simulation.
+    """
+    config = get_config().sensors.adc
+    key = (bus, chip_select or config.chip_select)
+    adc = _adcs.get(key)
+    if adc is None:
+        adc = SharedMCP3008(
+            bus=key[0],
+            chip_select=key[1],
+            vref=config.vref,
+            max_age=config.sweep_max_age_ms / 1000,
+        )
+        _adcs[key] = adc
+    return adc
+
+
+def get_adc_status() -> List[Dict[str, Any]]:
+    """Status of every shared ADC that has been opened."""
+    return [adc.get_status() for adc in _adcs.values()]
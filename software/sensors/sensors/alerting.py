@@ -0,0 +1,185 @@
+"""
+LUXX HAUS Alert Policy
+Turns a sensor's stream of per-sample severities into incidents, so alert
+records and notifications follow incidents rather than samples.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from ..core.config import AlertPolicyConfig, AlertSeverity
+
+# Transitions returned by AlertPolicy.update()
+OPEN = "open"
+ESCALATE = "escalate"
+RENOTIFY = "renotify"
+RESOLVE = "resolve"
+
+_RANK = {
+    AlertSeverity.INFO: 0,
+    AlertSeverity.WARNING: 1,
+    AlertSeverity.DANGER: 2,
+    AlertSeverity.CRITICAL: 3,
+}
+_BY_RANK = sorted(_RANK, key=_RANK.get)
+
+
+class AlertPolicy:
+    """
+    Per-sensor alert state machine: clear -> active -> clear.
+
+    Entering: ``enter_samples`` alerting readings in a row open an incident
+    (debounce). A CRITICAL reading opens one immediately.
+
+    While active, readings only notify when the incident escalates or
+    ``renotify_seconds`` have passed since the last notification. It
+    escalates when a reading's severity rises above the incident's worst so
+    far (if ``escalate_on_severity``), and, if ``escalate_after_seconds`` is
+    set, when it has persisted that long since opening or its last
+    escalation, one severity step at a time up to CRITICAL. Lower-severity
+    readings inside an incident are recorded as readings but not re-alerted.
+
+    Exiting: a non-alerting reading only counts toward clearing once its
+    ``threshold_distance()`` is at least ``exit_band`` (hysteresis, so a
+    value hovering at the threshold does not flap). The incident resolves
+    after ``exit_samples`` such readings in a row, and not before it has
+    been open ``min_dwell_seconds``.
+    """
+
+    def __init__(
+        self,
+        enter_samples: int = 1,
+        exit_samples: int = 3,
+        exit_band: float = 0.05,
+        min_dwell_seconds: float = 30.0,
+        renotify_seconds: float = 900.0,
+        escalate_on_severity: bool = True,
+        escalate_after_seconds: float = 0.0,
+    ):
+        self.enter_samples = enter_samples
+        self.exit_samples = exit_samples
+        self.exit_band = exit_band
+        self.min_dwell_seconds = min_dwell_seconds
+        self.renotify_seconds = renotify_seconds
+        self.escalate_on_severity = escalate_on_severity
+        self.escalate_after_seconds = escalate_after_seconds
+
+        self.severity: Optional[AlertSeverity] = None  # worst severity of the open incident
+        self.previous_severity: Optional[AlertSeverity] = None  # before the last escalation
+        self.last_severity: Optional[AlertSeverity] = None  # worst severity of the last resolved one
+        self.opened_at = 0.0
+        self.notified_at = 0.0
+        self.escalated_at = 0.0
+        self._pending = 0
+        self._clearing = 0
+
+        # Stats
+        self.incidents = 0
+        self.notifications = 0
+        self.escalations = 0
+        self.suppressed = 0
+
+    @classmethod
+    def from_config(cls, config: AlertPolicyConfig) -> "AlertPolicy":
+        return cls(
+            enter_samples=config.enter_samples,
+            exit_samples=config.exit_samples,
+            exit_band=config.exit_band,
+            min_dwell_seconds=config.min_dwell_seconds,
+            renotify_seconds=config.renotify_seconds,
+            escalate_on_severity=config.escalate_on_severity,
+            escalate_after_seconds=config.escalate_after_seconds,
+        )
+
+    @property
+    def active(self) -> bool:
+        return self.severity is not None
+
+    def update(
+        self, severity: Optional[AlertSeverity], distance: float, now: float
+    ) -> Optional[str]:
+        """
+        Feed one reading.
+
+        Args:
+            severity: The reading's severity, None if it is not alerting
+            distance: The sensor's threshold_distance() for the reading
+            now: Monotonic time of the reading, in seconds
+
+        Returns:
+            OPEN, ESCALATE or RENOTIFY when the reading should be alerted on,
+            RESOLVE when it ends the incident, otherwise None
+        """
+        if severity is None:
+            return self._update_clear(distance, now)
+
+        self._clearing = 0
+        if not self.active:
+            self._pending += 1
+            if self._pending < self.enter_samples and severity != AlertSeverity.CRITICAL:
+                self.suppressed += 1
+                return None
+            self._pending = 0
+            self.severity = severity
+            self.opened_at = self.notified_at = self.escalated_at = now
+            self.incidents += 1
+            self.notifications += 1
+            return OPEN
+
+        if _RANK[severity] > _RANK[self.severity]:
+            if self.escalate_on_severity:
+                return self._escalate(severity, now)
+            self.severity = severity  # carried by the next re-notify
+
+        if (
+            self.escalate_after_seconds
+            and now - self.escalated_at >= self.escalate_after_seconds
+            and self.severity != AlertSeverity.CRITICAL
+        ):
+            return self._escalate(_BY_RANK[_RANK[self.severity] + 1], now)
+
+        if self.renotify_seconds and now - self.notified_at >= self.renotify_seconds:
+            self.notified_at = now
+            self.notifications += 1
+            return RENOTIFY
+
+        self.suppressed += 1
+        return None
+
+    def _escalate(self, severity: AlertSeverity, now: float) -> str:
+        self.previous_severity = self.severity
+        self.severity = severity
+        self.notified_at = self.escalated_at = now
+        self.notifications += 1
+        self.escalations += 1
+        return ESCALATE
+
+    def _update_clear(self, distance: float, now: float) -> Optional[str]:
+        self._pending = 0
+        if not self.active:
+            return None
+        if distance < self.exit_band:
+            self._clearing = 0  # back inside the hysteresis band
+            return None
+        self._clearing += 1
+        if self._clearing < self.exit_samples or now - self.opened_at < self.min_dwell_seconds:
+            return None
+        self.last_severity = self.severity
+        self.reset()
+        return RESOLVE
+
+    def reset(self) -> None:
+        self.severity = None
+        self._pending = 0
+        self._clearing = 0
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "severity": self.severity.value if self.severity else None,
+            "incidents": self.incidents,
+            "notifications": self.notifications,
+            "escalations": self.escalations,
+            "suppressed": self.suppressed,
+        }
@@ -6,34 +6,82 @@ Abstract base class for all sensors in the system.
 from __future__ import annotations
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from ..core import (
     AlertSeverity,
+    Event,
     SensorType,
     emit_alert,
+    emit_alert_escalated,
+    emit_alert_renotified,
+    emit_alert_resolved,
     emit_sensor_reading,
     get_config,
     get_db,
+    get_io_executor,
+    sensor_reading_event,
 )
+from .alerting import ESCALATE, OPEN, RENOTIFY, RESOLVE, AlertPolicy
+from .detectors import Detection, StreamingDetector, detector_from_config
+from .gpio import EDGE_BOTH, GPIOBackend
+from .history import ReadingHistory
+from .sampling import AdaptiveSamplingPolicy
+
+if TYPE_CHECKING:
+    from .batch import BatchSpec
+
+# process_reading() default: classify the value with check_threshold()
+_UNCHECKED = object()
 
 
-@dataclass
 class Reading:
-    """Represents a single sensor reading."""
+    """
+    Represents a single sensor reading.
+
+    Slotted rather than a dataclass: one is built per sample, so the
+    per-instance ``__dict__`` is worth avoiding.
+    """
 
-    sensor_id: str
-    sensor_type: SensorType
-    value: float
-    unit: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    is_alert: bool = False
-    severity: Optional[AlertSeverity] = None
+    __slots__ = ("sensor_id", "sensor_type", "value", "unit", "timestamp", "is_alert", "severity")
+
+    def __init__(
+        self,
+        sensor_id: str,
+        sensor_type: SensorType,
+        value: float,
+        unit: str,
+        timestamp: Optional[datetime] = None,
+        is_alert: bool = False,
+        severity: Optional[AlertSeverity] = None,
+    ):
+        self.sensor_id = sensor_id
+        self.sensor_type = sensor_type
+        self.value = value
+        self.unit = unit
+        self.timestamp = timestamp if timestamp is not None else datetime.utcnow()
+        self.is_alert = is_alert
+        self.severity = severity
+
+    def __repr__(self) -> str:
+        return (
+            f"Reading(sensor_id={self.sensor_id!r}, sensor_type={self.sensor_type!r}, "
+            f"value={self.value!r}, unit={self.unit!r}, timestamp={self.timestamp!r}, "
+            f"is_alert={self.is_alert!r}, severity={self.severity!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Reading):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -55,8 +103,17 @@ class BaseSensor(ABC):
         - read_value(): Read from hardware
         - check_threshold(): Determine if alert should be triggered
         - get_alert_message(): Generate alert message
+    
+    Sensors whose read_value() waits on hardware (SPI/I2C transfers, DHT
+    bit-banging) set ``blocking_read = True`` and name the bus they use in
+    ``io_bus``; their reads then run on that bus's worker thread instead
+    of the event loop. Simulated reads always run inline.
     """
 
+    blocking_read: bool = False
+    io_bus: str = "gpio"
+    edge_triggered: bool = False  # see EdgeTriggeredSensor
+
     def __init__(
         self,
         sensor_id: str,
@@ -65,6 +122,7 @@ class BaseSensor(ABC):
         unit: str,
         sample_interval: float = 2.0,
         simulation_mode: bool = False,
+        history_size: Optional[int] = None,
     ):
         self.sensor_id = sensor_id
         self.sensor_type = sensor_type
@@ -74,12 +132,38 @@ class BaseSensor(ABC):
         self.simulation_mode = simulation_mode or get_config().system.simulation_mode
 
         # State
-        self.readings: List[Reading] = []
+        self.readings = ReadingHistory(
+            capacity=history_size or get_config().system.sensor_history_size,
+            sensor_id=sensor_id,
+            sensor_type=sensor_type,
+            unit=unit,
+        )
         self.is_monitoring = False
         self.consecutive_alerts = 0
         self.last_value: Optional[float] = None
         self.last_reading_time: Optional[datetime] = None
 
+        # Adaptive sample rate (None = fixed sample_interval)
+        self.sampling_policy: Optional[AdaptiveSamplingPolicy] = None
+        adaptive = get_config().sensors.adaptive_sampling.get(sensor_type.value)
+        if adaptive is not None and adaptive.enabled:
+            self.sampling_policy = AdaptiveSamplingPolicy.from_config(adaptive, sample_interval)
+
+        # Early-warning detectors, fed every reading. Simulated values are
+        # independent random draws, so configured detectors are hardware-only.
+        self.detectors: List[StreamingDetector] = []
+        early_warning = get_config().sensors.early_warning.get(sensor_type.value)
+        if early_warning is not None and early_warning.enabled and not self.simulation_mode:
+            self.attach_detector(detector_from_config(early_warning))
+
+        # Alert records and notifications per incident rather than per sample
+        # (None = every alerting reading is alerted on)
+        self.alert_policy: Optional[AlertPolicy] = None
+        sensors_config = get_config().sensors
+        policy = sensors_config.alert_policies.get(sensor_type.value, sensors_config.alert_policy)
+        if policy.enabled:
+            self.alert_policy = AlertPolicy.from_config(policy)
+
         # Callbacks
         self._on_alert_callbacks: List[Callable[[Reading], Any]] = []
         self._on_reading_callbacks: List[Callable[[Reading], Any]] = []
@@ -137,40 +221,119 @@ class BaseSensor(ABC):
         """
         pass
 
+    def batch_spec(self) -> Optional["BatchSpec"]:
+        """
+        Conversion and threshold parameters for batched evaluation.
+        
+        Sensors that convert an ADC voltage with a formula the batch
+        evaluator knows return a BatchSpec; the rest return None and are
+        read one at a time.
+        """
+        return None
+
+    def get_early_warning_message(self, value: float, detection: Detection) -> str:
+        """
+        Message for an alert raised by a detector, below the threshold.
+        
+        Sensors override this to say what the trend means for them.
+        """
+        name = self.sensor_type.value.replace("_", " ").capitalize()
+        return (
+            f"{name} {detection.describe(self.unit)} "
+            f"(now {value:.1f} {self.unit}, threshold {self.threshold:.1f} {self.unit})."
+        )
+
+    def threshold_distance(self, value: float) -> float:
+        """
+        Relative distance from a value to the nearest alert boundary.
+        
+        0 means at the threshold, 1 means a full threshold's width away.
+        Sensors with more than one boundary override this.
+        """
+        if not self.threshold:
+            return float("inf")
+        return abs(value - self.threshold) / abs(self.threshold)
+
     # =========================================================================
     # CORE METHODS
     # =========================================================================
 
-    async def take_reading(self) -> Reading:
+    async def read_value_async(self) -> float:
+        """Call read_value(), on the bus worker thread if it blocks."""
+        if self.blocking_read and not self.simulation_mode and get_config().io.offload_reads:
+            return await get_io_executor().run(self.io_bus, self.read_value)
+        return self.read_value()
+
+    async def take_reading(self, emit: bool = True) -> Reading:
         """
         Take a single sensor reading and process it.
         
+        Args:
+            emit: Publish the reading event. The monitor's scheduler passes
+                False and publishes a whole sampling round at once.
+        
         Returns:
             Reading object with current sensor data
         """
         # Read value from hardware/simulation
-        value = self.read_value()
+        value = await self.read_value_async()
+        return await self.process_reading(value, emit=emit)
+
+    async def process_reading(
+        self,
+        value: float,
+        emit: bool = True,
+        severity: Any = _UNCHECKED,
+    ) -> Reading:
+        """
+        Record and act on a value that has already been read.
+        
+        Args:
+            value: Converted sensor value
+            emit: Publish the reading event
+            severity: Result of check_threshold() if the caller already
+                classified the value (the batch evaluator does); checked
+                here otherwise
+        
+        Returns:
+            Reading object with current sensor data
+        """
         self.last_value = value
         self.last_reading_time = datetime.utcnow()
 
         # Check threshold
-        severity = self.check_threshold(value)
+        if severity is _UNCHECKED:
+            severity = self.check_threshold(value)
+
+        # Trend detectors warn while the value is still inside the threshold
+        detection = None
+        if self.detectors:
+            detection = self._run_detectors(value)
+            if severity is not None:
+                detection = None
+            elif detection is not None:
+                severity = AlertSeverity.WARNING
         is_alert = severity is not None
 
+        # Sample faster near a threshold or while the value moves, slower when calm
+        if self.sampling_policy is not None:
+            self.sample_interval = self.sampling_policy.update(
+                value, self.threshold_distance(value), self.threshold, is_alert
+            )
+
         # Create reading object
         reading = Reading(
             sensor_id=self.sensor_id,
             sensor_type=self.sensor_type,
             value=value,
             unit=self.unit,
+            timestamp=self.last_reading_time,
             is_alert=is_alert,
             severity=severity,
         )
 
         # Store reading
         self.readings.append(reading)
-        if len(self.readings) > 100:
-            self.readings = self.readings[-100:]
 
         # Update consecutive alerts counter
         if is_alert:
@@ -178,28 +341,47 @@ class BaseSensor(ABC):
         else:
             self.consecutive_alerts = 0
 
-        # Log to database
-        await self._db.log_reading(
+        # Queue for the database (written in batches by the write-behind buffer)
+        await self._db.queue_reading(
             sensor_id=self.sensor_id,
             sensor_type=self.sensor_type,
             value=value,
             unit=self.unit,
             is_alert=is_alert,
             severity=severity,
+            timestamp=reading.timestamp,
         )
 
         # Emit event
-        await emit_sensor_reading(
-            sensor_id=self.sensor_id,
-            sensor_type=self.sensor_type.value,
-            value=value,
-            unit=self.unit,
-            is_alert=is_alert,
-        )
-
-        # Handle alert
+        if emit:
+            await emit_sensor_reading(
+                sensor_id=self.sensor_id,
+                sensor_type=self.sensor_type.value,
+                value=value,
+                unit=self.unit,
+                is_alert=is_alert,
+            )
+
+        # Safety actions see every alerting reading
         if is_alert:
-            await self._handle_alert(reading, severity)
+            await self._on_alert(value, severity)
+
+        # Alert records, events and callbacks follow the alert policy
+        if self.alert_policy is None:
+            if is_alert:
+                await self._handle_alert(reading, severity, detection)
+        else:
+            transition = self.alert_policy.update(
+                severity, self.threshold_distance(value), time.monotonic()
+            )
+            if transition == RESOLVE:
+                await self._handle_resolved(reading)
+            elif transition is not None:
+                # Notify at the incident's severity, which a persisting
+                # incident may have escalated past the reading's
+                await self._handle_alert(
+                    reading, self.alert_policy.severity, detection, transition
+                )
 
         # Call callbacks
         for callback in self._on_reading_callbacks:
@@ -212,37 +394,87 @@ class BaseSensor(ABC):
 
         return reading
 
-    async def _handle_alert(self, reading: Reading, severity: AlertSeverity) -> None:
-        """Handle an alert condition."""
-        message = self.get_alert_message(reading.value, severity)
+    def _run_detectors(self, value: float) -> Optional[Detection]:
+        """Feed every detector and return the first detection, if any."""
+        now = time.monotonic()
+        first = None
+        for detector in self.detectors:
+            detection = detector.update(value, now)
+            if first is None:
+                first = detection
+        return first
+
+    async def _handle_alert(
+        self,
+        reading: Reading,
+        severity: AlertSeverity,
+        detection: Optional[Detection] = None,
+        transition: str = OPEN,
+    ) -> None:
+        """
+        Handle an alert condition.
+
+        OPEN inserts the incident's alert row and emits ``ALERT_TRIGGERED``.
+        ESCALATE and RENOTIFY update that row in place and emit
+        ``ALERT_ESCALATED`` / ``ALERT_RENOTIFIED``.
+        """
+        if detection is not None:
+            message = self.get_early_warning_message(reading.value, detection)
+        else:
+            message = self.get_alert_message(reading.value, severity)
 
         logger.warning(
             f"ALERT [{self.sensor_id}]: {severity.value.upper()} - "
             f"{reading.value:.1f} {self.unit} - {message}"
+            + (f" ({transition})" if transition != OPEN else "")
         )
 
-        # Log alert to database
-        await self._db.log_alert(
-            sensor_id=self.sensor_id,
-            sensor_type=self.sensor_type,
-            value=reading.value,
-            threshold=self.threshold,
-            severity=severity,
-            message=message,
-        )
-
-        # Emit alert event
-        await emit_alert(
-            sensor_id=self.sensor_id,
-            sensor_type=self.sensor_type.value,
-            value=reading.value,
-            threshold=self.threshold,
-            severity=severity.value,
-            message=message,
-        )
-
-        # Call alert-specific action
-        await self._on_alert(reading.value, severity)
+        if transition == OPEN:
+            # Log alert to database
+            await self._db.record_alert(
+                sensor_id=self.sensor_id,
+                sensor_type=self.sensor_type,
+                value=reading.value,
+                threshold=self.threshold,
+                severity=severity,
+                message=message,
+            )
+
+            # Emit alert event
+            await emit_alert(
+                sensor_id=self.sensor_id,
+                sensor_type=self.sensor_type.value,
+                value=reading.value,
+                threshold=self.threshold,
+                severity=severity.value,
+                message=message,
+            )
+        else:
+            await self._db.update_open_alert(
+                sensor_id=self.sensor_id,
+                value=reading.value,
+                severity=severity,
+                message=message,
+            )
+            if transition == ESCALATE:
+                await emit_alert_escalated(
+                    sensor_id=self.sensor_id,
+                    sensor_type=self.sensor_type.value,
+                    value=reading.value,
+                    threshold=self.threshold,
+                    severity=severity.value,
+                    previous_severity=self.alert_policy.previous_severity.value,
+                    message=message,
+                )
+            elif transition == RENOTIFY:
+                await emit_alert_renotified(
+                    sensor_id=self.sensor_id,
+                    sensor_type=self.sensor_type.value,
+                    value=reading.value,
+                    threshold=self.threshold,
+                    severity=severity.value,
+                    message=message,
+                )
 
         # Call alert callbacks
         for callback in self._on_alert_callbacks:
@@ -253,10 +485,30 @@ class BaseSensor(ABC):
             except Exception as e:
                 logger.error(f"Error in alert callback: {e}")
 
+    async def _handle_resolved(self, reading: Reading) -> None:
+        """Handle the end of an alert incident."""
+        message = (
+            f"{self.sensor_type.value.replace('_', ' ').capitalize()} back to normal "
+            f"({reading.value:.1f} {self.unit})."
+        )
+        logger.info(f"RESOLVED [{self.sensor_id}]: {message}")
+
+        await self._db.resolve_alerts(self.sensor_id)
+        await emit_alert_resolved(
+            sensor_id=self.sensor_id,
+            sensor_type=self.sensor_type.value,
+            value=reading.value,
+            severity=self.alert_policy.last_severity.value,
+            message=message,
+        )
+
     async def _on_alert(self, value: float, severity: AlertSeverity) -> None:
         """
         Override in subclasses to perform sensor-specific alert actions.
         For example, triggering automatic valve shutoff.
+        
+        Called for every alerting reading, not only when the alert policy
+        notifies, so actions must be idempotent.
         """
         pass
 
@@ -286,6 +538,16 @@ class BaseSensor(ABC):
 
             await asyncio.sleep(self.sample_interval)
 
+    def reading_event(self, reading: Reading) -> Event:
+        """Build the SENSOR_READING event for a reading."""
+        return sensor_reading_event(
+            sensor_id=self.sensor_id,
+            sensor_type=self.sensor_type.value,
+            value=reading.value,
+            unit=self.unit,
+            is_alert=reading.is_alert,
+        )
+
     def stop_monitoring(self) -> None:
         """Stop the monitoring loop."""
         self.is_monitoring = False
@@ -297,36 +559,22 @@ class BaseSensor(ABC):
 
     def get_average(self, last_n: int = 10) -> float:
         """Get average value from recent readings."""
-        if not self.readings:
-            return 0.0
-        recent = self.readings[-last_n:]
-        return sum(r.value for r in recent) / len(recent)
+        return self.readings.mean(last_n)
 
     def get_min(self, last_n: int = 10) -> float:
         """Get minimum value from recent readings."""
-        if not self.readings:
-            return 0.0
-        recent = self.readings[-last_n:]
-        return min(r.value for r in recent)
+        return self.readings.min(last_n)
 
     def get_max(self, last_n: int = 10) -> float:
         """Get maximum value from recent readings."""
-        if not self.readings:
-            return 0.0
-        recent = self.readings[-last_n:]
-        return max(r.value for r in recent)
+        return self.readings.max(last_n)
 
     def get_trend(self, last_n: int = 10) -> str:
         """Determine trend direction from recent readings."""
         if len(self.readings) < 2:
             return "stable"
 
-        recent = self.readings[-last_n:]
-        first_half = recent[: len(recent) // 2]
-        second_half = recent[len(recent) // 2 :]
-
-        first_avg = sum(r.value for r in first_half) / len(first_half)
-        second_avg = sum(r.value for r in second_half) / len(second_half)
+        first_avg, second_avg = self.readings.half_means(last_n)
 
         diff_percent = ((second_avg - first_avg) / first_avg) * 100 if first_avg else 0
 
@@ -340,6 +588,11 @@ class BaseSensor(ABC):
     # CALLBACKS
     # =========================================================================
 
+    def attach_detector(self, detector: StreamingDetector) -> StreamingDetector:
+        """Feed every reading to a detector; its detections raise warnings."""
+        self.detectors.append(detector)
+        return detector
+
     def on_alert(self, callback: Callable[[Reading], Any]) -> None:
         """Register a callback for alert events."""
         self._on_alert_callbacks.append(callback)
@@ -359,6 +612,7 @@ class BaseSensor(ABC):
             "sensor_type": self.sensor_type.value,
             "is_monitoring": self.is_monitoring,
             "simulation_mode": self.simulation_mode,
+            "io_bus": self.io_bus if self.blocking_read else None,
             "threshold": self.threshold,
             "unit": self.unit,
             "last_value": self.last_value,
@@ -368,4 +622,222 @@ class BaseSensor(ABC):
             "consecutive_alerts": self.consecutive_alerts,
             "average": self.get_average(),
             "trend": self.get_trend(),
+            "sample_interval": self.sample_interval,
+            "adaptive_sampling": (
+                self.sampling_policy.get_status() if self.sampling_policy else None
+            ),
+            "detectors": [detector.get_status() for detector in self.detectors],
+            "alert_policy": self.alert_policy.get_status() if self.alert_policy else None,
         }
+
+
+# =============================================================================
+# EDGE-TRIGGERED SENSORS
+# =============================================================================
+
+
+class EdgeTriggeredSensor(BaseSensor):
+    """
+    Base class for digital sensors that report on pin changes.
+
+    Instead of being polled every sample interval, the sensor registers an
+    edge callback with its GPIO backend. The callback runs on the GPIO
+    thread, samples the pin level there and hands it to the event loop with
+    ``call_soon_threadsafe``; the loop then takes a reading for each change
+    in order. Nothing runs between changes, and a change is processed as
+    soon as the loop gets to it rather than at the next poll.
+
+    Edges that do not change the level (contact bounce, or a rising and
+    falling edge arriving out of order) are counted and dropped.
+
+    Without a GPIO backend (simulation mode with no ``gpio`` given) the
+    sensor falls back to being polled like any other.
+
+    Subclasses must implement:
+        - value_for_level(): Reading value for a pin level
+        - simulate_value(): Value when polled without hardware
+    """
+
+    def __init__(
+        self,
+        sensor_id: str,
+        sensor_type: SensorType,
+        threshold: float,
+        unit: str,
+        gpio_pin: int,
+        edge: str = EDGE_BOTH,
+        pull: Optional[str] = None,
+        bouncetime_ms: int = 0,
+        gpio: Optional[GPIOBackend] = None,
+        sample_interval: float = 2.0,
+        simulation_mode: bool = False,
+        history_size: Optional[int] = None,
+    ):
+        super().__init__(
+            sensor_id=sensor_id,
+            sensor_type=sensor_type,
+            threshold=threshold,
+            unit=unit,
+            sample_interval=sample_interval,
+            simulation_mode=simulation_mode,
+            history_size=history_size,
+        )
+
+        self.gpio_pin = gpio_pin
+        self.edge = edge
+        self.pull = pull
+        self.bouncetime_ms = bouncetime_ms
+
+        self.level = 0
+        self._level_in_process = 0
+        self._gpio: Optional[GPIOBackend] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._edges: Deque[Tuple[int, float]] = deque()
+        self._drain: Optional[asyncio.Task] = None
+
+        # Statistics (seconds)
+        self.edges = 0
+        self.suppressed_edges = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+
+        if gpio is not None:
+            self._attach(gpio)
+        elif not self.simulation_mode:
+            self._init_gpio()
+
+    def _init_gpio(self) -> None:
+        """Attach to RPi.GPIO, or fall back to simulation."""
+        try:
+            from .gpio import RPiGPIO
+
+            self._attach(RPiGPIO())
+            logger.info(f"GPIO initialized for {self.sensor_id}: pin={self.gpio_pin}")
+        except ImportError:
+            logger.warning("RPi.GPIO not available, using simulation mode")
+            self.simulation_mode = True
+        except Exception as e:
+            logger.error(f"GPIO init failed: {e}")
+            self.simulation_mode = True
+
+    def _attach(self, gpio: GPIOBackend) -> None:
+        gpio.setup_input(self.gpio_pin, self.pull)
+        self._gpio = gpio
+        self.level = self._level_in_process = gpio.read(self.gpio_pin)
+        if self.alert_policy is not None:
+            # Each reading is a level that holds until the next edge, so one
+            # reading opens or ends an incident
+            self.alert_policy.enter_samples = 1
+            self.alert_policy.exit_samples = 1
+            self.alert_policy.min_dwell_seconds = 0.0
+
+    @property
+    def edge_triggered(self) -> bool:
+        """True when readings come from pin changes rather than polling."""
+        return self._gpio is not None
+
+    # =========================================================================
+    # ABSTRACT METHODS - Must be implemented by subclasses
+    # =========================================================================
+
+    @abstractmethod
+    def value_for_level(self, level: int) -> float:
+        """Convert a pin level (0 or 1) to a reading value."""
+        pass
+
+    @abstractmethod
+    def simulate_value(self) -> float:
+        """Produce a value when polled in simulation mode."""
+        pass
+
+    def read_value(self) -> float:
+        """Value for the pin level being processed (or the live pin if not armed)."""
+        if self._gpio is None:
+            return self.simulate_value()
+        if self._loop is None:
+            return self.value_for_level(self._gpio.read(self.gpio_pin))
+        return self.value_for_level(self._level_in_process)
+
+    # =========================================================================
+    # EDGE DELIVERY
+    # =========================================================================
+
+    def arm(self) -> None:
+        """Start taking readings on pin changes. Must be called on the event loop."""
+        if self._gpio is None:
+            raise RuntimeError(f"{self.sensor_id} has no GPIO backend to arm")
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self.level = self._level_in_process = self._gpio.read(self.gpio_pin)
+        self._gpio.add_edge_callback(
+            self.gpio_pin, self.edge, self._on_interrupt, self.bouncetime_ms
+        )
+        self.is_monitoring = True
+        logger.info(f"Edge detection armed for {self.sensor_id} (pin {self.gpio_pin})")
+
+    def disarm(self) -> None:
+        """Stop edge detection. Readings already queued still complete."""
+        if self._loop is None:
+            return
+        self._gpio.remove_edge_callback(self.gpio_pin)
+        self._loop = None
+        self.is_monitoring = False
+
+    def stop_monitoring(self) -> None:
+        """Stop polling or edge detection."""
+        self.disarm()
+        super().stop_monitoring()
+
+    def _on_interrupt(self, pin: int) -> None:
+        # GPIO thread: sample the level now, process it on the loop
+        loop = self._loop
+        if loop is None:
+            return
+        level = self._gpio.read(pin)
+        try:
+            loop.call_soon_threadsafe(self._on_edge, level, time.perf_counter())
+        except RuntimeError:
+            pass  # Loop closed during shutdown
+
+    def _on_edge(self, level: int, at: float) -> None:
+        if self._loop is None:
+            return
+        self.edges += 1
+        if level == self.level:
+            self.suppressed_edges += 1
+            return
+        self.level = level
+        self._edges.append((level, at))
+        if self._drain is None or self._drain.done():
+            self._drain = self._loop.create_task(
+                self._drain_edges(), name=f"edges_{self.sensor_id}"
+            )
+
+    async def _drain_edges(self) -> None:
+        """Take one reading per level change, in the order they happened."""
+        while self._edges:
+            level, at = self._edges.popleft()
+            self._level_in_process = level
+            try:
+                await self.take_reading()
+            except Exception as e:
+                logger.error(f"Error reading sensor {self.sensor_id}: {e}")
+            latency = time.perf_counter() - at
+            self.last_latency = latency
+            if latency > self.max_latency:
+                self.max_latency = latency
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get current sensor status with edge statistics."""
+        status = super().get_status()
+        status.update({
+            "edge_triggered": self.edge_triggered,
+            "gpio_pin": self.gpio_pin,
+            "level": self.level,
+            "edges": self.edges,
+            "suppressed_edges": self.suppressed_edges,
+            "last_edge_latency_ms": round(self.last_latency * 1000, 3),
+            "max_edge_latency_ms": round(self.max_latency * 1000, 3),
+        })
+        return status
@@ -0,0 +1,293 @@
+"""
+LUXX HAUS Batch Evaluation
+Converts and classifies ADC voltages for many sensors at once with NumPy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+from loguru import logger
+
+from ..core import AlertSeverity, get_config, get_io_executor
+from .adc import MCP3008_MAX_COUNT
+from .calibration import CalibrationTable
+
+try:
+    import numpy as np
+except ImportError:  # Batch evaluation is optional; sensors fall back to scalar reads
+    np = None
+
+if TYPE_CHECKING:
+    from .base import BaseSensor, Reading
+
+
+_SEVERITIES = (AlertSeverity.WARNING, AlertSeverity.DANGER, AlertSeverity.CRITICAL)
+
+RISING = "rising"  # higher values are worse (gas, smoke)
+FALLING = "falling"  # lower values are worse (water pressure)
+
+
+# =============================================================================
+# CONVERSIONS
+# =============================================================================
+
+
+class MQCurve(NamedTuple):
+    """
+    MQ-series gas sensor: voltage -> Rs/R0 ratio -> PPM.
+
+    The datasheet curve ``PPM = 10^((log10(ratio) - intercept) / slope)``
+    is stored as ``PPM = coeff * ratio^exponent`` so one pow per sample
+    replaces a log10 and a pow.
+    """
+
+    vref: float
+    r_load: float
+    r0: float
+    exponent: float
+    coeff: float
+
+    @classmethod
+    def from_datasheet(
+        cls, slope: float, intercept: float, r_load: float, r0: float, vref: float = 3.3
+    ) -> "MQCurve":
+        return cls(vref, r_load, r0, 1.0 / slope, 10.0 ** (-intercept / slope))
+
+    def ppm_from_ratio(self, ratio: float) -> float:
+        if ratio <= 0:
+            return 0.0
+        return self.coeff * ratio ** self.exponent
+
+    def convert(self, voltage: float) -> float:
+        if voltage < 0.1:
+            return 0.0
+        ratio = (self.vref - voltage) / voltage * self.r_load / self.r0
+        return max(0.0, self.ppm_from_ratio(ratio))
+
+
+class LinearScale(NamedTuple):
+    """Linear transducer: ``clamp((voltage - offset) * gain, low, high)``."""
+
+    offset: float
+    gain: float
+    low: float
+    high: float
+
+    def convert(self, voltage: float) -> float:
+        return max(self.low, min(self.high, (voltage - self.offset) * self.gain))
+
+
+class ThresholdBands(NamedTuple):
+    """Severity boundaries, checked critical first like check_threshold()."""
+
+    direction: str
+    warning: float
+    danger: float
+    critical: float
+
+
+class BatchSpec(NamedTuple):
+    conversion: Union[MQCurve, LinearScale, CalibrationTable]
+    bands: ThresholdBands
+
+
+# =============================================================================
+# EVALUATOR
+# =============================================================================
+
+
+class _Group:
+    """Parameter arrays for sensors sharing a conversion kind and direction."""
+
+    def __init__(self, kind: type, direction: str, indexes: List[int], specs: List[BatchSpec]):
+        self.kind = kind
+        self.direction = direction
+        self.indexes = np.array(indexes, dtype=np.intp)
+        if kind is CalibrationTable:
+            # One lookup row per sensor, indexed by ADC counts
+            self.tables = np.stack([spec.conversion.array for spec in specs])
+            self.rows = np.arange(len(specs))
+            self.params = np.array([[spec.conversion.vref for spec in specs]], dtype=np.float64)
+        else:
+            conversions = np.array([spec.conversion for spec in specs], dtype=np.float64)
+            self.params = conversions.T  # one row per NamedTuple field
+        bands = np.array([spec.bands[1:] for spec in specs], dtype=np.float64)
+        self.warning, self.danger, self.critical = bands.T
+
+    def convert(self, voltages: "np.ndarray") -> "np.ndarray":
+        if self.kind is CalibrationTable:
+            (vref,) = self.params
+            counts = np.rint(voltages * MCP3008_MAX_COUNT / vref).astype(np.intp)
+            return self.tables[self.rows, np.clip(counts, 0, MCP3008_MAX_COUNT)]
+
+        if self.kind is MQCurve:
+            vref, r_load, r0, exponent, coeff = self.params
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = (vref - voltages) / voltages * r_load / r0
+                ppm = coeff * np.power(ratio, exponent)
+            ppm = np.where((voltages < 0.1) | (ratio <= 0), 0.0, ppm)
+            return np.maximum(ppm, 0.0)
+
+        offset, gain, low, high = self.params
+        return np.clip((voltages - offset) * gain, low, high)
+
+    def classify(self, values: "np.ndarray") -> "np.ndarray":
+        """Severity codes: -1 none, else an index into _SEVERITIES."""
+        if self.direction == RISING:
+            conditions = [values >= self.critical, values >= self.danger, values >= self.warning]
+        else:
+            conditions = [values < self.critical, values < self.danger, values < self.warning]
+        return np.select(conditions, [2, 1, 0], default=-1)
+
+
+class BatchEvaluator:
+    """
+    Evaluates a sampling round's ADC sensors in a few array operations.
+
+    ``partition()`` picks out the sensors that can be batched: reading
+    real hardware through a shared ADC and exposing a ``batch_spec()``. For
+    those, ``take_readings()`` reads every voltage in one I/O call per bus
+    (one MCP3008 sweep per chip), converts them to PPM/PSI and classifies
+    severity against per-sensor threshold arrays, then hands each sensor
+    its value and severity via ``process_reading()``.
+
+    Parameter arrays are rebuilt only when a sensor's spec changes
+    (membership, calibration or thresholds).
+    """
+
+    def __init__(self, min_sensors: int = 8):
+        self.min_sensors = min_sensors
+        self._cache: Dict[Tuple[int, ...], Tuple[Tuple[BatchSpec, ...], List[_Group]]] = {}
+
+        # Stats
+        self.rounds = 0
+        self.evaluated = 0
+        self.rebuilds = 0
+
+    @property
+    def available(self) -> bool:
+        return np is not None
+
+    def partition(
+        self, sensors: Sequence["BaseSensor"]
+    ) -> Tuple[List["BaseSensor"], List["BaseSensor"]]:
+        """Split sensors into (batched, read one at a time)."""
+        if np is None or len(sensors) < self.min_sensors:
+            return [], list(sensors)
+
+        batched, single = [], []
+        for sensor in sensors:
+            if (
+                getattr(sensor, "_adc", None) is not None
+                and not sensor.simulation_mode
+                and sensor.batch_spec() is not None
+            ):
+                batched.append(sensor)
+            else:
+                single.append(sensor)
+
+        if len(batched) < self.min_sensors:
+            return [], list(sensors)
+        return batched, single
+
+    def _groups(self, sensors: Sequence["BaseSensor"]) -> List[_Group]:
+        key = tuple(id(sensor) for sensor in sensors)
+        specs = tuple(sensor.batch_spec() for sensor in sensors)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == specs:
+            return cached[1]
+
+        by_kind: Dict[Tuple[type, str], Tuple[List[int], List[BatchSpec]]] = {}
+        for index, spec in enumerate(specs):
+            indexes, group_specs = by_kind.setdefault(
+                (type(spec.conversion), spec.bands.direction), ([], [])
+            )
+            indexes.append(index)
+            group_specs.append(spec)
+
+        groups = [
+            _Group(kind, direction, indexes, group_specs)
+            for (kind, direction), (indexes, group_specs) in by_kind.items()
+        ]
+        if len(self._cache) >= 32:
+            self._cache.clear()  # sensor set changed a lot; start over
+        self._cache[key] = (specs, groups)
+        self.rebuilds += 1
+        return groups
+
+    def evaluate(
+        self, sensors: Sequence["BaseSensor"], voltages: "np.ndarray"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Convert voltages and classify them.
+
+        Returns:
+            (values, severity codes); codes are -1 for no alert, otherwise
+            0/1/2 for warning/danger/critical
+        """
+        values = np.zeros(len(sensors), dtype=np.float64)
+        codes = np.full(len(sensors), -1, dtype=np.int8)
+        for group in self._groups(sensors):
+            converted = group.convert(voltages[group.indexes])
+            values[group.indexes] = converted
+            codes[group.indexes] = group.classify(converted)
+        return values, codes
+
+    async def take_readings(
+        self, sensors: Sequence["BaseSensor"]
+    ) -> List[Union["Reading", BaseException]]:
+        """Read, evaluate and process a batch; results are in sensor order."""
+        if not sensors:
+            return []
+
+        voltages = await self._read_voltages(sensors)
+        failed = np.isnan(voltages)
+        values, codes = self.evaluate(sensors, np.where(failed, 0.0, voltages))
+
+        self.rounds += 1
+        self.evaluated += len(sensors)
+
+        coros = []
+        for sensor, value, code, bad in zip(sensors, values.tolist(), codes.tolist(), failed.tolist()):
+            if bad:
+                # Same fallback as the scalar read path
+                value = sensor.last_value or 0.0
+                coros.append(sensor.process_reading(value, emit=False))
+            else:
+                severity = _SEVERITIES[code] if code >= 0 else None
+                coros.append(sensor.process_reading(value, emit=False, severity=severity))
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    async def _read_voltages(self, sensors: Sequence["BaseSensor"]) -> "np.ndarray":
+        """One I/O call per bus; a failed channel reads as NaN."""
+        voltages = np.empty(len(sensors), dtype=np.float64)
+        by_bus: Dict[str, List[int]] = {}
+        for index, sensor in enumerate(sensors):
+            by_bus.setdefault(sensor.io_bus, []).append(index)
+
+        def read(indexes: List[int]) -> None:
+            for index in indexes:
+                try:
+                    voltages[index] = sensors[index]._adc.voltage
+                except Exception as e:
+                    logger.error(f"Error reading {sensors[index].sensor_id}: {e}")
+                    voltages[index] = np.nan
+
+        if get_config().io.offload_reads:
+            executor = get_io_executor()
+            await asyncio.gather(*(executor.run(bus, read, indexes) for bus, indexes in by_bus.items()))
+        else:
+            for indexes in by_bus.values():
+                read(indexes)
+        return voltages
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "available": self.available,
+            "min_sensors": self.min_sensors,
+            "rounds": self.rounds,
+            "evaluated": self.evaluated,
+            "rebuilds": self.rebuilds,
+        }
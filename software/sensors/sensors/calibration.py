@@ -0,0 +1,276 @@
+"""
+LUXX HAUS Gas Sensor Calibration
+Compiles MQ-series calibration data into lookup tables indexed by ADC counts.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from loguru import logger
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from ..core import GasType
+from ..core.config import CalibrationConfig
+from .adc import MCP3008_MAX_COUNT
+
+try:
+    import numpy as np
+except ImportError:  # Tables still work as plain tuples
+    np = None
+
+# Ambient conditions MQ datasheet curves are measured at
+REFERENCE_TEMPERATURE_C = 20.0
+REFERENCE_HUMIDITY = 65.0
+
+# Below this output the heater/load circuit is not producing a usable signal
+MIN_SENSOR_VOLTAGE = 0.1
+
+
+def _interp(x: float, xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Piecewise-linear interpolation, extrapolating from the end segments."""
+    i = min(max(bisect_right(xs, x), 1), len(xs) - 1)
+    x0, x1 = xs[i - 1], xs[i]
+    y0, y1 = ys[i - 1], ys[i]
+    return y0 + (x - x0) * (y1 - y0) / (x1 - x0)
+
+
+# =============================================================================
+# CALIBRATION DATA
+# =============================================================================
+
+
+class Compensation(NamedTuple):
+    """
+    Rs/R0 drift with ambient temperature and humidity.
+
+    MQ datasheets plot the clean-air Rs/R0 against temperature at a low and
+    a high relative humidity. Factors are interpolated in temperature
+    (clamped to the plotted range) and then between the two humidity curves,
+    and reported relative to the 20°C / 65%RH reference the gas curves were
+    measured at.
+    """
+
+    temperatures_c: Tuple[float, ...]
+    low_humidity: float
+    low_factors: Tuple[float, ...]
+    high_humidity: float
+    high_factors: Tuple[float, ...]
+
+    def _raw(self, temperature_c: float, humidity: float) -> float:
+        temps = self.temperatures_c
+        t = min(max(temperature_c, temps[0]), temps[-1])
+        low = _interp(t, temps, self.low_factors)
+        high = _interp(t, temps, self.high_factors)
+        span = self.high_humidity - self.low_humidity
+        weight = min(max((humidity - self.low_humidity) / span, 0.0), 1.0) if span else 0.0
+        return low + (high - low) * weight
+
+    def factor(self, temperature_c: float, humidity: float) -> float:
+        """Rs/R0 multiplier at these conditions (1.0 at the reference)."""
+        return self._raw(temperature_c, humidity) / self._raw(
+            REFERENCE_TEMPERATURE_C, REFERENCE_HUMIDITY
+        )
+
+
+# Typical MQ-4/MQ-6/MQ-7 "Rs/R0 vs temperature" curves at 33% and 85% RH
+MQ_COMPENSATION = Compensation(
+    temperatures_c=(-10.0, 0.0, 10.0, 20.0, 30.0, 40.0, 50.0),
+    low_humidity=33.0,
+    low_factors=(1.32, 1.22, 1.12, 1.04, 0.98, 0.94, 0.91),
+    high_humidity=85.0,
+    high_factors=(1.16, 1.07, 0.99, 0.92, 0.87, 0.84, 0.81),
+)
+
+
+class GasCalibration(BaseModel):
+    """
+    Calibration of one MQ sensor.
+
+    ``points`` are (PPM, Rs/R0) pairs from the manufacturer's sensitivity
+    curve or a field calibration. PPM is interpolated piecewise-linearly in
+    log-log space between them; two points reproduce the classic
+    single-slope datasheet fit exactly.
+    """
+
+    gas_type: GasType
+    r0: float = Field(default=10.0, gt=0)  # kOhm in clean air
+    r_load: float = Field(default=10.0, gt=0)  # kOhm
+    vref: float = Field(default=3.3, gt=0)
+    points: List[Tuple[float, float]] = Field(min_length=2)
+    compensation: Optional[Compensation] = MQ_COMPENSATION
+
+    @field_validator("points")
+    @classmethod
+    def validate_points(cls, v: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        if any(ppm <= 0 or ratio <= 0 for ppm, ratio in v):
+            raise ValueError("Calibration points must have positive PPM and Rs/R0")
+        ratios = sorted(ratio for _, ratio in v)
+        if len(set(ratios)) != len(ratios):
+            raise ValueError("Calibration points must have distinct Rs/R0 values")
+        return sorted(v, key=lambda point: point[1])
+
+    @classmethod
+    def from_datasheet(
+        cls,
+        gas_type: GasType,
+        slope: float,
+        intercept: float,
+        **kwargs: Any,
+    ) -> "GasCalibration":
+        """Two-point calibration on the line ``log10(Rs/R0) = slope*log10(PPM) + intercept``."""
+        points = [(ppm, 10 ** (slope * math.log10(ppm) + intercept)) for ppm in (10.0, 10000.0)]
+        return cls(gas_type=gas_type, points=points, **kwargs)
+
+    def ppm_from_ratio(self, ratio: float) -> float:
+        """PPM for a (compensated) Rs/R0 ratio."""
+        if ratio <= 0:
+            return 0.0
+        log_ratios = [math.log10(r) for _, r in self.points]
+        log_ppms = [math.log10(ppm) for ppm, _ in self.points]
+        return 10 ** _interp(math.log10(ratio), log_ratios, log_ppms)
+
+
+# =============================================================================
+# LOOKUP TABLES
+# =============================================================================
+
+
+class CalibrationTable:
+    """
+    PPM for every MCP3008 count, for one calibration and ambient condition.
+
+    Compiling walks all 1024 counts through voltage -> Rs -> Rs/R0 ->
+    compensation -> curve once, so a read is ``table[counts]``. Tables are
+    immutable; recalibration builds a new one and swaps the reference.
+    """
+
+    __slots__ = ("calibration", "temperature_c", "humidity", "ppm", "_array")
+
+    def __init__(
+        self,
+        calibration: GasCalibration,
+        ppm: Sequence[float],
+        temperature_c: float = REFERENCE_TEMPERATURE_C,
+        humidity: float = REFERENCE_HUMIDITY,
+    ):
+        if len(ppm) != MCP3008_MAX_COUNT + 1:
+            raise ValueError(f"Calibration table needs {MCP3008_MAX_COUNT + 1} entries, got {len(ppm)}")
+        self.calibration = calibration
+        self.temperature_c = temperature_c
+        self.humidity = humidity
+        self.ppm: Tuple[float, ...] = tuple(ppm)
+        self._array = None
+
+    @classmethod
+    def compile(
+        cls,
+        calibration: GasCalibration,
+        temperature_c: float = REFERENCE_TEMPERATURE_C,
+        humidity: float = REFERENCE_HUMIDITY,
+    ) -> "CalibrationTable":
+        vref = calibration.vref
+        scale = calibration.r_load / calibration.r0
+        if calibration.compensation is not None:
+            scale /= calibration.compensation.factor(temperature_c, humidity)
+
+        ppm = []
+        for counts in range(MCP3008_MAX_COUNT + 1):
+            voltage = counts * vref / MCP3008_MAX_COUNT
+            if voltage < MIN_SENSOR_VOLTAGE:
+                ppm.append(0.0)
+                continue
+            ratio = (vref - voltage) / voltage * scale
+            ppm.append(max(0.0, calibration.ppm_from_ratio(ratio)))
+        return cls(calibration, ppm, temperature_c, humidity)
+
+    @property
+    def vref(self) -> float:
+        return self.calibration.vref
+
+    def __getitem__(self, counts: int) -> float:
+        return self.ppm[counts]
+
+    def convert(self, voltage: float) -> float:
+        """PPM for a voltage, via the nearest count."""
+        counts = round(voltage * MCP3008_MAX_COUNT / self.vref)
+        return self.ppm[min(max(counts, 0), MCP3008_MAX_COUNT)]
+
+    @property
+    def array(self) -> "np.ndarray":
+        """The table as a NumPy array, for batch evaluation."""
+        if self._array is None:
+            self._array = np.array(self.ppm, dtype=np.float64)
+        return self._array
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calibration": self.calibration.model_dump(mode="json"),
+            "temperature_c": self.temperature_c,
+            "humidity": self.humidity,
+            "ppm": list(self.ppm),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CalibrationTable":
+        return cls(
+            GasCalibration.model_validate(data["calibration"]),
+            data["ppm"],
+            data["temperature_c"],
+            data["humidity"],
+        )
+
+
+# =============================================================================
+# PERSISTENCE
+# =============================================================================
+
+
+class CalibrationStore:
+    """
+    One JSON file per sensor holding its calibration and compiled table.
+
+    Files are written to a temporary name and renamed into place, so a
+    crash mid-save leaves the previous calibration intact.
+    """
+
+    def __init__(self, directory: str | Path, enabled: bool = True):
+        self.directory = Path(directory)
+        self.enabled = enabled
+
+    @classmethod
+    def from_config(cls, config: CalibrationConfig) -> "CalibrationStore":
+        return cls(config.directory, enabled=config.persist)
+
+    def path(self, sensor_id: str) -> Path:
+        return self.directory / f"{sensor_id}.json"
+
+    def load(self, sensor_id: str) -> Optional[CalibrationTable]:
+        """Load a sensor's saved table, or None if there is none or it is unreadable."""
+        if not self.enabled:
+            return None
+        path = self.path(sensor_id)
+        try:
+            with open(path, "r") as f:
+                return CalibrationTable.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable calibration {path}: {e}")
+            return None
+
+    def save(self, sensor_id: str, table: CalibrationTable) -> None:
+        if not self.enabled:
+            return
+        path = self.path(sensor_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(table.to_dict(), f)
+        os.replace(tmp, path)
+        logger.info(f"Saved calibration for {sensor_id} to {path}")
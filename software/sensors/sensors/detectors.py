@@ -0,0 +1,282 @@
+"""
+LUXX HAUS Streaming Detectors
+Incremental trend and change detectors that warn before a threshold is crossed.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, NamedTuple, Optional
+
+from ..core.config import EarlyWarningConfig
+from .batch import FALLING, RISING
+
+BOTH = "both"
+
+
+class Detection(NamedTuple):
+    """A detector firing on a reading."""
+
+    detector: str  # "rate", "ewma" or "cusum"
+    score: float  # signed: positive means the value is moving up
+    limit: float
+
+    def describe(self, unit: str) -> str:
+        """Short phrase for alert messages, e.g. "falling at 7.2 PSI/min"."""
+        direction = "rising" if self.score > 0 else "falling"
+        if self.detector == "rate":
+            return f"{direction} at {abs(self.score):.1f} {unit}/min"
+        if self.detector == "ewma":
+            side = "above" if self.score > 0 else "below"
+            return f"{abs(self.score):.1f} standard deviations {side} its recent average"
+        return f"steadily {direction} away from its baseline"
+
+
+class StreamingDetector(ABC):
+    """
+    Base class for O(1)-per-sample detectors.
+
+    Subclasses turn each sample into a signed score in ``_update()``. The
+    base class handles the rest: no detections during the first
+    ``warmup_samples`` (statistics are still settling), then a detection
+    once the score has been past ``limit`` in ``direction`` for
+    ``confirm_samples`` readings in a row, and on every reading after that
+    until it comes back.
+    """
+
+    name = ""
+
+    def __init__(
+        self,
+        limit: float,
+        direction: str = BOTH,
+        warmup_samples: int = 10,
+        confirm_samples: int = 1,
+    ):
+        if direction not in (RISING, FALLING, BOTH):
+            raise ValueError(f"Invalid direction: {direction}")
+        self.limit = limit
+        self.direction = direction
+        self.warmup_samples = warmup_samples
+        self.confirm_samples = confirm_samples
+
+        self.samples = 0
+        self.score = 0.0
+        self._run = 0
+
+        # Stats
+        self.detections = 0
+
+    @abstractmethod
+    def _update(self, value: float, timestamp: float) -> float:
+        """Fold a sample into the running state and return its score."""
+
+    @abstractmethod
+    def _reset(self) -> None:
+        """Clear the running state."""
+
+    def _exceeds(self, score: float) -> bool:
+        if self.direction == RISING:
+            return score > self.limit
+        if self.direction == FALLING:
+            return score < -self.limit
+        return abs(score) > self.limit
+
+    def update(self, value: float, timestamp: float) -> Optional[Detection]:
+        """
+        Feed one sample.
+
+        Args:
+            value: Sensor reading
+            timestamp: Monotonic time of the reading, in seconds
+        """
+        self.score = self._update(value, timestamp)
+        self.samples += 1
+        if self.samples <= self.warmup_samples or not self._exceeds(self.score):
+            self._run = 0
+            return None
+
+        self._run += 1
+        if self._run < self.confirm_samples:
+            return None
+        self.detections += 1
+        return Detection(self.name, self.score, self.limit)
+
+    def reset(self) -> None:
+        self.samples = 0
+        self.score = 0.0
+        self._run = 0
+        self._reset()
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "detector": self.name,
+            "direction": self.direction,
+            "limit": self.limit,
+            "score": round(self.score, 4),
+            "samples": self.samples,
+            "detections": self.detections,
+        }
+
+
+class RateOfChangeDetector(StreamingDetector):
+    """
+    Smoothed rate of change, in units per minute.
+
+    Holt's linear smoothing with the time step in the update, so the
+    estimate stays correct when the sample interval changes: a level
+    tracks the value and a trend tracks the level's slope, each with
+    weight ``smoothing`` for the newest sample. Single-sample noise moves
+    the trend by only ``smoothing**2`` of its size.
+    """
+
+    name = "rate"
+
+    def __init__(self, limit: float, smoothing: float = 0.2, **kwargs: Any):
+        super().__init__(limit, **kwargs)
+        self.smoothing = smoothing
+        self._level: Optional[float] = None
+        self._trend = 0.0  # units per second
+        self._time = 0.0
+
+    def _update(self, value: float, timestamp: float) -> float:
+        if self._level is None:
+            self._level, self._time = value, timestamp
+            return 0.0
+
+        dt = timestamp - self._time
+        if dt <= 0:
+            return self._trend * 60.0
+        alpha = self.smoothing
+        predicted = self._level + self._trend * dt
+        level = predicted + alpha * (value - predicted)
+        self._trend += alpha * ((level - self._level) / dt - self._trend)
+        self._level, self._time = level, timestamp
+        return self._trend * 60.0
+
+    def _reset(self) -> None:
+        self._level = None
+        self._trend = 0.0
+
+
+class EWMADetector(StreamingDetector):
+    """
+    Deviation from an exponentially weighted mean, in standard deviations.
+
+    Mean and variance use the incremental form
+    ``diff = x - mean; mean += a*diff; var = (1 - a)*(var + a*diff**2)``,
+    which never subtracts two large sums and so keeps full precision on
+    long-running streams. Each sample is scored against the statistics
+    from before it. ``min_std`` is a noise floor for quantized, otherwise
+    flat signals.
+    """
+
+    name = "ewma"
+
+    def __init__(
+        self,
+        limit: float,
+        smoothing: float = 0.1,
+        min_std: float = 0.0,
+        **kwargs: Any,
+    ):
+        super().__init__(limit, **kwargs)
+        self.smoothing = smoothing
+        self.min_std = min_std
+        self.mean: Optional[float] = None
+        self.var = 0.0
+
+    def _zscore(self, value: float) -> float:
+        std = max(math.sqrt(self.var), self.min_std, 1e-12)
+        return (value - self.mean) / std
+
+    def _fold(self, value: float) -> None:
+        diff = value - self.mean
+        increment = self.smoothing * diff
+        self.mean += increment
+        self.var = (1.0 - self.smoothing) * (self.var + diff * increment)
+
+    def _update(self, value: float, timestamp: float) -> float:
+        if self.mean is None:
+            self.mean = value
+            return 0.0
+        score = self._zscore(value)
+        self._fold(value)
+        return score
+
+    def _reset(self) -> None:
+        self.mean = None
+        self.var = 0.0
+
+
+class CUSUMDetector(StreamingDetector):
+    """
+    Two-sided tabular CUSUM on standardized residuals.
+
+    Residuals are standardized against an EWMA baseline, so the detector
+    accumulates small persistent shifts that never look unusual sample by
+    sample. ``drift`` is the slack (in standard deviations) subtracted
+    each step, and ``limit`` the decision interval. The baseline only
+    learns while both sums are zero, so a shift cannot be absorbed before
+    it is detected; a lasting new level keeps detecting until ``reset()``.
+    """
+
+    name = "cusum"
+
+    def __init__(
+        self,
+        limit: float = 5.0,
+        drift: float = 0.5,
+        smoothing: float = 0.05,
+        min_std: float = 0.0,
+        **kwargs: Any,
+    ):
+        super().__init__(limit, **kwargs)
+        self.drift = drift
+        self._baseline = EWMADetector(limit, smoothing=smoothing, min_std=min_std)
+        self.upper = 0.0
+        self.lower = 0.0
+
+    def _update(self, value: float, timestamp: float) -> float:
+        baseline = self._baseline
+        if baseline.mean is None:
+            baseline.mean = value
+            return 0.0
+        if self.samples < self.warmup_samples:
+            baseline._fold(value)  # still learning the baseline
+            return 0.0
+
+        z = baseline._zscore(value)
+        self.upper = max(0.0, self.upper + z - self.drift)
+        self.lower = max(0.0, self.lower - z - self.drift)
+        if self.upper == 0.0 and self.lower == 0.0:
+            baseline._fold(value)
+        return self.upper if self.upper >= self.lower else -self.lower
+
+    def _reset(self) -> None:
+        self._baseline.reset()
+        self.upper = 0.0
+        self.lower = 0.0
+
+
+_DETECTORS = {
+    RateOfChangeDetector.name: RateOfChangeDetector,
+    EWMADetector.name: EWMADetector,
+    CUSUMDetector.name: CUSUMDetector,
+}
+
+
+def detector_from_config(config: EarlyWarningConfig) -> StreamingDetector:
+    """Build the detector an EarlyWarningConfig describes."""
+    kwargs: Dict[str, Any] = {
+        "direction": config.direction,
+        "warmup_samples": config.warmup_samples,
+        "confirm_samples": config.confirm_samples,
+        "smoothing": config.smoothing,
+    }
+    if config.detector != RateOfChangeDetector.name:
+        kwargs["min_std"] = config.min_std
+    if config.detector == CUSUMDetector.name:
+        kwargs["drift"] = config.drift
+    return _DETECTORS[config.detector](config.limit, **kwargs)
@@ -5,14 +5,23 @@ Detects gas leaks by monitoring PPM levels.
 
 from __future__ import annotations
 
-import math
 import random
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
 
 from loguru import logger
 
 from ..core import AlertSeverity, GasType, SensorType, get_config
+from .adc import get_adc
 from .base import BaseSensor
+from .batch import RISING, BatchSpec, ThresholdBands
+from .calibration import (
+    REFERENCE_HUMIDITY,
+    REFERENCE_TEMPERATURE_C,
+    CalibrationStore,
+    CalibrationTable,
+    GasCalibration,
+)
+from .detectors import Detection
 
 if TYPE_CHECKING:
     from ..controllers.gas_valve import GasValveController
@@ -46,6 +55,16 @@ GAS_THRESHOLDS = {
     },
 }
 
+# MQ sensor calibration curves (log-log slope, intercept) per gas.
+# These are approximations and only the default - load manufacturer
+# data with GasLeakSensor.calibrate_points().
+GAS_CURVES = {
+    GasType.NATURAL_GAS: (-0.35, 0.5),       # MQ-4 methane curve
+    GasType.PROPANE: (-0.42, 0.4),           # MQ-6 propane curve
+    GasType.CARBON_MONOXIDE: (-0.77, 0.6),   # MQ-7 CO curve
+    GasType.HYDROGEN_SULFIDE: (-0.44, 0.3),  # MQ-136 H2S curve
+}
+
 
 class GasLeakSensor(BaseSensor):
     """
@@ -61,6 +80,9 @@ class GasLeakSensor(BaseSensor):
         - Hydrogen Sulfide - MQ-136 sensor
     """
 
+    blocking_read = True  # MCP3008 over SPI
+    io_bus = "spi0"
+
     def __init__(
         self,
         sensor_id: str = "LUXX-GLD-001",
@@ -91,9 +113,18 @@ class GasLeakSensor(BaseSensor):
         self.auto_shutoff = config.auto_shutoff
         self.adc_channel = adc_channel
         
-        # MQ sensor calibration values
-        self.r_load = 10.0  # Load resistance in kOhm
-        self.r0 = 10.0  # Sensor resistance in clean air (calibrated)
+        # MQ sensor calibration, compiled to a per-count lookup table.
+        # A saved calibration for this sensor replaces the datasheet default.
+        calibration_config = get_config().sensors.calibration
+        self._calibration_store = CalibrationStore.from_config(calibration_config)
+        self._temperature_step = calibration_config.temperature_step_c
+        self._humidity_step = calibration_config.humidity_step
+        self._table: Optional[CalibrationTable] = self._load_table()
+        if self._table is not None:
+            self.calibration = self._table.calibration
+        else:
+            slope, intercept = GAS_CURVES.get(self.gas_type, GAS_CURVES[GasType.NATURAL_GAS])
+            self.calibration = GasCalibration.from_datasheet(self.gas_type, slope, intercept)
         
         # Hardware
         self._adc = None
@@ -103,16 +134,8 @@ class GasLeakSensor(BaseSensor):
     def _init_hardware(self) -> None:
         """Initialize hardware interfaces."""
         try:
-            import board
-            import busio
-            import adafruit_mcp3xxx.mcp3008 as MCP
-            from adafruit_mcp3xxx.analog_in import AnalogIn
-            from digitalio import DigitalInOut
-            
-            spi = busio.SPI(clock=board.SCK, MISO=board.MISO, MOSI=board.MOSI)
-            cs = DigitalInOut(board.D5)
-            mcp = MCP.MCP3008(spi, cs)
-            self._adc = AnalogIn(mcp, getattr(MCP, f"P{self.adc_channel}"))
+            # The ADC is shared with the other analog sensors on this bus
+            self._adc = get_adc(self.io_bus).channel(self.adc_channel)
             
             logger.info(f"Hardware initialized for {self.sensor_id}")
             
@@ -148,52 +171,125 @@ class GasLeakSensor(BaseSensor):
             return 0.0
         
         try:
-            voltage = self._adc.voltage
-            
-            if voltage < 0.1:
-                return 0.0
-            
-            # Calculate sensor resistance
-            rs = (3.3 - voltage) / voltage * self.r_load
-            ratio = rs / self.r0
-            
-            # Convert ratio to PPM using gas-specific curve
-            ppm = self._ratio_to_ppm(ratio)
-            
-            return max(0, ppm)
+            # Raw counts index straight into the compiled calibration
+            return self.table[self._adc.counts]
             
         except Exception as e:
             logger.error(f"Error reading gas sensor: {e}")
             return self.last_value or 0.0
 
+    # =========================================================================
+    # CALIBRATION
+    # =========================================================================
+
+    @property
+    def r0(self) -> float:
+        """Sensor resistance in clean air (kOhm)."""
+        return self.calibration.r0
+
+    @property
+    def r_load(self) -> float:
+        """Load resistance (kOhm)."""
+        return self.calibration.r_load
+
+    @property
+    def table(self) -> CalibrationTable:
+        """PPM lookup table for the current calibration and ambient conditions."""
+        table = self._table
+        if table is None:
+            table = CalibrationTable.compile(self.calibration)
+            self._table = table
+        return table
+
+    def _load_table(self) -> Optional[CalibrationTable]:
+        table = self._calibration_store.load(self.sensor_id)
+        if table is not None and table.calibration.gas_type != self.gas_type:
+            logger.warning(
+                f"Ignoring saved {table.calibration.gas_type.value} calibration "
+                f"for {self.sensor_id} ({self.gas_type.value} sensor)"
+            )
+            return None
+        return table
+
     def _ratio_to_ppm(self, ratio: float) -> float:
         """
         Convert Rs/R0 ratio to PPM using sensor calibration curves.
         
-        Each MQ sensor has a different characteristic curve.
-        These are approximations - actual deployment should use
-        manufacturer calibration data.
+        Each MQ sensor has a different characteristic curve; see GAS_CURVES.
         """
-        if ratio <= 0:
-            return 0.0
+        return self.calibration.ppm_from_ratio(ratio)
+
+    def recalibrate(self, calibration: GasCalibration, persist: bool = True) -> CalibrationTable:
+        """
+        Compile and swap in a new calibration.
         
-        # Sensor-specific curve approximations
-        curves = {
-            GasType.NATURAL_GAS: (-0.35, 0.5),    # MQ-4 methane curve
-            GasType.PROPANE: (-0.42, 0.4),        # MQ-6 propane curve
-            GasType.CARBON_MONOXIDE: (-0.77, 0.6), # MQ-7 CO curve
-            GasType.HYDROGEN_SULFIDE: (-0.44, 0.3), # MQ-136 H2S curve
-        }
+        The table is built before it replaces the old one, so readings in
+        flight keep using a complete table. It keeps the current ambient
+        compensation.
+        """
+        current = self._table
+        temperature_c = current.temperature_c if current else REFERENCE_TEMPERATURE_C
+        humidity = current.humidity if current else REFERENCE_HUMIDITY
+
+        table = CalibrationTable.compile(calibration, temperature_c, humidity)
+        self.calibration = calibration
+        self._table = table
+        if persist:
+            self._calibration_store.save(self.sensor_id, table)
+        return table
+
+    def _updated_calibration(self, **changes: Any) -> GasCalibration:
+        """The current calibration with some fields replaced, validated."""
+        return GasCalibration.model_validate({**self.calibration.model_dump(), **changes})
+
+    def calibrate_points(
+        self,
+        points: Sequence[Tuple[float, float]],
+        r_load: Optional[float] = None,
+    ) -> None:
+        """
+        Calibrate from manufacturer (or field) sensitivity data.
         
-        slope, intercept = curves.get(self.gas_type, curves[GasType.NATURAL_GAS])
+        Args:
+            points: (PPM, Rs/R0) pairs, at least two
+            r_load: Load resistance on this board, if not the current one
+        """
+        self.recalibrate(self._updated_calibration(
+            points=list(points),
+            r_load=r_load or self.r_load,
+        ))
+        logger.info(f"Sensor {self.sensor_id} calibrated from {len(points)} points")
+
+    def set_environment(
+        self,
+        temperature_c: Optional[float] = None,
+        humidity: Optional[float] = None,
+    ) -> bool:
+        """
+        Compensate for ambient temperature and humidity.
         
-        # PPM = 10^((log10(ratio) - intercept) / slope)
-        try:
-            log_ratio = math.log10(ratio)
-            ppm = pow(10, (log_ratio - intercept) / slope)
-            return ppm
-        except (ValueError, ZeroDivisionError):
-            return 0.0
+        Conditions are rounded to the configured steps and the table is
+        recompiled only when the rounded values change. Returns True if a
+        new table was swapped in.
+        """
+        current = self.table
+        if temperature_c is None:
+            temperature_c = current.temperature_c
+        if humidity is None:
+            humidity = current.humidity
+        temperature_c = round(temperature_c / self._temperature_step) * self._temperature_step
+        humidity = round(humidity / self._humidity_step) * self._humidity_step
+
+        if (temperature_c, humidity) == (current.temperature_c, current.humidity):
+            return False
+        self._table = CalibrationTable.compile(self.calibration, temperature_c, humidity)
+        return True
+
+    def batch_spec(self) -> BatchSpec:
+        return BatchSpec(
+            self.table,
+            ThresholdBands(RISING, self.threshold, self.danger_threshold, self.critical_threshold),
+        )
 
     def check_threshold(self, value: float) -> Optional[AlertSeverity]:
         """
@@ -245,6 +341,27 @@ class GasLeakSensor(BaseSensor):
         
         return msg
 
+    def get_early_warning_message(self, value: float, detection: Detection) -> str:
+        """Message for a concentration ramp caught before the threshold."""
+        gas_name = self.gas_type.value.replace("_", " ").title()
+        return (
+            f"{gas_name} {detection.describe(self.unit)} "
+            f"(now {value:.1f} PPM, warning at {self.threshold:.1f} PPM). "
+            "Possible leak developing; ventilate and check appliances."
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get current sensor status with calibration."""
+        status = super().get_status()
+        table = self.table
+        status["calibration"] = {
+            "r0": self.r0,
+            "points": len(self.calibration.points),
+            "temperature_c": table.temperature_c,
+            "humidity": table.humidity,
+        }
+        return status
+
     async def _on_alert(self, value: float, severity: AlertSeverity) -> None:
         """Handle alert by potentially shutting off gas."""
         if severity in [AlertSeverity.DANGER, AlertSeverity.CRITICAL]:
@@ -266,7 +383,7 @@ class GasLeakSensor(BaseSensor):
         Args:
             clean_air_resistance: R0 value measured in clean air
         """
-        self.r0 = clean_air_resistance
+        self.recalibrate(self._updated_calibration(r0=clean_air_resistance))
         logger.info(f"Sensor {self.sensor_id} calibrated with R0={clean_air_resistance}")
 
 
@@ -294,8 +411,7 @@ class MethaneGasSensor(GasLeakSensor):
             adc_channel=adc_channel,
             simulation_mode=simulation_mode,
         )
-        # MQ-4 specific calibration
-        self.r0 = 10.0  # Typical R0 for MQ-4 in clean air
+        # MQ-4 typical R0 in clean air is the default 10 kOhm
 
 
 class PropaneGasSensor(GasLeakSensor):
@@ -0,0 +1,122 @@
+"""
+LUXX HAUS GPIO Backends
+Digital input access with edge callbacks, on RPi.GPIO or simulated pins.
+"""
+
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple
+
+EDGE_RISING = "rising"
+EDGE_FALLING = "falling"
+EDGE_BOTH = "both"
+
+EdgeCallback = Callable[[int], None]
+
+
+class GPIOBackend(ABC):
+    """
+    Digital inputs with edge detection.
+
+    Edge callbacks run on the backend's own thread (RPi.GPIO uses one
+    thread for all pins) and receive the pin number, as RPi.GPIO does.
+    """
+
+    @abstractmethod
+    def setup_input(self, pin: int, pull: Optional[str] = None) -> None:
+        """Configure a pin as an input; ``pull`` is "up", "down" or None."""
+
+    @abstractmethod
+    def read(self, pin: int) -> int:
+        """Current level of a pin (0 or 1)."""
+
+    @abstractmethod
+    def add_edge_callback(
+        self, pin: int, edge: str, callback: EdgeCallback, bouncetime_ms: int = 0
+    ) -> None:
+        """Call ``callback(pin)`` on the given edge(s)."""
+
+    @abstractmethod
+    def remove_edge_callback(self, pin: int) -> None:
+        """Stop edge detection on a pin."""
+
+
+class RPiGPIO(GPIOBackend):
+    """RPi.GPIO in BCM numbering. Importing fails off a Raspberry Pi."""
+
+    def __init__(self):
+        import RPi.GPIO as GPIO
+
+        self._gpio = GPIO
+        GPIO.setmode(GPIO.BCM)
+
+    def setup_input(self, pin: int, pull: Optional[str] = None) -> None:
+        GPIO = self._gpio
+        pulls = {"up": GPIO.PUD_UP, "down": GPIO.PUD_DOWN, None: GPIO.PUD_OFF}
+        GPIO.setup(pin, GPIO.IN, pull_up_down=pulls[pull])
+
+    def read(self, pin: int) -> int:
+        return 1 if self._gpio.input(pin) else 0
+
+    def add_edge_callback(
+        self, pin: int, edge: str, callback: EdgeCallback, bouncetime_ms: int = 0
+    ) -> None:
+        GPIO = self._gpio
+        edges = {EDGE_RISING: GPIO.RISING, EDGE_FALLING: GPIO.FALLING, EDGE_BOTH: GPIO.BOTH}
+        kwargs = {"bouncetime": bouncetime_ms} if bouncetime_ms > 0 else {}
+        GPIO.add_event_detect(pin, edges[edge], callback=callback, **kwargs)
+
+    def remove_edge_callback(self, pin: int) -> None:
+        self._gpio.remove_event_detect(pin)
+
+
+class SimulatedGPIO(GPIOBackend):
+    """
+    In-memory pins for tests and demos.
+
+    ``set()`` changes a level and fires matching edge callbacks in the
+    calling thread, so calling it from a worker thread reproduces how
+    RPi.GPIO delivers interrupts.
+    """
+
+    def __init__(self):
+        self._levels: Dict[int, int] = {}
+        self._callbacks: Dict[int, Tuple[str, EdgeCallback]] = {}
+        self._lock = threading.Lock()
+
+    def setup_input(self, pin: int, pull: Optional[str] = None) -> None:
+        with self._lock:
+            self._levels.setdefault(pin, 1 if pull == "up" else 0)
+
+    def read(self, pin: int) -> int:
+        return self._levels.get(pin, 0)
+
+    def add_edge_callback(
+        self, pin: int, edge: str, callback: EdgeCallback, bouncetime_ms: int = 0
+    ) -> None:
+        if edge not in (EDGE_RISING, EDGE_FALLING, EDGE_BOTH):
+            raise ValueError(f"Invalid edge: {edge}")
+        with self._lock:
+            if pin in self._callbacks:
+                raise RuntimeError(f"Edge detection already enabled on pin {pin}")
+            self._callbacks[pin] = (edge, callback)
+
+    def remove_edge_callback(self, pin: int) -> None:
+        with self._lock:
+            self._callbacks.pop(pin, None)
+
+    def set(self, pin: int, level: int) -> None:
+        """Drive a pin to ``level`` and fire its edge callback on a change."""
+        level = 1 if level else 0
+        with self._lock:
+            previous = self._levels.get(pin, 0)
+            self._levels[pin] = level
+            registered = self._callbacks.get(pin)
+
+        if registered is None or level == previous:
+            return
+        edge, callback = registered
+        if edge == EDGE_BOTH or (edge == EDGE_RISING) == bool(level):
+            callback(pin)
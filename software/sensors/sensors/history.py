@@ -0,0 +1,270 @@
+"""
+LUXX HAUS Reading History
+Fixed-capacity, array-backed ring buffer for recent sensor readings.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Deque, Iterator, List, Optional, Tuple, Union
+
+from ..core import AlertSeverity, SensorType
+
+if TYPE_CHECKING:
+    from .base import Reading
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Severity is stored as a small int code; -1 means no alert
+_SEVERITIES = list(AlertSeverity)
+_SEVERITY_CODES = {severity: code for code, severity in enumerate(_SEVERITIES)}
+
+
+def to_epoch(timestamp: datetime) -> float:
+    """Convert a naive UTC datetime to epoch seconds."""
+    return (timestamp - _EPOCH).total_seconds()
+
+
+def from_epoch(seconds: float) -> datetime:
+    """Convert epoch seconds back to a naive UTC datetime."""
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+class ReadingHistory:
+    """
+    Ring buffer of recent readings stored in parallel float64 arrays.
+
+    Each point costs 17 bytes (value, timestamp, severity code) instead of
+    a Reading object with a datetime, an enum and strings, so thousands of
+    points fit in the memory the old 100-object list used.
+
+    Appends are O(1). Sum, min and max over the whole buffer are kept
+    incrementally (min/max via monotonic index queues, amortized O(1)).
+    Windowed statistics walk the arrays by index and do not allocate.
+
+    Indexing and iteration rebuild Reading objects on demand, so code that
+    treated ``sensor.readings`` as a list keeps working.
+    """
+
+    # Recompute the running sum after this many evictions to cancel drift
+    _RESUM_INTERVAL = 4096
+
+    def __init__(
+        self,
+        capacity: int,
+        sensor_id: str,
+        sensor_type: SensorType,
+        unit: str,
+    ):
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+
+        self.capacity = capacity
+        self.sensor_id = sensor_id
+        self.sensor_type = sensor_type
+        self.unit = unit
+
+        self._values = array("d", bytes(8 * capacity))
+        self._times = array("d", bytes(8 * capacity))
+        self._severity = array("b", [-1]) * capacity
+
+        self._count = 0  # total points ever appended
+        self._sum = 0.0
+        self._evictions = 0
+        self._min_seq: Deque[int] = deque()
+        self._max_seq: Deque[int] = deque()
+
+    # =========================================================================
+    # APPEND
+    # =========================================================================
+
+    def push(
+        self,
+        value: float,
+        timestamp: float,
+        severity: Optional[AlertSeverity] = None,
+    ) -> None:
+        """Append a point. ``timestamp`` is epoch seconds."""
+        cap = self.capacity
+        seq = self._count
+        slot = seq % cap
+
+        if seq >= cap:
+            # Evict the point being overwritten
+            old_seq = seq - cap
+            self._sum -= self._values[slot]
+            if self._min_seq and self._min_seq[0] == old_seq:
+                self._min_seq.popleft()
+            if self._max_seq and self._max_seq[0] == old_seq:
+                self._max_seq.popleft()
+            self._evictions += 1
+
+        self._values[slot] = value
+        self._times[slot] = timestamp
+        self._severity[slot] = -1 if severity is None else _SEVERITY_CODES[severity]
+        self._count = seq + 1
+        self._sum += value
+
+        values = self._values
+        min_seq = self._min_seq
+        while min_seq and values[min_seq[-1] % cap] >= value:
+            min_seq.pop()
+        min_seq.append(seq)
+
+        max_seq = self._max_seq
+        while max_seq and values[max_seq[-1] % cap] <= value:
+            max_seq.pop()
+        max_seq.append(seq)
+
+        if self._evictions >= self._RESUM_INTERVAL:
+            self._evictions = 0
+            self._sum = self._range_sum(self._count - len(self), self._count)
+
+    def append(self, reading: "Reading") -> None:
+        """Append a Reading object."""
+        self.push(reading.value, to_epoch(reading.timestamp), reading.severity)
+
+    def clear(self) -> None:
+        """Drop all points."""
+        self._count = 0
+        self._sum = 0.0
+        self._evictions = 0
+        self._min_seq.clear()
+        self._max_seq.clear()
+
+    # =========================================================================
+    # SEQUENCE PROTOCOL
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def _slot(self, index: int) -> int:
+        """Map a logical index (0 = oldest retained) to an array slot."""
+        size = len(self)
+        return (self._count - size + index) % self.capacity
+
+    def _build(self, index: int) -> "Reading":
+        from .base import Reading
+
+        slot = self._slot(index)
+        code = self._severity[slot]
+        return Reading(
+            sensor_id=self.sensor_id,
+            sensor_type=self.sensor_type,
+            value=self._values[slot],
+            unit=self.unit,
+            timestamp=from_epoch(self._times[slot]),
+            is_alert=code >= 0,
+            severity=_SEVERITIES[code] if code >= 0 else None,
+        )
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["Reading", List["Reading"]]:
+        size = len(self)
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("reading history index out of range")
+        return self._build(index)
+
+    def __iter__(self) -> Iterator["Reading"]:
+        for i in range(len(self)):
+            yield self._build(i)
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    # =========================================================================
+    # STATISTICS
+    # =========================================================================
+
+    def value_at(self, index: int) -> float:
+        """Value at a logical index (negative indexes count from newest)."""
+        size = len(self)
+        if index < 0:
+            index += size
+        return self._values[self._slot(index)]
+
+    def _range_sum(self, start_seq: int, end_seq: int) -> float:
+        """Sum of values for sequence numbers in [start_seq, end_seq)."""
+        values = self._values
+        cap = self.capacity
+        total = 0.0
+        for seq in range(start_seq, end_seq):
+            total += values[seq % cap]
+        return total
+
+    def _clamp(self, last_n: Optional[int]) -> int:
+        size = len(self)
+        if last_n is None or last_n >= size:
+            return size
+        return max(last_n, 0)
+
+    def sum(self, last_n: Optional[int] = None) -> float:
+        n = self._clamp(last_n)
+        if n == len(self):
+            return self._sum
+        return self._range_sum(self._count - n, self._count)
+
+    def mean(self, last_n: Optional[int] = None) -> float:
+        n = self._clamp(last_n)
+        return self.sum(n) / n if n else 0.0
+
+    def min(self, last_n: Optional[int] = None) -> float:
+        n = self._clamp(last_n)
+        if not n:
+            return 0.0
+        if n == len(self):
+            return self._values[self._min_seq[0] % self.capacity]
+        values = self._values
+        cap = self.capacity
+        lowest = values[(self._count - n) % cap]
+        for seq in range(self._count - n + 1, self._count):
+            v = values[seq % cap]
+            if v < lowest:
+                lowest = v
+        return lowest
+
+    def max(self, last_n: Optional[int] = None) -> float:
+        n = self._clamp(last_n)
+        if not n:
+            return 0.0
+        if n == len(self):
+            return self._values[self._max_seq[0] % self.capacity]
+        values = self._values
+        cap = self.capacity
+        highest = values[(self._count - n) % cap]
+        for seq in range(self._count - n + 1, self._count):
+            v = values[seq % cap]
+            if v > highest:
+                highest = v
+        return highest
+
+    def half_means(self, last_n: Optional[int] = None) -> Tuple[float, float]:
+        """
+        Means of the older and newer halves of the last-n window.
+
+        The split matches slicing the window at ``n // 2``.
+        """
+        n = self._clamp(last_n)
+        if n < 2:
+            value = self.mean(n)
+            return value, value
+        start = self._count - n
+        mid = start + n // 2
+        first_sum = self._range_sum(start, mid)
+        second_sum = self._range_sum(mid, self._count)
+        return first_sum / (mid - start), second_sum / (self._count - mid)
+
+    def memory_bytes(self) -> int:
+        """Approximate storage used by the point arrays."""
+        return (
+            self._values.itemsize * len(self._values)
+            + self._times.itemsize * len(self._times)
+            + self._severity.itemsize * len(self._severity)
+        )
@@ -12,10 +12,15 @@ from typing import Callable, Optional
 from loguru import logger
 
 from ..core import AlertSeverity, SensorType, get_config
-from .base import BaseSensor
+from .base import EdgeTriggeredSensor
+from .gpio import EDGE_BOTH, GPIOBackend
 
+# Debounce only: a longer bouncetime could swallow the falling edge, and
+# the next motion would then look like a repeat of the last level
+_PIR_DEBOUNCE_MS = 50
 
-class MotionSensor(BaseSensor):
+
+class MotionSensor(EdgeTriggeredSensor):
     """
     PIR (Passive Infrared) motion sensor for occupancy detection.
 
@@ -28,6 +33,9 @@ class MotionSensor(BaseSensor):
         - HC-SR501 PIR sensor (most common)
         - HC-SR505 mini PIR
         - AM312 PIR sensor
+
+    The PIR output is edge-triggered: a reading is taken when motion starts
+    (rising edge) and when it clears (falling edge), not on a poll.
     """
 
     def __init__(
@@ -37,17 +45,8 @@ class MotionSensor(BaseSensor):
         location: str = "Kitchen",
         cooldown_seconds: float = 2.0,
         simulation_mode: bool = False,
+        gpio: Optional[GPIOBackend] = None,
     ):
-        super().__init__(
-            sensor_id=sensor_id,
-            sensor_type=SensorType.MOTION,
-            threshold=1.0,  # Binary: 0 = no motion, 1 = motion
-            unit="detected",
-            sample_interval=0.5,  # Check frequently
-            simulation_mode=simulation_mode,
-        )
-
-        self.gpio_pin = gpio_pin
         self.location = location
         self.cooldown_seconds = cooldown_seconds
 
@@ -59,43 +58,25 @@ class MotionSensor(BaseSensor):
         # Statistics
         self.total_motion_events = 0
 
-        if not self.simulation_mode:
-            self._init_hardware()
+        super().__init__(
+            sensor_id=sensor_id,
+            sensor_type=SensorType.MOTION,
+            threshold=1.0,  # Binary: 0 = no motion, 1 = motion
+            unit="detected",
+            gpio_pin=gpio_pin,
+            edge=EDGE_BOTH,
+            pull="down",
+            bouncetime_ms=min(int(cooldown_seconds * 1000), _PIR_DEBOUNCE_MS),
+            gpio=gpio,
+            sample_interval=0.5,  # Polling fallback in simulation
+            simulation_mode=simulation_mode,
+        )
 
         logger.info(
             f"Motion sensor initialized: {sensor_id} "
             f"location={location} pin={gpio_pin}"
         )
 
-    def _init_hardware(self) -> None:
-        """Initialize GPIO for PIR sensor."""
-        try:
-            import RPi.GPIO as GPIO
-
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setup(self.gpio_pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-
-            # Set up interrupt-based detection for immediate response
-            GPIO.add_event_detect(
-                self.gpio_pin,
-                GPIO.RISING,
-                callback=self._hardware_motion_callback,
-                bouncetime=int(self.cooldown_seconds * 1000)
-            )
-
-            logger.info(f"PIR GPIO initialized: pin={self.gpio_pin}")
-
-        except ImportError:
-            logger.warning("RPi.GPIO not available, using simulation mode")
-            self.simulation_mode = True
-        except Exception as e:
-            logger.error(f"GPIO init failed: {e}")
-            self.simulation_mode = True
-
-    def _hardware_motion_callback(self, channel: int) -> None:
-        """Callback triggered by hardware interrupt on motion detection."""
-        self._record_motion()
-
     def _record_motion(self) -> None:
         """Record a motion event."""
         now = time.time()
@@ -112,33 +93,26 @@ class MotionSensor(BaseSensor):
             except Exception as e:
                 logger.error(f"Motion callback error: {e}")
 
-    def read_value(self) -> float:
+    def value_for_level(self, level: int) -> float:
         """
-        Read motion state.
+        Motion state for a PIR output level.
 
         Returns:
-            1.0 if motion detected recently, 0.0 otherwise
+            1.0 while the PIR output is high, 0.0 otherwise
         """
-        if self.simulation_mode:
-            # Simulate occasional motion (for testing)
-            import random
-            if random.random() < 0.3:  # 30% chance of motion
-                self._record_motion()
-                return 1.0
-            return 0.0
-
-        try:
-            import RPi.GPIO as GPIO
-            state = GPIO.input(self.gpio_pin)
-
-            if state == GPIO.HIGH:
-                self._record_motion()
-                return 1.0
-            return 0.0
-
-        except Exception as e:
-            logger.error(f"Error reading motion sensor: {e}")
-            return 0.0
+        if level:
+            self._record_motion()
+            return 1.0
+        self.motion_detected = False
+        return 0.0
+
+    def simulate_value(self) -> float:
+        """Simulate occasional motion (for testing)."""
+        import random
+        if random.random() < 0.3:  # 30% chance of motion
+            self._record_motion()
+            return 1.0
+        return 0.0
 
     def check_threshold(self, value: float) -> Optional[AlertSeverity]:
         """Motion sensors don't trigger alerts directly."""
@@ -159,6 +133,8 @@ class MotionSensor(BaseSensor):
         """
         if self.last_motion_time is None:
             return None
+        if self.edge_triggered and self.level:
+            return 0.0  # PIR output still high: motion is ongoing
         return time.time() - self.last_motion_time
 
     def is_occupied(self, timeout_seconds: float = 300.0) -> bool:
@@ -201,6 +177,8 @@ class MotionSensor(BaseSensor):
             "is_occupied": self.is_occupied(),
             "total_events": self.total_motion_events,
             "simulation_mode": self.simulation_mode,
+            "edge_triggered": self.edge_triggered,
+            "max_edge_latency_ms": round(self.max_latency * 1000, 3),
         }
 
     def reset(self) -> None:
@@ -217,6 +195,7 @@ class KitchenMotionSensor(MotionSensor):
         sensor_id: str = "LUXX-PIR-KITCHEN-001",
         gpio_pin: int = 23,
         simulation_mode: bool = False,
+        gpio: Optional[GPIOBackend] = None,
     ):
         super().__init__(
             sensor_id=sensor_id,
@@ -224,4 +203,5 @@ class KitchenMotionSensor(MotionSensor):
             location="Kitchen",
             cooldown_seconds=1.0,  # Faster response for safety
             simulation_mode=simulation_mode,
+            gpio=gpio,
         )
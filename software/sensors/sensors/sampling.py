@@ -0,0 +1,133 @@
+"""
+LUXX HAUS Adaptive Sampling
+Picks each sensor's next sample interval from how close and how fast its
+readings are moving toward an alert.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Optional
+
+from ..core.config import AdaptiveSamplingConfig
+
+
+class AdaptiveSamplingPolicy:
+    """
+    Fast-attack, slow-decay sample rate control.
+
+    Intervals are ``min_interval * 2**level``, capped at ``max_interval``,
+    so every sensor sits on a power-of-two multiple of its fast rate. That
+    keeps the scheduler's groups few and harmonic: slowed-down sensors
+    still fire on the same grid ticks as fast ones.
+
+    After each reading an urgency in [0, 1] is computed from
+
+        - proximity: how far inside ``near_band`` (relative distance to the
+          nearest alert boundary) the value is
+        - change: how large the step since the last reading was, relative
+          to ``change_band`` of the threshold
+
+    An alert, or urgency high enough to call for a faster level, takes
+    effect on the very next sample. A reading is calm when it does not call
+    for a faster level than the current one; slowing down happens one level
+    at a time after ``settle_samples`` calm readings in a row, and never past
+    the level the latest reading allows.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        near_band: float = 0.25,
+        change_band: float = 0.05,
+        settle_samples: int = 3,
+    ):
+        if min_interval <= 0:
+            raise ValueError("min_interval must be positive")
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.near_band = near_band
+        self.change_band = change_band
+        self.settle_samples = settle_samples
+
+        self.max_level = max(0, math.ceil(math.log2(self.max_interval / self.min_interval)))
+        self.level = 0
+        self._calm = 0
+        self._last_value: Optional[float] = None
+
+        # Stats
+        self.speedups = 0
+        self.slowdowns = 0
+
+    @classmethod
+    def from_config(
+        cls, config: AdaptiveSamplingConfig, sample_interval: float
+    ) -> "AdaptiveSamplingPolicy":
+        return cls(
+            min_interval=config.min_interval_seconds or sample_interval,
+            max_interval=config.max_interval_seconds,
+            near_band=config.near_band,
+            change_band=config.change_band,
+            settle_samples=config.settle_samples,
+        )
+
+    @property
+    def interval(self) -> float:
+        return min(self.min_interval * (1 << self.level), self.max_interval)
+
+    def urgency(self, value: float, distance: float, scale: float) -> float:
+        """
+        Urgency of a reading in [0, 1].
+
+        Args:
+            value: The new reading
+            distance: Relative distance to the nearest alert boundary
+            scale: Magnitude the change band is relative to (the threshold)
+        """
+        proximity = 1.0 - distance / self.near_band if self.near_band > 0 else 0.0
+
+        change = 0.0
+        if self._last_value is not None and scale and self.change_band > 0:
+            change = abs(value - self._last_value) / (abs(scale) * self.change_band)
+        self._last_value = value
+
+        return min(1.0, max(0.0, proximity, change))
+
+    def update(self, value: float, distance: float, scale: float, is_alert: bool) -> float:
+        """Record a reading and return the interval to use until the next one."""
+        urgency = self.urgency(value, distance, scale)
+        if is_alert:
+            urgency = 1.0
+
+        # Slowest level this reading allows
+        target = math.floor((1.0 - urgency) * self.max_level)
+        if target < self.level:
+            self._calm = 0
+            self.level = target
+            self.speedups += 1
+        else:
+            # Calm: nothing calls for a faster rate, e.g. small noise steps
+            self._calm += 1
+            if self._calm >= self.settle_samples and self.level < target:
+                self.level += 1
+                self._calm = 0
+                self.slowdowns += 1
+
+        return self.interval
+
+    def reset(self) -> None:
+        """Return to the fast rate."""
+        self.level = 0
+        self._calm = 0
+        self._last_value = None
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "min_interval": self.min_interval,
+            "max_interval": self.max_interval,
+            "level": self.level,
+            "speedups": self.speedups,
+            "slowdowns": self.slowdowns,
+        }
@@ -11,7 +11,10 @@ from typing import Optional
 from loguru import logger
 
 from ..core import AlertSeverity, SensorType, get_config
-from .base import BaseSensor
+from .adc import get_adc
+from .base import BaseSensor, EdgeTriggeredSensor
+from .batch import RISING, BatchSpec, MQCurve, ThresholdBands
+from .gpio import EDGE_BOTH, GPIOBackend
 
 
 class SmokeSensor(BaseSensor):
@@ -30,6 +33,9 @@ class SmokeSensor(BaseSensor):
     that creates resistance changes in the sensor.
     """
 
+    blocking_read = True  # MCP3008 over SPI
+    io_bus = "spi0"
+
     def __init__(
         self,
         sensor_id: str = "LUXX-SMK-001",
@@ -55,6 +61,7 @@ class SmokeSensor(BaseSensor):
         # Calibration
         self.r_load = 10.0
         self.r0 = 9.83  # MQ-2 typical clean air resistance
+        self._curve: Optional[MQCurve] = None
         
         # Hardware
         self._adc = None
@@ -64,16 +71,8 @@ class SmokeSensor(BaseSensor):
     def _init_hardware(self) -> None:
         """Initialize hardware interfaces."""
         try:
-            import board
-            import busio
-            import adafruit_mcp3xxx.mcp3008 as MCP
-            from adafruit_mcp3xxx.analog_in import AnalogIn
-            from digitalio import DigitalInOut
-            
-            spi = busio.SPI(clock=board.SCK, MISO=board.MISO, MOSI=board.MOSI)
-            cs = DigitalInOut(board.D5)
-            mcp = MCP.MCP3008(spi, cs)
-            self._adc = AnalogIn(mcp, getattr(MCP, f"P{self.adc_channel}"))
+            # The ADC is shared with the other analog sensors on this bus
+            self._adc = get_adc(self.io_bus).channel(self.adc_channel)
             
             logger.info(f"Hardware initialized for {self.sensor_id}")
             
@@ -96,30 +95,28 @@ class SmokeSensor(BaseSensor):
             return 0.0
         
         try:
-            voltage = self._adc.voltage
-            
-            if voltage < 0.1:
-                return 0.0
-            
-            # Calculate sensor resistance
-            rs = (3.3 - voltage) / voltage * self.r_load
-            ratio = rs / self.r0
-            
-            # MQ-2 smoke curve approximation
-            # PPM = 10^((log10(ratio) - 0.6) / -0.47)
-            import math
-            if ratio <= 0:
-                return 0.0
-            
-            log_ratio = math.log10(ratio)
-            ppm = pow(10, (log_ratio - 0.6) / -0.47)
-            
-            return max(0, ppm)
+            # Voltage -> Rs/R0 -> PPM on the MQ-2 smoke curve
+            return self.curve.convert(self._adc.voltage)
             
         except Exception as e:
             logger.error(f"Error reading smoke sensor: {e}")
             return self.last_value or 0.0
 
+    @property
+    def curve(self) -> MQCurve:
+        """MQ-2 smoke curve: PPM = 10^((log10(ratio) - 0.6) / -0.47)."""
+        curve = self._curve
+        if curve is None or curve.r0 != self.r0 or curve.r_load != self.r_load:
+            curve = MQCurve.from_datasheet(-0.47, 0.6, self.r_load, self.r0)
+            self._curve = curve
+        return curve
+
+    def batch_spec(self) -> BatchSpec:
+        return BatchSpec(
+            self.curve,
+            ThresholdBands(RISING, self.threshold, self.threshold * 2, self.threshold * 5),
+        )
+
     def check_threshold(self, value: float) -> Optional[AlertSeverity]:
         """Check if smoke level indicates danger."""
         if value >= self.threshold * 5:
@@ -167,12 +164,15 @@ class SmokeSensor(BaseSensor):
             # - Emergency services notification
 
 
-class PhotoelectricSmokeSensor(BaseSensor):
+class PhotoelectricSmokeSensor(EdgeTriggeredSensor):
     """
     Photoelectric smoke detector.
     
     Uses light scattering principle - better for smoldering fires.
     Typically uses a dedicated photoelectric smoke sensor module.
+    
+    The module's alarm output is edge-triggered: a reading is taken when
+    it asserts or clears rather than on every sample interval.
     """
 
     def __init__(
@@ -182,56 +182,32 @@ class PhotoelectricSmokeSensor(BaseSensor):
         location: str = "Unknown",
         gpio_pin: int = 18,
         simulation_mode: bool = False,
+        gpio: Optional[GPIOBackend] = None,
     ):
         super().__init__(
             sensor_id=sensor_id,
             sensor_type=SensorType.SMOKE,
             threshold=threshold_obscuration,
             unit="%/ft",
-            sample_interval=1.0,
+            gpio_pin=gpio_pin,
+            edge=EDGE_BOTH,
+            bouncetime_ms=20,
+            gpio=gpio,
+            sample_interval=1.0,  # Polling fallback in simulation
             simulation_mode=simulation_mode,
         )
         
         self.location = location
-        self.gpio_pin = gpio_pin
-        
-        if not self.simulation_mode:
-            self._init_hardware()
 
-    def _init_hardware(self) -> None:
-        """Initialize GPIO for digital smoke sensor."""
-        try:
-            import RPi.GPIO as GPIO
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setup(self.gpio_pin, GPIO.IN)
-            logger.info(f"GPIO initialized for {self.sensor_id}")
-        except ImportError:
-            logger.warning("RPi.GPIO not available")
-            self.simulation_mode = True
-        except Exception as e:
-            logger.error(f"GPIO init failed: {e}")
-            self.simulation_mode = True
+    def value_for_level(self, level: int) -> float:
+        """Simple digital output: 1 = smoke detected."""
+        return 10.0 if level else 0.0
 
-    def read_value(self) -> float:
-        """Read smoke obscuration value."""
-        if self.simulation_mode:
-            if random.random() < 0.02:
-                return random.uniform(2.5, 8.0)
-            return random.uniform(0, 1.5)
-        
-        try:
-            import RPi.GPIO as GPIO
-            
-            # For digital sensors, we might use PWM duty cycle
-            # or analog reading depending on sensor type
-            state = GPIO.input(self.gpio_pin)
-            
-            # Simple digital: 1 = smoke detected
-            return 10.0 if state else 0.0
-            
-        except Exception as e:
-            logger.error(f"Error reading smoke sensor: {e}")
-            return 0.0
+    def simulate_value(self) -> float:
+        """Simulate occasional smoke (for testing)."""
+        if random.random() < 0.02:
+            return random.uniform(2.5, 8.0)
+        return random.uniform(0, 1.5)
 
     def check_threshold(self, value: float) -> Optional[AlertSeverity]:
         """Check obscuration threshold."""
@@ -30,6 +30,9 @@ class StoveHeatSensor(BaseSensor):
         - K-type thermocouple with MAX31855
     """
 
+    blocking_read = True  # MLX90614 over I2C
+    io_bus = "i2c1"
+
     def __init__(
         self,
         sensor_id: str = "LUXX-STOVE-HEAT-001",
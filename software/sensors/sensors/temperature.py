@@ -24,6 +24,9 @@ class TemperatureSensor(BaseSensor):
         - Humidity monitoring (optional)
     """
 
+    blocking_read = True  # DHT22 bit-banged read
+    io_bus = "gpio"
+
     def __init__(
         self,
         sensor_id: str = "LUXX-TMP-001",
@@ -124,6 +127,13 @@ class TemperatureSensor(BaseSensor):
             logger.error(f"Error reading temperature: {e}")
             return self.last_value or 68.0
 
+    def threshold_distance(self, value: float) -> float:
+        """Distance to the nearer of the freeze and high thresholds."""
+        return min(
+            abs(value - self.freeze_threshold) / abs(self.freeze_threshold or 1.0),
+            abs(value - self.high_threshold) / abs(self.high_threshold or 1.0),
+        )
+
     def check_threshold(self, value: float) -> Optional[AlertSeverity]:
         """Check temperature thresholds."""
         # Freeze warnings (low temperature)
@@ -204,6 +214,9 @@ class HumiditySensor(BaseSensor):
         - Condensation damage
     """
 
+    blocking_read = True  # DHT22 bit-banged read
+    io_bus = "gpio"
+
     def __init__(
         self,
         sensor_id: str = "LUXX-HUM-001",
@@ -263,6 +276,13 @@ class HumiditySensor(BaseSensor):
             logger.debug(f"DHT humidity read error: {e}")
             return self.last_value or 45.0
 
+    def threshold_distance(self, value: float) -> float:
+        """Distance to the nearer of the high and low thresholds."""
+        return min(
+            abs(value - self.high_threshold) / self.high_threshold,
+            abs(value - self.low_threshold) / self.low_threshold,
+        )
+
     def check_threshold(self, value: float) -> Optional[AlertSeverity]:
         """Check humidity thresholds."""
         # High humidity (mold risk)
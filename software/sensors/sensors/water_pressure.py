@@ -11,12 +11,18 @@ from typing import TYPE_CHECKING, Optional
 from loguru import logger
 
 from ..core import AlertSeverity, SensorType, get_config
+from .adc import get_adc
 from .base import BaseSensor
+from .batch import FALLING, BatchSpec, LinearScale, ThresholdBands
+from .detectors import Detection
 
 if TYPE_CHECKING:
     from ..controllers.water_valve import WaterValveController
 
 
+_TRANSDUCER_SCALE = LinearScale(offset=0.165, gain=100 / 2.805, low=0.0, high=150.0)
+
+
 class WaterPressureSensor(BaseSensor):
     """
     Water pressure sensor for leak detection.
@@ -30,6 +36,9 @@ class WaterPressureSensor(BaseSensor):
         - CRITICAL: pressure < threshold * 0.5 (e.g., < 15 PSI)
     """
 
+    blocking_read = True  # MCP3008 over SPI
+    io_bus = "spi0"
+
     def __init__(
         self,
         sensor_id: str = "LUXX-WPS-001",
@@ -62,21 +71,8 @@ class WaterPressureSensor(BaseSensor):
     def _init_hardware(self) -> None:
         """Initialize hardware interfaces."""
         try:
-            import board
-            import busio
-            import adafruit_mcp3xxx.mcp3008 as MCP
-            from adafruit_mcp3xxx.analog_in import AnalogIn
-            from digitalio import DigitalInOut
-            
-            # Create SPI bus
-            spi = busio.SPI(clock=board.SCK, MISO=board.MISO, MOSI=board.MOSI)
-            cs = DigitalInOut(board.D5)
-            
-            # Create MCP3008 object
-            mcp = MCP.MCP3008(spi, cs)
-            
-            # Create analog input channel
-            self._adc = AnalogIn(mcp, getattr(MCP, f"P{self.adc_channel}"))
+            # The ADC is shared with the other analog sensors on this bus
+            self._adc = get_adc(self.io_bus).channel(self.adc_channel)
             
             logger.info(f"Hardware initialized for {self.sensor_id}")
             
@@ -113,21 +109,34 @@ class WaterPressureSensor(BaseSensor):
             return 0.0
         
         try:
-            # Read voltage from ADC (0-3.3V)
-            voltage = self._adc.voltage
-            
-            # Convert voltage to PSI
-            # Typical pressure transducer: 0.5V = 0 PSI, 4.5V = 100 PSI
-            # Scaled for 3.3V reference: 0.165V = 0 PSI, 2.97V = 100 PSI
-            psi = (voltage - 0.165) * (100 / 2.805)
-            
-            # Clamp to valid range
-            return max(0, min(150, psi))
+            # Read voltage from ADC (0-3.3V) and convert to PSI
+            return self.voltage_scale().convert(self._adc.voltage)
             
         except Exception as e:
             logger.error(f"Error reading pressure sensor: {e}")
             return self.last_value or 0.0
 
+    def voltage_scale(self) -> LinearScale:
+        """
+        Voltage to PSI conversion.
+        
+        Typical pressure transducer: 0.5V = 0 PSI, 4.5V = 100 PSI
+        Scaled for 3.3V reference: 0.165V = 0 PSI, 2.97V = 100 PSI
+        Clamped to 0-150 PSI.
+        """
+        return _TRANSDUCER_SCALE
+
+    def batch_spec(self) -> BatchSpec:
+        return BatchSpec(
+            self.voltage_scale(),
+            ThresholdBands(
+                FALLING,
+                warning=self.threshold,
+                danger=self.threshold * 0.75,
+                critical=max(self.threshold * 0.5, self.critical_threshold),
+            ),
+        )
+
     def check_threshold(self, value: float) -> Optional[AlertSeverity]:
         """
         Check if pressure indicates a leak.
@@ -168,6 +177,13 @@ class WaterPressureSensor(BaseSensor):
         
         return msg
 
+    def get_early_warning_message(self, value: float, detection: Detection) -> str:
+        """Message for a pressure trend caught before the threshold."""
+        return (
+            f"Water pressure {detection.describe(self.unit)} "
+            f"(now {value:.1f} PSI). Possible leak developing; check fixtures and supply lines."
+        )
+
     async def _on_alert(self, value: float, severity: AlertSeverity) -> None:
         """Handle alert by potentially shutting off water."""
         if severity == AlertSeverity.CRITICAL and self.auto_shutoff and self.valve:
@@ -213,26 +229,8 @@ class HoneywellPX2Sensor(WaterPressureSensor):
         )
         self.supply_voltage = supply_voltage
 
-    def read_value(self) -> float:
-        """Read pressure using Honeywell PX2 calibration."""
-        if self.simulation_mode:
-            return super().read_value()
-        
-        if self._adc is None:
-            return 0.0
-        
-        try:
-            voltage = self._adc.voltage
-            
-            # PX2 output: 10% to 90% of supply voltage
-            v_min = self.supply_voltage * 0.10
-            v_max = self.supply_voltage * 0.90
-            
-            # Linear interpolation
-            psi = (voltage - v_min) / (v_max - v_min) * 100
-            
-            return max(0, min(150, psi))
-            
-        except Exception as e:
-            logger.error(f"Error reading Honeywell PX2: {e}")
-            return self.last_value or 0.0
+    def voltage_scale(self) -> LinearScale:
+        """PX2 output: 10% to 90% of supply voltage maps linearly to 0-100 PSI."""
+        v_min = self.supply_voltage * 0.10
+        v_max = self.supply_voltage * 0.90
+        return LinearScale(v_min, 100 / (v_max - v_min), 0.0, 150.0)
@@ -27,7 +27,7 @@ def event_loop():
 @pytest.fixture(autouse=True)
 def reset_singletons():
     """Reset singleton instances between tests."""
-    from src.core import config, database, events
+    from src.core import config, database, events, hardware_io
     
     # Reset config
     config._config = None
@@ -38,6 +38,13 @@ def reset_singletons():
     # Reset event bus
     events._event_bus = None
     
+    # Reset hardware I/O workers
+    hardware_io._io_executor = None
+    
+    # Reset shared ADCs
+    from src.sensors import adc
+    adc._adcs.clear()
+    
     yield
 
 
@@ -50,6 +57,7 @@ def test_config():
     config.system.simulation_mode = True
     config.system.name = "Test System"
     config.database.url = "sqlite:///:memory:"
+    config.sensors.calibration.persist = False
     
     set_config(config)
     return config
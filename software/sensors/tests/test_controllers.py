@@ -44,7 +44,7 @@ class TestWaterValveController:
     async def test_close_valve(self, valve):
         """Test closing the valve."""
         with patch.object(valve, '_db') as mock_db:
-            mock_db.log_valve_action = AsyncMock()
+            mock_db.record_valve_action = AsyncMock()
             
             success = await valve.close(triggered_by="test")
             
@@ -57,7 +57,7 @@ class TestWaterValveController:
     async def test_open_valve(self, valve):
         """Test opening the valve."""
         with patch.object(valve, '_db') as mock_db:
-            mock_db.log_valve_action = AsyncMock()
+            mock_db.record_valve_action = AsyncMock()
             
             # First close it
             await valve.close(triggered_by="test")
@@ -72,7 +72,7 @@ class TestWaterValveController:
     async def test_toggle_valve(self, valve):
         """Test toggling the valve."""
         with patch.object(valve, '_db') as mock_db:
-            mock_db.log_valve_action = AsyncMock()
+            mock_db.record_valve_action = AsyncMock()
             
             initial_state = valve.is_open
             await valve.toggle(triggered_by="test")
@@ -149,7 +149,7 @@ class TestGasValveController:
     async def test_emergency_close(self, valve):
         """Test emergency close bypasses normal delays."""
         with patch.object(valve, '_db') as mock_db:
-            mock_db.log_valve_action = AsyncMock()
+            mock_db.record_valve_action = AsyncMock()
             
             # Open the valve first
             await valve.open(triggered_by="test")
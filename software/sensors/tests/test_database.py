@@ -0,0 +1,527 @@
+"""
+Tests for LUXX HAUS database layer.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from src.core import (
+    DatabaseManager,
+    Event,
+    EventJournal,
+    EventType,
+    LuxxHausConfig,
+    SensorReading,
+    SensorType,
+    restore_database,
+    set_config,
+)
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Create a database backed by a temporary file."""
+    config = LuxxHausConfig()
+    config.system.simulation_mode = True
+    config.database.url = f"sqlite:///{tmp_path / 'test.db'}"
+    config.database.write_batch_size = 10
+    config.database.write_flush_interval_ms = 50
+    config.database.write_queue_max = 20
+    set_config(config)
+
+    db = DatabaseManager()
+    db.create_tables()
+    return db
+
+
+async def count_readings(db: DatabaseManager) -> int:
+    async with db.AsyncSessionLocal() as session:
+        result = await session.execute(select(func.count()).select_from(SensorReading))
+        return result.scalar_one()
+
+
+class TestReadingWriteBuffer:
+    """Tests for the write-behind reading buffer."""
+
+    @pytest.mark.asyncio
+    async def test_queue_does_not_write_immediately(self, file_db):
+        """Test queued readings are held until flushed."""
+        await file_db.queue_reading("TEST-WPS", SensorType.WATER_PRESSURE, 42.0, "PSI")
+
+        assert file_db.reading_buffer.pending == 1
+        assert await count_readings(file_db) == 0
+
+        assert await file_db.flush_readings() == 1
+        assert await count_readings(file_db) == 1
+        await file_db.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_interval(self, file_db):
+        """Test the background flusher writes after the flush interval."""
+        for i in range(3):
+            await file_db.queue_reading("TEST-GLD", SensorType.GAS_LEAK, float(i), "PPM")
+
+        await asyncio.sleep(0.2)
+
+        assert file_db.reading_buffer.pending == 0
+        assert await count_readings(file_db) == 3
+        await file_db.close()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_memory(self, file_db):
+        """Test the queue never grows beyond max_pending."""
+        buffer = file_db.reading_buffer
+
+        for i in range(100):
+            await file_db.queue_reading("TEST-WPS", SensorType.WATER_PRESSURE, float(i), "PSI")
+            assert buffer.pending <= buffer.max_pending
+
+        await file_db.close()
+
+        assert buffer.pending == 0
+        assert await count_readings(file_db) == 100
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self, file_db):
+        """Test closing the database writes everything still queued."""
+        for i in range(5):
+            await file_db.queue_reading(
+                "TEST-WPS", SensorType.WATER_PRESSURE, float(i), "PSI", is_alert=True
+            )
+
+        await file_db.close()
+
+        assert await count_readings(file_db) == 5
+        assert file_db.reading_buffer.rows_written == 5
+
+
+class TestCoreInserts:
+    """Tests for the Core-level insert API."""
+
+    @pytest.mark.asyncio
+    async def test_insert_rows_without_ids(self, file_db):
+        """Test executemany insert returns nothing unless asked."""
+        rows = [
+            {"sensor_id": "TEST-WPS", "sensor_type": "water_pressure", "value": 40.0, "unit": "PSI"}
+            for _ in range(3)
+        ]
+
+        assert await file_db.insert_rows(SensorReading, rows) is None
+        assert await count_readings(file_db) == 3
+
+    @pytest.mark.asyncio
+    async def test_insert_rows_returns_ids(self, file_db):
+        """Test primary keys are returned when requested."""
+        rows = [
+            {"sensor_id": "TEST-WPS", "sensor_type": "water_pressure", "value": 40.0, "unit": "PSI"}
+            for _ in range(3)
+        ]
+
+        ids = await file_db.insert_rows(SensorReading, rows, return_ids=True)
+
+        assert ids == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_record_alert(self, file_db):
+        """Test recording an alert applies column defaults."""
+        from src.core import Alert, AlertSeverity
+
+        alert_id = await file_db.record_alert(
+            sensor_id="TEST-GLD",
+            sensor_type=SensorType.GAS_LEAK,
+            value=120.0,
+            threshold=50.0,
+            severity=AlertSeverity.DANGER,
+            message="Gas detected",
+            return_id=True,
+        )
+
+        async with file_db.AsyncSessionLocal() as session:
+            alert = await session.get(Alert, alert_id)
+
+        assert alert.sensor_type == "gas_leak"
+        assert alert.severity == "danger"
+        assert alert.acknowledged is False
+        assert alert.timestamp is not None
+
+    @pytest.mark.asyncio
+    async def test_update_open_alert(self, file_db):
+        """Test that updating an incident rewrites its open row instead of adding one."""
+        from src.core import Alert, AlertSeverity
+
+        alert_id = await file_db.record_alert(
+            sensor_id="TEST-GLD",
+            sensor_type=SensorType.GAS_LEAK,
+            value=60.0,
+            threshold=50.0,
+            severity=AlertSeverity.WARNING,
+            message="Gas detected",
+            return_id=True,
+        )
+        async with file_db.AsyncSessionLocal() as session:
+            opened = (await session.get(Alert, alert_id)).notified_at
+
+        assert await file_db.update_open_alert(
+            "TEST-GLD", value=150.0, severity=AlertSeverity.DANGER, message="Gas rising"
+        ) == 1
+
+        async with file_db.AsyncSessionLocal() as session:
+            alerts = (await session.execute(select(Alert))).scalars().all()
+
+        assert len(alerts) == 1
+        assert (alerts[0].severity, alerts[0].value, alerts[0].message) == ("danger", 150.0, "Gas rising")
+        assert alerts[0].notified_at >= opened
+
+        await file_db.resolve_alerts("TEST-GLD")
+        assert await file_db.update_open_alert(
+            "TEST-GLD", value=150.0, severity=AlertSeverity.DANGER, message="Gas rising"
+        ) == 0
+
+    @pytest.mark.asyncio
+    async def test_resolve_alerts(self, file_db):
+        """Test that resolving marks only the sensor's open alerts."""
+        from src.core import Alert, AlertSeverity
+
+        for sensor_id in ("TEST-GLD", "TEST-GLD", "TEST-SMK"):
+            await file_db.record_alert(
+                sensor_id=sensor_id,
+                sensor_type=SensorType.GAS_LEAK,
+                value=120.0,
+                threshold=50.0,
+                severity=AlertSeverity.WARNING,
+                message="Gas detected",
+            )
+
+        assert await file_db.resolve_alerts("TEST-GLD") == 2
+        assert await file_db.resolve_alerts("TEST-GLD") == 0
+
+        async with file_db.AsyncSessionLocal() as session:
+            alerts = (await session.execute(select(Alert))).scalars().all()
+
+        assert {(a.sensor_id, a.resolved) for a in alerts} == {("TEST-GLD", True), ("TEST-SMK", False)}
+        assert all(a.resolved_at for a in alerts if a.resolved)
+
+
+class TestSQLiteTuning:
+    """Tests for the SQLite performance profile."""
+
+    def test_pragmas_applied_to_sync_engine(self, file_db):
+        """Test connect events apply the configured pragmas."""
+        from sqlalchemy import text
+
+        with file_db.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+
+    @pytest.mark.asyncio
+    async def test_pragmas_applied_to_async_engine(self, file_db):
+        """Test the aiosqlite engine gets the same profile."""
+        from sqlalchemy import text
+
+        async with file_db.async_engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA cache_size"))).scalar() == -16000
+
+    def test_invalid_journal_mode_rejected(self):
+        """Test unknown journal modes fail validation."""
+        from src.core.config import SQLiteTuningConfig
+
+        with pytest.raises(ValueError):
+            SQLiteTuningConfig(journal_mode="bogus")
+
+
+class TestRetention:
+    """Tests for reading retention and vacuum scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_prune_deletes_only_expired(self, file_db):
+        """Test readings older than retention_days are removed."""
+        from datetime import datetime, timedelta
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "sensor_id": "TEST-WPS",
+                "sensor_type": "water_pressure",
+                "value": 40.0,
+                "unit": "PSI",
+                "timestamp": now - timedelta(days=age),
+            }
+            for age in (45, 40, 31, 29, 1, 0)
+        ]
+        await file_db.insert_rows(SensorReading, rows)
+
+        file_db.retention.retention_days = 30
+        deleted = await file_db.retention.prune(now=now)
+
+        assert deleted == 3
+        assert await count_readings(file_db) == 3
+
+    @pytest.mark.asyncio
+    async def test_prune_in_chunks(self, file_db):
+        """Test pruning loops over bounded chunks until done."""
+        from datetime import datetime, timedelta
+
+        old = datetime.utcnow() - timedelta(days=90)
+        rows = [
+            {"sensor_id": "TEST-WPS", "sensor_type": "water_pressure", "value": 1.0,
+             "unit": "PSI", "timestamp": old}
+            for _ in range(250)
+        ]
+        await file_db.insert_rows(SensorReading, rows)
+
+        file_db.retention.chunk_size = 100
+        assert await file_db.retention.prune() == 250
+        assert await count_readings(file_db) == 0
+
+    @pytest.mark.asyncio
+    async def test_incremental_vacuum_enabled(self, file_db):
+        """Test new databases are created with incremental auto-vacuum."""
+        from sqlalchemy import text
+
+        async with file_db.async_engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA auto_vacuum"))).scalar() == 2
+
+        await file_db.retention.vacuum()
+        await file_db.retention.vacuum(full=True)
+
+    @pytest.mark.asyncio
+    async def test_disabled_retention_keeps_everything(self, file_db):
+        """Test retention_days=0 disables pruning."""
+        file_db.retention.retention_days = 0
+        assert await file_db.retention.prune() == 0
+
+
+class TestRollups:
+    """Tests for incremental reading rollups."""
+
+    @pytest.mark.asyncio
+    async def test_rollups_track_buffered_writes(self, file_db):
+        """Test rollup buckets aggregate min/max/avg/count/alerts."""
+        from datetime import datetime
+
+        from src.core import ReadingRollup
+
+        ts = datetime(2025, 1, 1, 12, 0, 10)
+        for value, alert in [(10.0, False), (30.0, True), (20.0, False)]:
+            await file_db.queue_reading(
+                "TEST-GLD", SensorType.GAS_LEAK, value, "PPM", is_alert=alert, timestamp=ts
+            )
+        await file_db.flush_readings()
+        await file_db.queue_reading("TEST-GLD", SensorType.GAS_LEAK, 5.0, "PPM", timestamp=ts)
+        await file_db.close()
+
+        async with file_db.AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(ReadingRollup).where(ReadingRollup.resolution == 60)
+            )
+            rollup = result.scalar_one()
+
+        assert rollup.bucket_start == datetime(2025, 1, 1, 12, 0, 0)
+        assert rollup.sample_count == 4
+        assert rollup.min_value == 5.0
+        assert rollup.max_value == 30.0
+        assert rollup.avg_value == pytest.approx(16.25)
+        assert rollup.alert_count == 1
+
+    @pytest.mark.asyncio
+    async def test_series_picks_resolution_for_budget(self, file_db):
+        """Test raw points are returned when they fit, rollups otherwise."""
+        from datetime import datetime, timedelta
+
+        start = datetime(2025, 1, 1)
+        rows = [
+            {"sensor_id": "TEST-WPS", "sensor_type": "water_pressure", "value": float(i % 7),
+             "unit": "PSI", "timestamp": start + timedelta(seconds=10 * i)}
+            for i in range(6 * 60 * 24)  # one day at 10 s
+        ]
+        await file_db.write_readings(rows)
+        end = start + timedelta(days=1)
+
+        small = await file_db.get_reading_series(
+            "TEST-WPS", start, start + timedelta(minutes=5), max_points=100
+        )
+        assert small["resolution"] == "raw"
+        assert len(small["points"]) == 30
+
+        hourly = await file_db.get_reading_series("TEST-WPS", start, end, max_points=50)
+        assert hourly["resolution"] == "1h"
+        assert len(hourly["points"]) == 24
+        assert sum(p["count"] for p in hourly["points"]) == len(rows)
+
+        quarter = await file_db.get_reading_series("TEST-WPS", start, end, max_points=100)
+        assert quarter["resolution"] == "15m"
+        assert len(quarter["points"]) == 96
+
+        minute = await file_db.get_reading_series("TEST-WPS", start, end, max_points=2000)
+        assert minute["resolution"] == "1m"
+        assert len(minute["points"]) == 1440
+
+    @pytest.mark.asyncio
+    async def test_series_accepts_aware_range(self, file_db):
+        """Test that aware start/end are compared as UTC on both the raw and rollup paths."""
+        from datetime import datetime, timedelta, timezone
+
+        start = datetime(2025, 1, 1)
+        rows = [
+            {"sensor_id": "TEST-WPS", "sensor_type": "water_pressure", "value": 1.0,
+             "unit": "PSI", "timestamp": start + timedelta(minutes=i)}
+            for i in range(300)
+        ]
+        await file_db.write_readings(rows)
+
+        # 03:00-05:00 UTC written as 22:00-00:00 at -05:00
+        est = timezone(timedelta(hours=-5))
+        aware_start = datetime(2024, 12, 31, 22, tzinfo=est)
+        aware_end = datetime(2025, 1, 1, 0, tzinfo=est)
+
+        raw = await file_db.get_reading_series("TEST-WPS", aware_start, aware_end, max_points=500)
+        assert raw["resolution"] == "raw"
+        assert len(raw["points"]) == 120
+        assert raw["points"][0]["timestamp"] == "2025-01-01T03:00:00"
+
+        rolled = await file_db.get_reading_series("TEST-WPS", aware_start, aware_end, max_points=10)
+        assert rolled["resolution"] == "15m"
+        assert sum(p["count"] for p in rolled["points"]) == 120
+
+
+class TestReadingPagination:
+    """Tests for composite indexes and keyset pagination."""
+
+    @staticmethod
+    async def seed(file_db):
+        from datetime import datetime, timedelta
+
+        start = datetime(2025, 1, 1)
+        rows = [
+            {"sensor_id": sid, "sensor_type": "water_pressure", "value": float(i),
+             "unit": "PSI", "timestamp": start + timedelta(seconds=i)}
+            for i in range(25)
+            for sid in ("TEST-A", "TEST-B")
+        ]
+        await file_db.insert_rows(SensorReading, rows)
+        return file_db
+
+    def test_composite_index_used(self, file_db):
+        """Test per-sensor history queries use the composite index."""
+        from sqlalchemy import text
+
+        with file_db.engine.connect() as conn:
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT * FROM sensor_readings "
+                "WHERE sensor_id = 'x' ORDER BY timestamp DESC LIMIT 10"
+            )).fetchall()
+
+        detail = " ".join(row[-1] for row in plan)
+        assert "ix_sensor_readings_sensor_ts" in detail
+        assert "TEMP B-TREE" not in detail
+
+    @pytest.mark.asyncio
+    async def test_before_cursor_walks_history(self, file_db):
+        """Test before_ts pages cover all readings exactly once."""
+        seeded_db = await self.seed(file_db)
+        seen = []
+        cursor = (None, None)
+        while True:
+            page = await seeded_db.get_readings_page(
+                "TEST-A", limit=10, before_ts=cursor[0], before_id=cursor[1]
+            )
+            if not page:
+                break
+            seen.extend(r.value for r in page)
+            cursor = (page[-1].timestamp, page[-1].id)
+
+        assert seen == [float(i) for i in reversed(range(25))]
+
+    @pytest.mark.asyncio
+    async def test_cursor_keeps_tied_timestamps(self, file_db):
+        """Test that rows sharing a timestamp at a page boundary are not skipped."""
+        from datetime import datetime
+
+        ts = datetime(2025, 1, 1)
+        await file_db.write_readings([
+            {"sensor_id": "TEST-T", "sensor_type": "water_pressure", "value": float(i),
+             "unit": "PSI", "timestamp": ts}
+            for i in range(5)
+        ])
+
+        older, cursor = [], (None, None)
+        while True:
+            page = await file_db.get_readings_page(
+                "TEST-T", limit=2, before_ts=cursor[0], before_id=cursor[1]
+            )
+            if not page:
+                break
+            older.extend(page)
+            cursor = (page[-1].timestamp, page[-1].id)
+        assert [r.value for r in older] == [4.0, 3.0, 2.0, 1.0, 0.0]
+
+        newer = await file_db.get_readings_page(
+            "TEST-T", limit=2, after_ts=ts, after_id=older[-2].id
+        )
+        assert [r.value for r in newer] == [3.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_after_cursor_returns_newest_first(self, file_db):
+        """Test after_ts returns the next newer page, newest first."""
+        from datetime import datetime, timedelta
+
+        seeded_db = await self.seed(file_db)
+
+        page = await seeded_db.get_readings_page(
+            "TEST-B", limit=3, after_ts=datetime(2025, 1, 1) + timedelta(seconds=4)
+        )
+
+        assert [r.value for r in page] == [7.0, 6.0, 5.0]
+
+
+class TestJournalRestore:
+    """Tests for rebuilding tables from the event journal."""
+
+    @pytest.mark.asyncio
+    async def test_restore_database(self, file_db, tmp_path):
+        """Test that journaled readings, alerts and valve actions are re-inserted."""
+        journal = EventJournal(tmp_path / "events")
+        readings = [
+            Event(
+                type=EventType.SENSOR_READING,
+                data={
+                    "sensor_id": "J-1",
+                    "sensor_type": SensorType.WATER_PRESSURE.value,
+                    "value": 40.0 + i,
+                    "unit": "PSI",
+                    "is_alert": False,
+                },
+                source="J-1",
+            )
+            for i in range(5)
+        ]
+        for event in readings:
+            journal.append(event)
+        journal.append(Event(
+            type=EventType.ALERT_TRIGGERED,
+            data={
+                "sensor_id": "J-1",
+                "sensor_type": SensorType.WATER_PRESSURE.value,
+                "value": 20.0,
+                "threshold": 30.0,
+                "severity": "critical",
+                "message": "low",
+            },
+            source="J-1",
+        ))
+        journal.append(Event(
+            type=EventType.VALVE_CLOSED,
+            data={"valve_id": "V-1", "action": "close", "triggered_by": "J-1"},
+            source="V-1",
+        ))
+
+        counts = await restore_database(journal, file_db, batch_size=2)
+
+        assert counts == {"sensor_readings": 5, "alerts": 1, "valve_actions": 1}
+        assert await count_readings(file_db) == 5
+        await file_db.close()
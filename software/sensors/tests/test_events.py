@@ -0,0 +1,543 @@
+"""
+Tests for the LUXX HAUS event system.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core import (
+    DeliveryMode,
+    Event,
+    EventBus,
+    EventJournal,
+    EventPriority,
+    EventType,
+    OverflowPolicy,
+)
+
+
+class TestEvent:
+    """Tests for the Event type."""
+
+    def test_lazy_fields(self):
+        """Test that id and timestamp are built on first access and then stable."""
+        event = Event(type=EventType.SENSOR_READING, data={}, source="TEST")
+
+        assert event._event_id is None
+        assert event._timestamp is None
+
+        event_id = event.event_id
+        assert event.event_id == event_id
+        assert isinstance(event.timestamp, datetime)
+        assert abs((datetime.utcnow() - event.timestamp).total_seconds()) < 5
+
+    def test_dict_round_trip(self):
+        """Test that to_dict/from_dict preserve id and timestamp."""
+        event = Event(type=EventType.VALVE_CLOSED, data={"valve_id": "V1"}, source="V1")
+
+        restored = Event.from_dict(event.to_dict())
+
+        assert restored == event
+        assert restored.to_dict() == event.to_dict()
+
+    def test_slotted(self):
+        """Test that events carry no per-instance __dict__."""
+        event = Event(type=EventType.SYSTEM_STARTED, data={}, source="system")
+
+        with pytest.raises(AttributeError):
+            event.extra = 1
+
+
+class TestEventBus:
+    """Tests for EventBus publishing."""
+
+    @pytest.mark.asyncio
+    async def test_publish_calls_handlers(self):
+        """Test exact and wildcard subscribers both receive an event."""
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            received.append(("exact", event.type))
+
+        def wildcard(event):
+            received.append(("wildcard", event.type))
+
+        bus.subscribe(EventType.SENSOR_ALERT, handler)
+        bus.subscribe("sensor.*", wildcard)
+
+        await bus.emit(EventType.SENSOR_ALERT, {}, source="TEST")
+
+        assert sorted(received) == [
+            ("exact", EventType.SENSOR_ALERT),
+            ("wildcard", EventType.SENSOR_ALERT),
+        ]
+        assert len(bus.get_history()) == 1
+
+
+class TestEventHistory:
+    """Tests for bounded, indexed event history."""
+
+    @pytest.mark.asyncio
+    async def test_history_bounded(self):
+        """Test that the oldest events are evicted from history and indexes."""
+        bus = EventBus(max_history=3)
+
+        for i in range(5):
+            await bus.emit(EventType.SENSOR_READING, {"i": i}, source=f"S{i % 2}")
+
+        history = bus.get_history()
+        assert [e.data["i"] for e in history] == [2, 3, 4]
+        assert [e.data["i"] for e in bus.get_history(source="S0")] == [2, 4]
+        assert [e.data["i"] for e in bus.get_history(source="S1")] == [3]
+        assert len(bus.get_history(event_type=EventType.SENSOR_READING)) == 3
+
+    @pytest.mark.asyncio
+    async def test_filtered_history(self):
+        """Test type, source and combined filters with a limit."""
+        bus = EventBus()
+
+        for i in range(6):
+            event_type = EventType.SENSOR_READING if i % 2 else EventType.SENSOR_ALERT
+            await bus.emit(event_type, {"i": i}, source="A" if i < 3 else "B")
+
+        alerts = bus.get_history(event_type=EventType.SENSOR_ALERT)
+        assert [e.data["i"] for e in alerts] == [0, 2, 4]
+
+        readings_b = bus.get_history(event_type=EventType.SENSOR_READING, source="B")
+        assert [e.data["i"] for e in readings_b] == [3, 5]
+
+        assert [e.data["i"] for e in bus.get_history(limit=2)] == [4, 5]
+        assert bus.get_history(source="missing") == []
+
+    @pytest.mark.asyncio
+    async def test_clear_history(self):
+        """Test clearing history empties the indexes too."""
+        bus = EventBus()
+        await bus.emit(EventType.SYSTEM_STARTED, {}, source="system")
+
+        bus.clear_history()
+
+        assert bus.get_history() == []
+        assert bus.get_history(source="system") == []
+
+
+class TestSubscriptionResolution:
+    """Tests for the cached event-key -> handler resolution."""
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidated_on_subscribe(self):
+        """Test that a subscription added after a publish is picked up."""
+        bus = EventBus()
+        received = []
+
+        await bus.emit(EventType.VALVE_CLOSED, {}, source="V1")
+        assert "valve.closed" in bus._resolved
+
+        bus.subscribe("valve.*", lambda event: received.append(event.type))
+        await bus.emit(EventType.VALVE_CLOSED, {}, source="V1")
+
+        assert received == [EventType.VALVE_CLOSED]
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidated_on_unsubscribe(self):
+        """Test that an unsubscribed handler stops receiving events."""
+        bus = EventBus()
+        received = []
+
+        def handler(event):
+            received.append(event.type)
+
+        bus.subscribe("*", handler)
+        await bus.emit(EventType.SYSTEM_STARTED, {}, source="system")
+        bus.unsubscribe("*", handler)
+        await bus.emit(EventType.SYSTEM_STARTED, {}, source="system")
+
+        assert received == [EventType.SYSTEM_STARTED]
+
+    def test_wildcard_matching(self):
+        """Test resolution of prefix and catch-all patterns."""
+        bus = EventBus()
+
+        def sensor_handler(event):
+            pass
+
+        def all_handler(event):
+            pass
+
+        bus.subscribe("sensor.*", sensor_handler)
+        bus.subscribe("*", all_handler)
+
+        assert set(bus._resolve("sensor.alert")) == {sensor_handler, all_handler}
+        assert bus._resolve("valve.opened") == (all_handler,)
+
+
+class TestQueuedDelivery:
+    """Tests for queued subscribers and overflow policies."""
+
+    @pytest.mark.asyncio
+    async def test_publish_does_not_wait_for_slow_subscriber(self):
+        """Test that publish returns while a queued handler is still busy."""
+        bus = EventBus()
+        release = asyncio.Event()
+        received = []
+
+        async def slow(event):
+            await release.wait()
+            received.append(event.data["i"])
+
+        bus.subscribe(EventType.SENSOR_READING, slow, mode=DeliveryMode.QUEUED)
+
+        for i in range(3):
+            await asyncio.wait_for(
+                bus.emit(EventType.SENSOR_READING, {"i": i}, source="TEST"), timeout=1
+            )
+        assert received == []
+
+        release.set()
+        await bus.close()
+
+        assert received == [0, 1, 2]
+        stats = bus.get_subscriber_stats()[0]
+        assert stats["delivered"] == 3
+        assert stats["depth"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "overflow,expected",
+        [
+            (OverflowPolicy.DROP_OLDEST, [0, 3, 4]),
+            (OverflowPolicy.DROP_NEWEST, [0, 1, 2]),
+        ],
+    )
+    async def test_drop_policies(self, overflow, expected):
+        """Test which events survive when the queue overflows."""
+        bus = EventBus()
+        release = asyncio.Event()
+        received = []
+
+        async def slow(event):
+            await release.wait()
+            received.append(event.data["i"])
+
+        bus.subscribe(
+            EventType.SENSOR_READING, slow,
+            mode=DeliveryMode.QUEUED, queue_size=2, overflow=overflow,
+        )
+
+        await bus.emit(EventType.SENSOR_READING, {"i": 0}, source="TEST")
+        await asyncio.sleep(0)  # worker takes event 0 and blocks in the handler
+        for i in range(1, 5):
+            await bus.emit(EventType.SENSOR_READING, {"i": i}, source="TEST")
+
+        release.set()
+        await bus.close()
+
+        assert received == expected
+        assert bus.get_subscriber_stats()[0]["dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_block_policy(self):
+        """Test that BLOCK makes the publisher wait instead of dropping."""
+        bus = EventBus()
+        received = []
+
+        async def slow(event):
+            await asyncio.sleep(0.01)
+            received.append(event.data["i"])
+
+        bus.subscribe(
+            EventType.ALERT_TRIGGERED, slow,
+            mode=DeliveryMode.QUEUED, queue_size=1, overflow=OverflowPolicy.BLOCK,
+        )
+
+        for i in range(4):
+            await bus.emit(EventType.ALERT_TRIGGERED, {"i": i}, source="TEST")
+        await bus.close()
+
+        assert received == [0, 1, 2, 3]
+        assert bus.get_subscriber_stats()[0]["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_queued(self):
+        """Test that unsubscribing with the original handler removes the queue."""
+        bus = EventBus()
+        received = []
+
+        def handler(event):
+            received.append(event)
+
+        bus.subscribe("sensor.*", handler, mode=DeliveryMode.QUEUED)
+        bus.unsubscribe("sensor.*", handler)
+        await bus.emit(EventType.SENSOR_READING, {}, source="TEST")
+        await asyncio.sleep(0)
+
+        assert received == []
+        assert bus.get_subscriber_stats() == []
+
+
+class TestPriorityLanes:
+    """Tests for priority lanes in queued delivery."""
+
+    def test_event_priorities(self):
+        """Test priority classes on event types."""
+        assert EventType.EMERGENCY_SHUTOFF.priority == EventPriority.CRITICAL
+        assert EventType.ALERT_TRIGGERED.priority == EventPriority.HIGH
+        assert EventType.SENSOR_READING.priority == EventPriority.TELEMETRY
+        assert EventType.SYSTEM_STARTED.priority == EventPriority.NORMAL
+
+    @pytest.mark.asyncio
+    async def test_critical_drained_before_backlog(self):
+        """Test that an emergency jumps a backlog of readings."""
+        bus = EventBus()
+        release = asyncio.Event()
+        received = []
+
+        async def slow(event):
+            await release.wait()
+            received.append(event.type)
+
+        bus.subscribe("*", slow, mode=DeliveryMode.QUEUED, queue_size=100)
+
+        for i in range(50):
+            await bus.emit(EventType.SENSOR_READING, {"i": i}, source="TEST")
+        await asyncio.sleep(0)
+        await bus.emit(EventType.EMERGENCY_SHUTOFF, {}, source="system")
+
+        release.set()
+        await bus.close()
+
+        # The first reading was already in the handler; the emergency is next
+        assert received[0] == EventType.SENSOR_READING
+        assert received[1] == EventType.EMERGENCY_SHUTOFF
+        assert len(received) == 51
+
+    @pytest.mark.asyncio
+    async def test_telemetry_overflow_spares_critical(self):
+        """Test that a full telemetry lane never evicts critical events."""
+        bus = EventBus()
+        release = asyncio.Event()
+        received = []
+
+        async def slow(event):
+            await release.wait()
+            received.append(event.type)
+
+        bus.subscribe("*", slow, mode=DeliveryMode.QUEUED, queue_size=2)
+
+        await bus.emit(EventType.EMERGENCY_SHUTOFF, {}, source="system")
+        await asyncio.sleep(0)
+        await bus.emit(EventType.EMERGENCY_SHUTOFF, {}, source="system")
+        for i in range(10):
+            await bus.emit(EventType.SENSOR_READING, {"i": i}, source="TEST")
+
+        release.set()
+        await bus.close()
+
+        assert received.count(EventType.EMERGENCY_SHUTOFF) == 2
+        assert received.count(EventType.SENSOR_READING) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("overflow", [OverflowPolicy.DROP_OLDEST, OverflowPolicy.DROP_NEWEST])
+    async def test_maxsize_bounds_all_lanes(self, overflow):
+        """Test that maxsize caps the total depth and urgent events evict telemetry."""
+        bus = EventBus()
+        release = asyncio.Event()
+
+        async def slow(event):
+            await release.wait()
+
+        bus.subscribe("*", slow, mode=DeliveryMode.QUEUED, queue_size=3, overflow=overflow)
+
+        await bus.emit(EventType.SYSTEM_STARTED, {}, source="system")
+        await asyncio.sleep(0)  # worker takes it and blocks in the handler
+        for i in range(3):
+            await bus.emit(EventType.SENSOR_READING, {"i": i}, source="TEST")
+        for _ in range(3):
+            await bus.emit(EventType.SYSTEM_STARTED, {}, source="system")
+        await bus.emit(EventType.EMERGENCY_SHUTOFF, {}, source="system")
+
+        stats = bus.get_subscriber_stats()[0]
+        assert stats["depth"] == 3
+        assert stats["depth_by_priority"] == {"critical": 1, "high": 0, "normal": 2, "telemetry": 0}
+        assert stats["dropped"] == 4
+        release.set()
+        await bus.close()
+
+
+class TestEventJournal:
+    """Tests for the segmented on-disk event journal."""
+
+    @pytest.mark.asyncio
+    async def test_append_and_replay(self, tmp_path):
+        """Test that events round-trip through the journal in order."""
+        journal = EventJournal(tmp_path)
+        events = [
+            Event(type=EventType.SENSOR_READING, data={"i": i}, source="TEST")
+            for i in range(5)
+        ]
+        for event in events:
+            journal.append(event)
+        await journal.close()
+
+        replayed = list(EventJournal(tmp_path).replay())
+
+        assert [e.data["i"] for e in replayed] == [0, 1, 2, 3, 4]
+        assert [e.event_id for e in replayed] == [e.event_id for e in events]
+        assert abs((replayed[0].timestamp - events[0].timestamp).total_seconds()) < 1e-3
+
+    def test_replay_filters(self, tmp_path):
+        """Test since, after_seq and event type filters."""
+        journal = EventJournal(tmp_path)
+        base = datetime(2026, 1, 1)
+        for i in range(6):
+            event_type = EventType.SENSOR_ALERT if i % 2 else EventType.SENSOR_READING
+            journal.append(
+                Event(type=event_type, data={"i": i}, source="TEST",
+                      timestamp=base + timedelta(minutes=i))
+            )
+
+        since = [e.data["i"] for e in journal.replay(since=base + timedelta(minutes=3))]
+        assert since == [3, 4, 5]
+        assert [e.data["i"] for e in journal.replay(after_seq=4)] == [4, 5]
+        alerts = journal.replay(event_types=[EventType.SENSOR_ALERT])
+        assert [e.data["i"] for e in alerts] == [1, 3, 5]
+
+    def test_rotation_and_retention(self, tmp_path):
+        """Test that segments rotate by size and old ones are removed."""
+        journal = EventJournal(tmp_path, segment_max_bytes=200, max_segments=2)
+        for i in range(20):
+            journal.append(Event(type=EventType.SENSOR_READING, data={"i": i}, source="TEST"))
+
+        status = journal.get_status()
+        assert status["rotations"] > 2
+        assert status["segments"] <= 3  # two sealed plus the active one
+        replayed = [e.data["i"] for e in journal.replay()]
+        assert replayed == sorted(replayed)
+        assert replayed[-1] == 19
+
+    @pytest.mark.asyncio
+    async def test_rotation_fsyncs_off_loop(self, tmp_path, monkeypatch):
+        """Test that sealing a segment never fsyncs on the event loop thread."""
+        import os
+        import threading
+
+        threads = []
+        real_fsync = os.fsync
+
+        def fsync(fd):
+            threads.append(threading.get_ident())
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        journal = EventJournal(tmp_path, segment_max_bytes=200, fsync_batch=10_000)
+        for i in range(20):
+            journal.append(Event(type=EventType.SENSOR_READING, data={"i": i}, source="TEST"))
+        await journal.close()
+
+        status = journal.get_status()
+        assert status["rotations"] > 2
+        assert status["fsyncs"] >= status["rotations"]
+        assert threads and threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_torn_tail_recovered(self, tmp_path):
+        """Test that a partially written record is dropped on reopen."""
+        journal = EventJournal(tmp_path)
+        for i in range(3):
+            journal.append(Event(type=EventType.SENSOR_READING, data={"i": i}, source="TEST"))
+        await journal.close()
+
+        segment = sorted(tmp_path.glob("*.seg"))[-1]
+        with open(segment, "ab") as f:
+            f.write(b"\x40\x00\x00\x00partial")
+
+        reopened = EventJournal(tmp_path)
+        seq = reopened.append(Event(type=EventType.SENSOR_READING, data={"i": 3}, source="TEST"))
+
+        assert seq == 4
+        assert [e.data["i"] for e in reopened.replay()] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_bus_journal_and_restore(self, tmp_path):
+        """Test that a new bus can rebuild history from the journal."""
+        bus = EventBus(journal=EventJournal(tmp_path))
+        for i in range(3):
+            await bus.emit(EventType.VALVE_CLOSED, {"i": i}, source="V1")
+        await bus.close()
+
+        restarted = EventBus(max_history=2, journal=EventJournal(tmp_path))
+        assert restarted.restore_history() == 3
+        assert [e.data["i"] for e in restarted.get_history(source="V1")] == [1, 2]
+
+        received = []
+        assert await restarted.replay_to(received.append) == 3
+        assert len(received) == 3
+
+
+class TestPublishMany:
+    """Tests for batch publishing and batch-aware subscribers."""
+
+    @pytest.mark.asyncio
+    async def test_batch_subscriber_gets_one_list(self):
+        """Test that a batch subscriber receives every matching event at once."""
+        bus = EventBus()
+        batches = []
+        singles = []
+
+        bus.subscribe("sensor.*", batches.append, batch=True)
+        bus.subscribe(EventType.SENSOR_READING, singles.append)
+
+        events = [
+            Event(type=EventType.SENSOR_READING, data={"i": i}, source=f"S{i}")
+            for i in range(4)
+        ]
+        events.append(Event(type=EventType.VALVE_CLOSED, data={}, source="V1"))
+        await bus.publish_many(events)
+
+        assert len(batches) == 1
+        assert [e.data["i"] for e in batches[0]] == [0, 1, 2, 3]
+        assert [e.data["i"] for e in singles] == [0, 1, 2, 3]
+        assert len(bus.get_history()) == 5
+
+    @pytest.mark.asyncio
+    async def test_batch_subscriber_single_publish(self):
+        """Test that publish() hands a batch subscriber a one-element list."""
+        bus = EventBus()
+        batches = []
+
+        bus.subscribe(EventType.SENSOR_ALERT, batches.append, batch=True)
+        await bus.emit(EventType.SENSOR_ALERT, {}, source="TEST")
+
+        assert len(batches) == 1 and len(batches[0]) == 1
+
+        bus.unsubscribe(EventType.SENSOR_ALERT, batches.append)
+        await bus.emit(EventType.SENSOR_ALERT, {}, source="TEST")
+        assert len(batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_queued_batch_drains_backlog(self):
+        """Test that a queued batch subscriber receives its backlog as one list."""
+        bus = EventBus()
+        release = asyncio.Event()
+        batches = []
+
+        async def slow(events):
+            await release.wait()
+            batches.append([e.data["i"] for e in events])
+
+        bus.subscribe("*", slow, mode=DeliveryMode.QUEUED, batch=True)
+
+        await bus.emit(EventType.SENSOR_READING, {"i": 0}, source="TEST")
+        await asyncio.sleep(0)
+        await bus.publish_many([
+            Event(type=EventType.SENSOR_READING, data={"i": i}, source="TEST")
+            for i in range(1, 6)
+        ])
+
+        release.set()
+        await bus.close()
+
+        assert batches == [[0], [1, 2, 3, 4, 5]]
@@ -0,0 +1,181 @@
+"""
+Tests for multi-sensor fusion into composite alerts.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core import EventBus, EventType, FusionEngine, sensor_reading_event
+from src.core.config import FusionConfig
+from src.core.fusion import SignalWindow
+
+_START = datetime(2026, 1, 1)
+
+
+def reading(sensor_id, value, is_alert=False, t=0.0):
+    event = sensor_reading_event(sensor_id, "unused", value, "", is_alert)
+    event.timestamp = _START + timedelta(seconds=t)
+    return event
+
+
+@pytest.fixture
+def engine():
+    engine = FusionEngine(FusionConfig(), EventBus())
+    engine.register("SMK-K", "Kitchen", "smoke")
+    engine.register("TMP-K", "Kitchen", "temperature")
+    engine.register("TMP-B", "Bedroom", "temperature")
+    engine.register("GAS-K", "Kitchen", "gas_leak")
+    engine.register("CO-K", "Kitchen", "carbon_monoxide")
+    engine.register("WPS-U", "Utility", "water_pressure")
+    engine.register("MOT-U", "Utility", "motion")
+    return engine
+
+
+class TestSignalWindow:
+    """Tests for the bounded per-signal window."""
+
+    def test_incremental_stats_with_eviction(self):
+        """Test that min, max and alert count follow evictions by count and age."""
+        window = SignalWindow(window_seconds=10.0, max_samples=3)
+        for t, value, alert in [(0, 5.0, True), (1, 9.0, False), (2, 1.0, False), (3, 4.0, False)]:
+            window.append(float(t), value, alert)
+
+        assert len(window) == 3
+        assert (window.min, window.max, window.alerts) == (1.0, 9.0, 0)
+
+        window.expire(12.5)  # only the t=3 sample is still inside the window
+        assert (window.min, window.max, window.last) == (4.0, 4.0, 4.0)
+
+
+class TestFusionEngine:
+    """Tests for FusionEngine rules and incident handling."""
+
+    def test_smoke_alone_is_not_confirmed(self, engine):
+        """Test that a single-sensor alert does not produce a composite alert."""
+        alerts = []
+        for t in range(5):
+            alerts += engine.process(reading("SMK-K", 30.0, True, t))
+            alerts += engine.process(reading("TMP-K", 70.0, False, t))
+
+        assert alerts == []
+
+    def test_smoke_with_temperature_rise(self, engine):
+        """Test that smoke plus a heat rise in the same zone is one composite alert."""
+        alerts = []
+        for t in range(6):
+            alerts += engine.process(reading("TMP-K", 70.0 + 4 * t, False, t))
+            alerts += engine.process(reading("SMK-K", 30.0, True, t))
+
+        # Opened once, re-alerted once as confidence climbed
+        assert len(alerts) == 2
+        assert alerts[0].data["confidence"] < alerts[1].data["confidence"]
+        alert = alerts[-1]
+        assert alert.type == EventType.ALERT_COMPOSITE
+        assert alert.data["sensor_type"] == "fire"
+        assert alert.data["zone"] == "Kitchen"
+        assert alert.data["confidence"] >= 0.9
+        assert alert.data["severity"] == "critical"
+        assert alert.data["sensors"] == ["SMK-K", "TMP-K"]
+
+    def test_zones_are_not_mixed(self, engine):
+        """Test that evidence from another zone does not count."""
+        alerts = []
+        for t in range(6):
+            alerts += engine.process(reading("TMP-B", 70.0 + 4 * t, False, t))
+            alerts += engine.process(reading("SMK-K", 30.0, True, t))
+
+        assert alerts == []
+
+    def test_incident_clears_and_reopens(self, engine):
+        """Test that an incident closes once its evidence ages out, then can alert again."""
+        first = engine.process(reading("GAS-K", 80.0, True, 0)) + engine.process(
+            reading("CO-K", 60.0, True, 1)
+        ) + engine.process(reading("CO-K", 60.0, True, 2))
+        assert [a.data["sensor_type"] for a in first] == ["combustion_gas"]
+
+        engine.process(reading("GAS-K", 5.0, False, 500))
+        assert engine.get_status()["incidents"] == {}
+
+        again = engine.process(reading("GAS-K", 80.0, True, 501)) + engine.process(
+            reading("CO-K", 60.0, True, 502)
+        ) + engine.process(reading("GAS-K", 80.0, True, 503))
+        assert len(again) == 1
+
+    def test_pressure_drop_explained_by_usage(self, engine):
+        """Test that water use in the zone keeps a pressure drop from alerting."""
+        engine.process(reading("MOT-U", 1.0, True, 0))
+        alerts = []
+        for t, psi in enumerate([50.0, 45.0, 28.0, 26.0]):
+            alerts += engine.process(reading("WPS-U", psi, psi < 30, t + 1))
+        assert alerts == []
+
+        # Same drop after the motion has aged out of the window
+        alerts = []
+        for t, psi in enumerate([50.0, 45.0, 28.0, 26.0]):
+            alerts += engine.process(reading("WPS-U", psi, psi < 30, t + 300))
+        assert [a.data["sensor_type"] for a in alerts] == ["water_leak"]
+        assert alerts[0].data["evidence"]["no_usage"] == 1.0
+
+    def test_zone_count_is_bounded(self):
+        """Test that the least recently updated zone is dropped at max_zones."""
+        engine = FusionEngine(FusionConfig(max_zones=2), EventBus())
+        for i in range(3):
+            engine.register(f"SMK-{i}", f"Property{i}/Kitchen", "smoke")
+            engine.process(reading(f"SMK-{i}", 30.0, True, i))
+
+        status = engine.get_status()
+        assert status["zones"] == 2
+        assert status["evicted_zones"] == 1
+
+
+class TestMonitorFusion:
+    """Tests for fusion wiring in the monitor."""
+
+    @pytest.mark.asyncio
+    async def test_composite_alert_published(self, monitor):
+        """Test that monitor sensors are registered by zone and alerts reach the bus."""
+        published = []
+
+        async def on_alert(event):
+            published.append(event)
+
+        monitor._event_bus.subscribe(EventType.ALERT_COMPOSITE, on_alert)
+        gas = monitor.add_gas_sensor(location="Kitchen")
+        co = monitor.add_co_sensor(location="Kitchen")
+        assert monitor._fusion._sensors[co.sensor_id] == ("Kitchen", "carbon_monoxide")
+
+        await monitor._event_bus.publish_many([
+            sensor_reading_event(gas.sensor_id, "gas_leak", 120.0, "PPM", True),
+            sensor_reading_event(co.sensor_id, "gas_leak", 150.0, "PPM", True),
+            sensor_reading_event(gas.sensor_id, "gas_leak", 130.0, "PPM", True),
+            sensor_reading_event(co.sensor_id, "gas_leak", 160.0, "PPM", True),
+        ])
+
+        assert {e.data["sensor_type"] for e in published} == {"combustion_gas"}
+        assert published[-1].data["confidence"] == 1.0
+        assert published[0].source == "fusion:Kitchen"
+
+    @pytest.mark.asyncio
+    async def test_ambient_compensation_stays_in_zone(self, test_config):
+        """Test that gas sensors are only compensated by temperature sensors in their zone."""
+        from src.core.monitor import LuxxHausMonitor
+
+        test_config.sensors.calibration.ambient_compensation = True
+        monitor = LuxxHausMonitor(simulation_mode=True)
+        kitchen_gas = monitor.add_gas_sensor(sensor_id="GAS-K", location="Kitchen")
+        attic_gas = monitor.add_gas_sensor(sensor_id="GAS-A", location="Attic")
+        monitor.add_temperature_sensor(sensor_id="TMP-A", location="Attic")
+        kitchen_table = kitchen_gas.table
+
+        await monitor._event_bus.publish_many([
+            sensor_reading_event("TMP-A", "temperature", 41.0, "F"),
+        ])
+
+        assert kitchen_gas.table is kitchen_table
+        assert attic_gas.table.temperature_c == 5.0
+
+    def test_ambient_compensation_off_by_default(self, monitor):
+        """Test that the monitor does not compensate gas sensors unless enabled."""
+        key = (EventType.SENSOR_READING.value, monitor._handle_ambient_readings)
+        assert key not in monitor._event_bus._batch_adapters
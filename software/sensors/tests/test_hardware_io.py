@@ -0,0 +1,138 @@
+"""
+Tests for offloaded hardware reads and event loop lag monitoring.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.core import IOExecutor, LoopLagMonitor
+
+
+class TestIOExecutor:
+    """Tests for the per-bus I/O executor."""
+
+    @pytest.mark.asyncio
+    async def test_same_bus_is_serialized(self):
+        """Test that reads on one bus never overlap."""
+        executor = IOExecutor()
+        active = []
+        overlaps = []
+
+        def read():
+            active.append(1)
+            if len(active) > 1:
+                overlaps.append(1)
+            time.sleep(0.01)
+            active.pop()
+            return threading.current_thread().name
+
+        names = await asyncio.gather(*(executor.run("spi0", read) for _ in range(5)))
+        executor.shutdown()
+
+        assert not overlaps
+        assert len(set(names)) == 1
+        assert executor.get_status()["spi0"]["calls"] == 5
+
+    @pytest.mark.asyncio
+    async def test_buses_run_in_parallel(self):
+        """Test that different buses do not wait for each other."""
+        executor = IOExecutor()
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            executor.run("spi0", time.sleep, 0.1),
+            executor.run("i2c1", time.sleep, 0.1),
+            executor.run("gpio", time.sleep, 0.1),
+        )
+        elapsed = time.perf_counter() - start
+        executor.shutdown()
+
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_loop_stays_responsive(self):
+        """Test that a blocking read does not stall the event loop."""
+        executor = IOExecutor()
+        lag = LoopLagMonitor(interval=0.01, warn_threshold=0.05)
+        lag.start()
+
+        await executor.run("gpio", time.sleep, 0.2)
+        await lag.stop()
+        executor.shutdown()
+
+        assert lag.probes > 5
+        assert lag.stalls == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_errors_counted(self):
+        """Test that timeouts and read errors are raised and recorded."""
+        executor = IOExecutor(timeout=0.05)
+
+        def fail():
+            raise OSError("SPI transfer failed")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run("spi0", time.sleep, 0.2)
+        with pytest.raises(OSError):
+            await executor.run("i2c1", fail)
+        executor.shutdown()
+
+        status = executor.get_status()
+        assert status["spi0"]["timeouts"] == 1
+        assert status["i2c1"]["errors"] == 1
+
+
+class TestLoopLagMonitor:
+    """Tests for LoopLagMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_detects_blocked_loop(self):
+        """Test that a synchronous call on the loop is reported as a stall."""
+        lag = LoopLagMonitor(interval=0.01, warn_threshold=0.05)
+        lag.start()
+        await asyncio.sleep(0.03)
+
+        time.sleep(0.1)  # a read that was not offloaded
+        await asyncio.sleep(0.03)
+        await lag.stop()
+
+        status = lag.get_status()
+        assert status["stalls"] >= 1
+        assert status["max_lag_ms"] >= 80
+
+
+class TestBlockingSensorRead:
+    """Tests for BaseSensor's blocking read declaration."""
+
+    @pytest.mark.asyncio
+    async def test_blocking_read_runs_on_bus_worker(self, test_config, water_sensor):
+        """Test that a blocking sensor reads on its bus thread, not the loop."""
+        from src.core import get_io_executor
+
+        threads = []
+
+        def read_value():
+            threads.append(threading.current_thread())
+            return 42.0
+
+        water_sensor.read_value = read_value
+        water_sensor.simulation_mode = False  # hardware path, value stubbed above
+
+        reading = await water_sensor.take_reading(emit=False)
+
+        assert reading.value == 42.0
+        assert threads[0] is not threading.main_thread()
+        assert get_io_executor().get_status()["spi0"]["calls"] == 1
+        get_io_executor().shutdown()
+
+    @pytest.mark.asyncio
+    async def test_simulated_read_stays_inline(self, test_config, water_sensor):
+        """Test that simulated reads skip the executor."""
+        from src.core import get_io_executor
+
+        await water_sensor.take_reading(emit=False)
+
+        assert get_io_executor().get_status() == {}
@@ -0,0 +1,222 @@
+"""
+Tests for the LUXX HAUS monitor's sampling scheduler.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core import EventBus, SamplingScheduler, sensor_reading_event
+
+
+class FakeSensor:
+    """Minimal stand-in for BaseSensor that records when it was sampled."""
+
+    def __init__(self, sensor_id, sample_interval, work=0.0, block=0.0):
+        self.sensor_id = sensor_id
+        self.sample_interval = sample_interval
+        self.is_monitoring = False
+        self.work = work
+        self.block = block
+        self.sampled_at = []
+
+    async def take_reading(self, emit=True):
+        self.sampled_at.append(asyncio.get_running_loop().time())
+        if self.block:
+            time.sleep(self.block)  # hog the loop, like a blocking driver
+        if self.work:
+            await asyncio.sleep(self.work)
+        return self
+
+    def reading_event(self, reading):
+        return sensor_reading_event(self.sensor_id, "water_pressure", 1.0, "PSI")
+
+
+async def run_for(scheduler: SamplingScheduler, seconds: float) -> None:
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(seconds)
+    scheduler.stop()
+    await task
+    await scheduler.drain()
+
+
+class TestSamplingScheduler:
+    """Tests for SamplingScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_shared_interval(self):
+        """Test that sensors sharing an interval are published as one batch."""
+        bus = EventBus()
+        batches = []
+        bus.subscribe("sensor.reading", batches.append, batch=True)
+
+        scheduler = SamplingScheduler(bus)
+        sensors = [FakeSensor(f"S{i}", 0.05) for i in range(3)]
+        for sensor in sensors:
+            scheduler.add(sensor)
+
+        await run_for(scheduler, 0.22)
+
+        assert batches
+        assert all(len(batch) == 3 for batch in batches)
+        assert scheduler.get_status()["groups"] == {"0.05s": 3}
+        assert all(sensor.is_monitoring for sensor in sensors)
+
+    @pytest.mark.asyncio
+    async def test_deadlines_do_not_drift(self):
+        """Test that processing time does not push later samples back."""
+        scheduler = SamplingScheduler(EventBus())
+        sensor = FakeSensor("S1", 0.05, work=0.02)
+        scheduler.add(sensor)
+
+        await run_for(scheduler, 0.53)
+
+        times = sensor.sampled_at
+        assert len(times) >= 9
+        # Every sample lands on the interval grid, even after many rounds
+        for t in times:
+            offset = t % 0.05
+            assert min(offset, 0.05 - offset) < 0.015
+        elapsed = times[-1] - times[0]
+        assert abs(elapsed - 0.05 * (len(times) - 1)) < 0.015
+
+    @pytest.mark.asyncio
+    async def test_missed_deadlines_counted(self):
+        """Test that a loop-blocking round is reported as missed deadlines."""
+        scheduler = SamplingScheduler(EventBus())
+        scheduler.add(FakeSensor("SLOW", 0.02, block=0.07))
+
+        await run_for(scheduler, 0.2)
+
+        status = scheduler.get_status()
+        assert status["missed_deadlines"] > 0
+        assert status["max_jitter_ms"] > 20
+
+    @pytest.mark.asyncio
+    async def test_stuck_sensor_does_not_hold_back_group(self):
+        """Test that a hanging read only costs that sensor its deadlines."""
+        bus = EventBus()
+        batches = []
+        bus.subscribe("sensor.reading", batches.append, batch=True)
+
+        scheduler = SamplingScheduler(bus)
+        healthy = FakeSensor("HEALTHY", 0.05)
+        stuck = FakeSensor("STUCK", 0.05, work=0.12)
+        scheduler.add(healthy)
+        scheduler.add(stuck)
+
+        await run_for(scheduler, 0.33)
+
+        # Sampled at every deadline, and published without waiting for STUCK
+        assert len(healthy.sampled_at) >= 6
+        assert len(stuck.sampled_at) <= 3
+        assert scheduler.get_status()["missed_deadlines"] >= 3
+        assert sum(len(batch) for batch in batches) >= len(healthy.sampled_at)
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_round_in_flight(self):
+        """Test that readings sampled just before stop() are still published."""
+        bus = EventBus()
+        batches = []
+        bus.subscribe("sensor.reading", batches.append, batch=True)
+
+        scheduler = SamplingScheduler(bus)
+        sensor = FakeSensor("SLOW-STOP", 0.2, work=0.05)
+        scheduler.add(sensor)
+
+        task = asyncio.create_task(scheduler.run())
+        while not sensor.sampled_at:
+            await asyncio.sleep(0.01)
+        scheduler.stop()
+        await task
+        await scheduler.drain()
+
+        assert [len(batch) for batch in batches] == [1]
+
+    @pytest.mark.asyncio
+    async def test_monitor_stop_closes_database(self, monitor):
+        """Test that stopping the monitor drains sampling and closes the database."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        monitor._db = MagicMock(record_event=AsyncMock(), close=AsyncMock())
+        monitor._scheduler.drain = AsyncMock()
+        monitor.is_running = True
+
+        await monitor.stop()
+
+        monitor._scheduler.drain.assert_awaited_once()
+        monitor._db.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reschedule_and_remove(self):
+        """Test moving a sensor between intervals and removing it."""
+        scheduler = SamplingScheduler(EventBus())
+        fast = FakeSensor("FAST", 0.02)
+        scheduler.add(fast)
+
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.1)
+        fast.sample_interval = 0.5
+        scheduler.reschedule(fast)
+        count = len(fast.sampled_at)
+        await asyncio.sleep(0.15)
+        assert len(fast.sampled_at) - count <= 1
+
+        scheduler.remove(fast)
+        assert not fast.is_monitoring
+        scheduler.stop()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_adaptive_interval_moves_group(self):
+        """Test that a sensor changing its own interval is regrouped after the round."""
+        scheduler = SamplingScheduler(EventBus())
+        sensor = FakeSensor("ADAPT", 0.02)
+        scheduler.add(sensor)
+
+        original = sensor.take_reading
+
+        async def slow_down(emit=True):
+            sensor.sample_interval = 0.2
+            return await original(emit)
+
+        sensor.take_reading = slow_down
+
+        await run_for(scheduler, 0.3)
+
+        # One fast sample, then roughly one per 0.2s
+        assert len(sensor.sampled_at) <= 3
+        assert scheduler.get_status()["groups"] == {"0.2s": 1}
+        assert scheduler.rate_changes == 1
+
+    @pytest.mark.asyncio
+    async def test_adc_round_uses_batch_evaluator(self, test_config):
+        """Test that hardware ADC sensors in a round are evaluated as a batch."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.sensors import GasLeakSensor, SharedMCP3008, WaterPressureSensor, adc as adc_module
+
+        test_config.system.simulation_mode = False
+        test_config.sensors.batch_min_sensors = 2
+        adc_module._adcs[("spi0", "D5")] = SharedMCP3008(device=MagicMock(), max_age=10.0)
+
+        bus = EventBus()
+        published = []
+        bus.publish_many = AsyncMock(side_effect=published.extend)
+        scheduler = SamplingScheduler(bus)
+
+        sensors = [
+            WaterPressureSensor(sensor_id="BATCH-W", adc_channel=0),
+            GasLeakSensor(sensor_id="BATCH-G", adc_channel=1),
+            FakeSensor("BATCH-F", 1.0),
+        ]
+        for sensor in sensors[:2]:
+            sensor._db = MagicMock(queue_reading=AsyncMock(), record_alert=AsyncMock())
+
+        await scheduler._run_round(1.0, sensors)
+
+        assert scheduler.get_status()["batch_evaluation"]["evaluated"] == 2
+        assert sorted(event.data["sensor_id"] for event in published) == [
+            "BATCH-F", "BATCH-G", "BATCH-W",
+        ]
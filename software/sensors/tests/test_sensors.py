@@ -72,13 +72,14 @@ class TestWaterPressureSensor:
     async def test_take_reading(self, sensor):
         """Test taking a reading."""
         with patch.object(sensor, '_db') as mock_db:
-            mock_db.log_reading = AsyncMock()
+            mock_db.queue_reading = AsyncMock()
             
             reading = await sensor.take_reading()
             
             assert reading.sensor_id == "TEST-WPS-001"
             assert reading.sensor_type == SensorType.WATER_PRESSURE
             assert reading.unit == "PSI"
+            mock_db.queue_reading.assert_awaited_once()
 
     def test_get_status(self, sensor):
         """Test status reporting."""
@@ -265,3 +266,780 @@ class TestSensorStatistics:
         """Test trend detection with stable readings."""
         trend = sensor_with_readings.get_trend(10)
         assert trend == "stable"
+
+
+class TestReadingHistory:
+    """Tests for the ring-buffer reading history."""
+
+    @pytest.fixture
+    def history(self):
+        """Create a small history so wraparound is easy to exercise."""
+        from src.sensors.history import ReadingHistory
+
+        return ReadingHistory(
+            capacity=5,
+            sensor_id="TEST-HIST",
+            sensor_type=SensorType.WATER_PRESSURE,
+            unit="PSI",
+        )
+
+    def test_capacity_bound(self, history):
+        """Test that the oldest points are overwritten once full."""
+        for i in range(12):
+            history.push(float(i), 1000.0 + i)
+
+        assert len(history) == 5
+        assert [r.value for r in history] == [7.0, 8.0, 9.0, 10.0, 11.0]
+        assert history[-1].value == 11.0
+        assert [r.value for r in history[-2:]] == [10.0, 11.0]
+
+    def test_statistics_after_wraparound(self, history):
+        """Test running min/max/mean stay correct as extremes are evicted."""
+        values = [5.0, 1.0, 9.0, 3.0, 4.0, 6.0, 2.0, 8.0]
+        for i, value in enumerate(values):
+            history.push(value, 1000.0 + i)
+
+        window = values[-5:]
+        assert history.min() == min(window)
+        assert history.max() == max(window)
+        assert history.mean() == pytest.approx(sum(window) / 5)
+        assert history.min(2) == 2.0
+        assert history.max(3) == 8.0
+
+    def test_reading_round_trip(self, history):
+        """Test that stored points rebuild equivalent Reading objects."""
+        from src.sensors.base import Reading
+
+        reading = Reading(
+            sensor_id="TEST-HIST",
+            sensor_type=SensorType.WATER_PRESSURE,
+            value=42.5,
+            unit="PSI",
+            is_alert=True,
+            severity=AlertSeverity.CRITICAL,
+        )
+        history.append(reading)
+
+        rebuilt = history[0]
+        assert rebuilt.value == 42.5
+        assert rebuilt.severity == AlertSeverity.CRITICAL
+        assert rebuilt.is_alert
+        assert abs((rebuilt.timestamp - reading.timestamp).total_seconds()) < 1e-3
+
+    def test_empty_history(self, history):
+        """Test statistics on an empty history."""
+        assert not history
+        assert history.mean() == 0.0
+        assert history.min() == 0.0
+        assert history.max() == 0.0
+
+
+class FakeSPIDevice:
+    """SPI device stand-in that answers MCP3008 conversions with fixed counts."""
+
+    def __init__(self, counts):
+        self.counts = counts
+        self.sessions = 0
+        self.transfers = 0
+
+    def __enter__(self):
+        self.sessions += 1
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_readinto(self, out, buf):
+        self.transfers += 1
+        channel = (out[1] >> 4) & 0x07
+        count = self.counts[channel]
+        buf[0] = 0
+        buf[1] = (count >> 8) & 0x03
+        buf[2] = count & 0xFF
+
+
+class TestSharedADC:
+    """Tests for the shared MCP3008 manager."""
+
+    @pytest.fixture
+    def device(self):
+        return FakeSPIDevice({0: 512, 1: 1023, 2: 100})
+
+    @pytest.fixture
+    def adc(self, device):
+        from src.sensors import SharedMCP3008
+
+        return SharedMCP3008(device=device, max_age=10.0)
+
+    def test_one_sweep_per_tick(self, adc, device):
+        """Test that channels read in the same tick share one SPI session."""
+        channels = [adc.channel(ch) for ch in (0, 1, 2)]
+
+        counts = [channel.counts for channel in channels]
+
+        assert counts == [512, 1023, 100]
+        assert device.sessions == 1
+        assert device.transfers == 3
+        assert adc.get_status()["cached_reads"] == 2
+
+    def test_stale_sweep_is_redone(self, adc, device):
+        """Test that a read after max_age triggers a new sweep."""
+        channel = adc.channel(0)
+        channel.counts
+        adc.max_age = 0.0
+        device.counts[0] = 300
+
+        assert channel.counts == 300
+        assert device.sessions == 2
+
+    def test_voltage_matches_analog_in(self, adc):
+        """Test the AnalogIn-compatible voltage and value attributes."""
+        channel = adc.channel(1)
+
+        assert channel.voltage == pytest.approx(3.3)
+        assert channel.value == 1023 << 6
+
+    def test_sensors_share_one_adc(self, test_config, device):
+        """Test that sensors on the same bus/CS get the same device."""
+        from src.sensors import SharedMCP3008, adc as adc_module
+
+        test_config.system.simulation_mode = False
+        shared = SharedMCP3008(device=device, max_age=10.0)
+        adc_module._adcs[("spi0", "D5")] = shared
+
+        water = WaterPressureSensor(sensor_id="TEST-ADC-W", adc_channel=0)
+        gas = GasLeakSensor(sensor_id="TEST-ADC-G", adc_channel=1)
+
+        assert not water.simulation_mode and not gas.simulation_mode
+        assert water._adc.adc is gas._adc.adc is shared
+        assert shared.channels == (0, 1)
+
+        water.read_value()
+        gas.read_value()
+        assert device.sessions == 1
+
+
+class TestEdgeTriggeredSensor:
+    """Tests for interrupt-driven GPIO sensors."""
+
+    @pytest.fixture
+    def gpio(self):
+        from src.sensors import SimulatedGPIO
+
+        return SimulatedGPIO()
+
+    @pytest.fixture
+    def motion(self, test_config, gpio):
+        from src.sensors import MotionSensor
+
+        return MotionSensor(sensor_id="TEST-PIR", gpio_pin=23, gpio=gpio)
+
+    @staticmethod
+    async def interrupt(gpio, pin, *levels):
+        """Drive pin levels from another thread, like RPi.GPIO's callback thread."""
+        def drive():
+            for level in levels:
+                gpio.set(pin, level)
+
+        await asyncio.get_running_loop().run_in_executor(None, drive)
+
+    @staticmethod
+    async def settle(sensor, count, timeout=1.0):
+        """Wait until the edge readings have been fully processed."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while len(sensor.readings) < count or (sensor._drain and not sensor._drain.done()):
+            assert asyncio.get_running_loop().time() < deadline, "readings not delivered"
+            await asyncio.sleep(0.001)
+
+    @pytest.mark.asyncio
+    async def test_reading_per_state_change(self, motion, gpio):
+        """Test that rising and falling edges each produce one reading."""
+        assert motion.edge_triggered
+        motion.arm()
+
+        await self.interrupt(gpio, 23, 1)
+        await self.settle(motion, 1)
+        assert motion.motion_detected
+        assert motion.seconds_since_motion() == 0.0
+
+        await self.interrupt(gpio, 23, 0)
+        await self.settle(motion, 2)
+        motion.stop_monitoring()
+
+        assert [r.value for r in motion.readings] == [1.0, 0.0]
+        assert motion.total_motion_events == 1
+        assert motion.max_latency < 0.1
+
+    @pytest.mark.asyncio
+    async def test_fast_toggles_keep_order(self, motion, gpio):
+        """Test that changes arriving together are read in order."""
+        motion.arm()
+
+        await self.interrupt(gpio, 23, 1, 0, 1)
+        await self.settle(motion, 3)
+        motion.stop_monitoring()
+
+        assert [r.value for r in motion.readings] == [1.0, 0.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_repeated_level_is_suppressed(self, motion):
+        """Test that an edge without a level change takes no reading."""
+        motion.arm()
+
+        motion._on_edge(0, 0.0)
+        await asyncio.sleep(0.01)
+        motion.stop_monitoring()
+
+        assert motion.edges == 1
+        assert motion.suppressed_edges == 1
+        assert len(motion.readings) == 0
+
+    @pytest.mark.asyncio
+    async def test_disarmed_sensor_ignores_edges(self, motion, gpio):
+        """Test that no readings arrive after disarming, and polling reads the pin."""
+        motion.arm()
+        motion.disarm()
+
+        await self.interrupt(gpio, 23, 1)
+        await asyncio.sleep(0.01)
+
+        assert len(motion.readings) == 0
+        assert motion.read_value() == 1.0
+
+    @pytest.mark.asyncio
+    async def test_photoelectric_alert_on_edge(self, test_config, gpio):
+        """Test that the smoke module's alarm output raises an alert on its edge."""
+        from src.sensors import PhotoelectricSmokeSensor
+
+        smoke = PhotoelectricSmokeSensor(sensor_id="TEST-PHOTO", gpio_pin=18, gpio=gpio)
+        alerts = []
+        smoke.on_alert(alerts.append)
+
+        with patch.object(smoke, '_db') as mock_db:
+            mock_db.queue_reading = AsyncMock()
+            mock_db.record_alert = AsyncMock()
+            smoke.arm()
+
+            await self.interrupt(gpio, 18, 1)
+            await self.settle(smoke, 1)
+            smoke.stop_monitoring()
+
+        assert alerts and alerts[0].severity == AlertSeverity.CRITICAL
+
+    def test_simulation_without_gpio_polls(self, test_config):
+        """Test that a simulated sensor without a backend is polled as before."""
+        from src.sensors import MotionSensor
+
+        motion = MotionSensor(sensor_id="TEST-PIR-SIM", simulation_mode=True)
+
+        assert not motion.edge_triggered
+        assert motion.read_value() in (0.0, 1.0)
+
+
+class TestAdaptiveSampling:
+    """Tests for the adaptive sample-rate policy."""
+
+    @pytest.fixture
+    def policy(self):
+        from src.sensors.sampling import AdaptiveSamplingPolicy
+
+        return AdaptiveSamplingPolicy(min_interval=1.0, max_interval=8.0, settle_samples=2)
+
+    def test_backs_off_when_calm(self, policy):
+        """Test that stable, distant values slow sampling one step at a time."""
+        intervals = [policy.update(10.0, distance=0.8, scale=50.0, is_alert=False) for _ in range(8)]
+
+        assert intervals == [1.0, 2.0, 2.0, 4.0, 4.0, 8.0, 8.0, 8.0]
+
+    def test_backs_off_with_noise(self, policy):
+        """Test that small noise steps far from the threshold still let sampling slow down."""
+        intervals = [
+            policy.update(10.0 + (0.05 if i % 2 else -0.05), distance=0.8, scale=50.0, is_alert=False)
+            for i in range(20)
+        ]
+
+        assert intervals[-1] > intervals[0]
+        assert policy.get_status()["slowdowns"] >= 2
+
+    def test_ramps_up_immediately(self, policy):
+        """Test that nearing a threshold or jumping restores the fast rate at once."""
+        for _ in range(6):
+            policy.update(10.0, distance=0.8, scale=50.0, is_alert=False)
+        assert policy.interval == 8.0
+
+        # Large step while still far from the threshold
+        assert policy.update(25.0, distance=0.5, scale=50.0, is_alert=False) == 1.0
+
+        for _ in range(6):
+            policy.update(25.0, distance=0.5, scale=50.0, is_alert=False)
+        # Close to the threshold
+        assert policy.update(25.0, distance=0.02, scale=50.0, is_alert=False) == 1.0
+
+    def test_alert_forces_fast_rate(self, policy):
+        """Test that an alert always samples at the fastest rate."""
+        for _ in range(6):
+            policy.update(10.0, distance=0.8, scale=50.0, is_alert=False)
+
+        assert policy.update(10.0, distance=0.8, scale=50.0, is_alert=True) == 1.0
+
+    @pytest.mark.asyncio
+    async def test_sensor_interval_follows_signal(self, test_config):
+        """Test that a gas sensor slows down at rest and speeds up on a rising reading."""
+        from src.core.config import AdaptiveSamplingConfig
+
+        test_config.sensors.adaptive_sampling["gas_leak"] = AdaptiveSamplingConfig(max_interval_seconds=4.0)
+        sensor = GasLeakSensor(sensor_id="TEST-ADAPT", threshold_ppm=50.0, simulation_mode=True)
+        base = sensor.sample_interval
+        values = iter([5.0] * 12 + [30.0])
+        sensor.read_value = lambda: next(values)
+
+        with patch.object(sensor, '_db') as mock_db:
+            mock_db.queue_reading = AsyncMock()
+            for _ in range(12):
+                await sensor.take_reading(emit=False)
+            assert sensor.sample_interval > base
+
+            await sensor.take_reading(emit=False)
+            assert sensor.sample_interval == base
+
+    def test_disabled_by_config(self, test_config):
+        """Test that a disabled policy leaves the sample interval fixed."""
+        test_config.sensors.adaptive_sampling["temperature"].enabled = False
+
+        sensor = TemperatureSensor(sensor_id="TEST-FIXED", simulation_mode=True)
+
+        assert sensor.sampling_policy is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("make_sensor, resting, critical", [
+        (lambda: WaterPressureSensor(sensor_id="TEST-WPS-STEP", simulation_mode=True), 60.0, 5.0),
+        (lambda: GasLeakSensor(sensor_id="TEST-GLD-STEP", simulation_mode=True), 5.0, 600.0),
+        (lambda: SmokeSensor(sensor_id="TEST-SMK-STEP", simulation_mode=True), 1.0, 60.0),
+    ])
+    async def test_safety_step_caught_within_base_interval(self, test_config, make_sensor, resting, critical):
+        """Test that a safety sensor at rest still catches a step to critical within one base interval."""
+        sensor = make_sensor()
+        base = sensor.sample_interval
+        values = iter([resting] * 50 + [critical])
+        sensor.read_value = lambda: next(values)
+
+        with patch.object(sensor, '_db') as mock_db, patch.object(sensor, '_on_alert', new=AsyncMock()):
+            mock_db.queue_reading = AsyncMock()
+            mock_db.record_alert = AsyncMock()
+            for _ in range(50):
+                await sensor.take_reading(emit=False)
+                assert sensor.sample_interval == base  # next read is never further away
+
+            reading = await sensor.take_reading(emit=False)
+
+        assert reading.severity == AlertSeverity.CRITICAL
+
+
+class TestBatchEvaluator:
+    """Tests for vectorized conversion and threshold classification."""
+
+    @pytest.fixture
+    def sensors(self, test_config):
+        from src.sensors import SharedMCP3008, adc as adc_module
+        from src.sensors.water_pressure import HoneywellPX2Sensor
+
+        test_config.system.simulation_mode = False
+        device = FakeSPIDevice({0: 700, 1: 420, 2: 30, 3: 300, 4: 900, 5: 5, 6: 600, 7: 1000})
+        adc_module._adcs[("spi0", "D5")] = SharedMCP3008(device=device, max_age=10.0)
+
+        return [
+            WaterPressureSensor(sensor_id="TEST-B-W0", adc_channel=0),
+            HoneywellPX2Sensor(sensor_id="TEST-B-PX2", adc_channel=1),
+            GasLeakSensor(sensor_id="TEST-B-G2", adc_channel=2),
+            GasLeakSensor(sensor_id="TEST-B-G3", gas_type=GasType.PROPANE, adc_channel=3),
+            GasLeakSensor(sensor_id="TEST-B-G4", gas_type=GasType.CARBON_MONOXIDE, adc_channel=4),
+            SmokeSensor(sensor_id="TEST-B-S5", adc_channel=5),
+            SmokeSensor(sensor_id="TEST-B-S6", adc_channel=6),
+            GasLeakSensor(sensor_id="TEST-B-G7", adc_channel=7),
+        ]
+
+    def test_matches_scalar_path(self, sensors):
+        """Test that batched values and severities equal the per-sensor results."""
+        import numpy as np
+        from src.sensors import BatchEvaluator
+
+        evaluator = BatchEvaluator(min_sensors=8)
+        batched, single = evaluator.partition(sensors)
+        assert batched == sensors and single == []
+
+        voltages = np.array([sensor._adc.voltage for sensor in sensors])
+        values, codes = evaluator.evaluate(sensors, voltages)
+
+        severities = [None, AlertSeverity.WARNING, AlertSeverity.DANGER, AlertSeverity.CRITICAL]
+        for sensor, value, code in zip(sensors, values, codes):
+            expected = sensor.read_value()
+            assert value == pytest.approx(expected, rel=1e-9)
+            assert severities[code + 1] == sensor.check_threshold(expected)
+
+    def test_small_or_simulated_rounds_stay_scalar(self, sensors):
+        """Test that few sensors, or simulated ones, are not batched."""
+        from src.sensors import BatchEvaluator
+
+        assert BatchEvaluator(min_sensors=9).partition(sensors) == ([], sensors)
+
+        sensors[0].simulation_mode = True
+        assert BatchEvaluator(min_sensors=8).partition(sensors) == ([], sensors)
+
+    @pytest.mark.asyncio
+    async def test_take_readings(self, sensors):
+        """Test that a batch round records readings and alerts per sensor."""
+        from src.core import get_io_executor
+        from src.sensors import BatchEvaluator
+
+        evaluator = BatchEvaluator(min_sensors=8)
+        for sensor in sensors:
+            sensor._db = MagicMock()
+            sensor._db.queue_reading = AsyncMock()
+            sensor._db.record_alert = AsyncMock()
+
+        readings = await evaluator.take_readings(sensors)
+        get_io_executor().shutdown()
+
+        assert [r.sensor_id for r in readings] == [s.sensor_id for s in sensors]
+        for sensor, reading in zip(sensors, readings):
+            assert reading.is_alert == (sensor.check_threshold(reading.value) is not None)
+        # One SPI read for the whole round, arrays built once
+        assert get_io_executor().get_status()["spi0"]["calls"] == 1
+        assert evaluator.get_status()["rebuilds"] == 1
+
+    def test_gas_curve_matches_datasheet_formula(self, test_config):
+        """Test that the precomputed curve equals 10^((log10(ratio) - b) / m)."""
+        import math
+
+        sensor = GasLeakSensor(sensor_id="TEST-CURVE", gas_type=GasType.PROPANE, simulation_mode=True)
+        slope, intercept = -0.42, 0.4
+
+        for ratio in (0.2, 1.0, 3.7):
+            expected = 10 ** ((math.log10(ratio) - intercept) / slope)
+            assert sensor._ratio_to_ppm(ratio) == pytest.approx(expected, rel=1e-12)
+        assert sensor._ratio_to_ppm(0.0) == 0.0
+
+
+class TestGasCalibration:
+    """Tests for compiled MQ calibration tables."""
+
+    def test_table_matches_datasheet_curve(self, test_config):
+        """Test that the default table reproduces the single-slope curve at every count."""
+        import math
+
+        sensor = GasLeakSensor(sensor_id="TEST-LUT", gas_type=GasType.PROPANE, simulation_mode=True)
+        slope, intercept = -0.42, 0.4
+
+        for counts in (32, 100, 512, 900, 1022):
+            voltage = counts * 3.3 / 1023
+            ratio = (3.3 - voltage) / voltage * sensor.r_load / sensor.r0
+            expected = 10 ** ((math.log10(ratio) - intercept) / slope)
+            assert sensor.table[counts] == pytest.approx(expected, rel=1e-9)
+        assert sensor.table[0] == 0.0
+        assert sensor.table[1023] == 0.0
+
+    def test_multi_point_calibration(self, test_config):
+        """Test that readings pass through each manufacturer point."""
+        sensor = GasLeakSensor(sensor_id="TEST-PTS", simulation_mode=True)
+        points = [(200.0, 1.8), (1000.0, 1.0), (5000.0, 0.6)]
+        old_table = sensor.table
+
+        sensor.calibrate_points(points)
+
+        assert sensor.table is not old_table
+        for ppm, ratio in points:
+            assert sensor._ratio_to_ppm(ratio) == pytest.approx(ppm)
+
+        with pytest.raises(ValueError):
+            sensor.calibrate_points([(100.0, 1.0)])
+
+    def test_environment_compensation(self, test_config):
+        """Test that ambient changes swap in a compensated table only when they matter."""
+        from src.sensors import Compensation
+
+        sensor = GasLeakSensor(sensor_id="TEST-ENV", simulation_mode=True)
+        reference = sensor.table
+
+        assert sensor.set_environment(20.2, 66.0) is False
+        assert sensor.set_environment(40.0, 80.0) is True
+        assert sensor.table.temperature_c == 40.0
+        # Warm, humid air lowers Rs on its own; compensation reads it as less gas
+        assert sensor.table[400] < reference[400]
+
+        assert sensor.calibration.compensation.factor(20.0, 65.0) == pytest.approx(1.0)
+        assert isinstance(sensor.calibration.compensation, Compensation)
+
+    def test_persisted_and_reloaded(self, test_config, tmp_path):
+        """Test that a recalibrated table is saved and used by the next sensor instance."""
+        test_config.sensors.calibration.persist = True
+        test_config.sensors.calibration.directory = str(tmp_path)
+
+        sensor = GasLeakSensor(sensor_id="TEST-SAVE", simulation_mode=True)
+        sensor.calibrate(14.5)
+        assert (tmp_path / "TEST-SAVE.json").exists()
+
+        reloaded = GasLeakSensor(sensor_id="TEST-SAVE", simulation_mode=True)
+        assert reloaded.r0 == 14.5
+        assert reloaded.table.ppm == sensor.table.ppm
+
+        # A table saved for another gas is not applied
+        other = GasLeakSensor(sensor_id="TEST-SAVE", gas_type=GasType.PROPANE, simulation_mode=True)
+        assert other.r0 == 10.0
+
+    def test_recalibration_rebuilds_batch(self, test_config):
+        """Test that the batch evaluator picks up a hot-swapped table."""
+        import numpy as np
+        from src.sensors import BatchEvaluator
+
+        sensors = [GasLeakSensor(sensor_id=f"TEST-HOT{i}", simulation_mode=True) for i in range(2)]
+        evaluator = BatchEvaluator(min_sensors=1)
+        voltages = np.array([1.0, 1.0])
+
+        before, _ = evaluator.evaluate(sensors, voltages)
+        sensors[0].calibrate(20.0)
+        after, _ = evaluator.evaluate(sensors, voltages)
+
+        assert evaluator.rebuilds == 2
+        assert after[0] != before[0] and after[1] == before[1]
+        assert after[0] == sensors[0].table.convert(1.0)
+
+    @pytest.mark.asyncio
+    async def test_monitor_feeds_ambient_readings(self, test_config):
+        """Test that temperature readings reach gas sensor compensation when enabled."""
+        from src.core import sensor_reading_event
+        from src.core.monitor import LuxxHausMonitor
+
+        test_config.sensors.calibration.ambient_compensation = True
+        monitor = LuxxHausMonitor(simulation_mode=True)
+        gas = monitor.add_gas_sensor()
+        temperature = monitor.add_temperature_sensor(location="Kitchen")
+        temperature.humidity = 80.0
+
+        await monitor._event_bus.publish_many([
+            sensor_reading_event(temperature.sensor_id, "temperature", 104.0, "°F"),
+        ])
+
+        assert gas.table.temperature_c == 40.0
+        assert gas.table.humidity == 80.0
+
+
+class TestStreamingDetectors:
+    """Tests for incremental early-warning detectors."""
+
+    def test_rate_tracks_slope_across_intervals(self):
+        """Test that the rate estimate is per minute regardless of sample spacing."""
+        from src.sensors import RateOfChangeDetector
+
+        detector = RateOfChangeDetector(limit=6.0, direction="falling", warmup_samples=5, confirm_samples=2)
+        t, value, detections = 0.0, 60.0, []
+        for i in range(60):
+            dt = 1.0 if i % 2 else 4.0  # adaptive sampling changes the spacing
+            t += dt
+            value -= 0.2 * dt  # 12 PSI/min
+            detections.append(detector.update(value, t))
+
+        assert detector.score == pytest.approx(-12.0, rel=0.01)
+        assert detections[-1].detector == "rate"
+        assert detections[:6] == [None] * 6
+
+        flat = RateOfChangeDetector(limit=6.0, direction="falling", warmup_samples=5)
+        assert all(flat.update(45.0, float(i)) is None for i in range(50))
+
+    def test_ewma_is_stable_on_large_offsets(self):
+        """Test that variance stays exact when values sit on a large offset."""
+        from src.sensors import EWMADetector
+
+        detector = EWMADetector(limit=4.0, smoothing=0.05)
+        for i in range(5000):
+            assert detector.update(1e9 + (1.0 if i % 2 else -1.0), float(i)) is None
+
+        assert detector.var == pytest.approx(1.0, rel=0.1)
+        detection = detector.update(1e9 + 10.0, 5000.0)
+        assert detection is not None and detection.score > 4.0
+
+    def test_cusum_catches_small_persistent_shift(self):
+        """Test that CUSUM flags a 1-sigma shift that EWMA z-scores miss."""
+        from src.sensors import CUSUMDetector, EWMADetector
+
+        cusum = CUSUMDetector(limit=5.0, drift=0.5, warmup_samples=50)
+        ewma = EWMADetector(limit=4.0, warmup_samples=50)
+        values = [(1.0 if i % 2 else -1.0) for i in range(200)] + [
+            1.0 + (1.0 if i % 2 else -1.0) for i in range(40)
+        ]
+
+        cusum_hits = [cusum.update(v, float(i)) for i, v in enumerate(values)]
+        ewma_hits = [ewma.update(v, float(i)) for i, v in enumerate(values)]
+
+        assert not any(cusum_hits[:200])
+        assert any(cusum_hits[200:])
+        assert not any(ewma_hits)
+
+    def test_config_attaches_to_hardware_sensors(self, test_config):
+        """Test the default early-warning detectors and that simulated sensors skip them."""
+        from src.sensors import RateOfChangeDetector
+        from src.sensors.detectors import detector_from_config
+
+        detector = detector_from_config(test_config.sensors.early_warning["water_pressure"])
+        assert isinstance(detector, RateOfChangeDetector)
+        assert detector.direction == "falling"
+
+        assert WaterPressureSensor(sensor_id="TEST-EW-SIM", simulation_mode=True).detectors == []
+
+    @pytest.mark.asyncio
+    async def test_early_warning_alert(self, test_config):
+        """Test that a detection raises a warning before the threshold is crossed."""
+        from src.sensors import RateOfChangeDetector
+
+        sensor = WaterPressureSensor(sensor_id="TEST-EW", threshold_psi=30.0, simulation_mode=True)
+        sensor.attach_detector(
+            RateOfChangeDetector(limit=6.0, direction="falling", warmup_samples=3, confirm_samples=2)
+        )
+        values = iter([60.0 - i for i in range(20)])
+        sensor.read_value = lambda: next(values)
+
+        with patch.object(sensor, '_db') as mock_db:
+            mock_db.queue_reading = AsyncMock()
+            mock_db.record_alert = AsyncMock()
+
+            readings = [await sensor.take_reading(emit=False) for _ in range(8)]
+
+        assert not any(r.is_alert for r in readings[:4])
+        assert readings[-1].severity == AlertSeverity.WARNING
+        assert readings[-1].value > 30.0
+        message = mock_db.record_alert.call_args.kwargs["message"]
+        assert "falling" in message and "Possible leak" in message
+
+
+class TestAlertPolicy:
+    """Tests for incident-based alerting."""
+
+    def test_debounce_and_critical_bypass(self):
+        """Test that entering needs consecutive alerts unless the reading is critical."""
+        from src.sensors import AlertPolicy
+
+        policy = AlertPolicy(enter_samples=3)
+
+        assert policy.update(AlertSeverity.WARNING, 0.0, 0.0) is None
+        assert policy.update(None, 0.5, 1.0) is None  # run broken
+        assert policy.update(AlertSeverity.WARNING, 0.0, 2.0) is None
+        assert policy.update(AlertSeverity.CRITICAL, 0.0, 3.0) == "open"
+
+    def test_escalation_and_renotify(self):
+        """Test that an open incident only notifies on escalation or after the re-notify interval."""
+        from src.sensors import AlertPolicy
+
+        policy = AlertPolicy(renotify_seconds=60.0)
+        transitions = [
+            policy.update(severity, 0.0, float(t))
+            for t, severity in enumerate(
+                [AlertSeverity.WARNING] * 5 + [AlertSeverity.DANGER] + [AlertSeverity.WARNING] * 5
+            )
+        ]
+
+        assert transitions == ["open"] + [None] * 4 + ["escalate"] + [None] * 5
+        assert policy.update(AlertSeverity.WARNING, 0.0, 65.0) == "renotify"
+        assert policy.get_status()["suppressed"] == 9
+
+    def test_persisting_incident_escalates(self):
+        """Test that an incident open past escalate_after_seconds steps up one severity at a time."""
+        from src.sensors import AlertPolicy
+
+        policy = AlertPolicy(renotify_seconds=0.0, escalate_after_seconds=60.0)
+        policy.update(AlertSeverity.WARNING, 0.0, 0.0)
+
+        assert policy.update(AlertSeverity.WARNING, 0.0, 30.0) is None
+        assert policy.update(AlertSeverity.WARNING, 0.0, 60.0) == "escalate"
+        assert (policy.previous_severity, policy.severity) == (AlertSeverity.WARNING, AlertSeverity.DANGER)
+        assert policy.update(AlertSeverity.WARNING, 0.0, 100.0) is None
+        assert policy.update(AlertSeverity.WARNING, 0.0, 120.0) == "escalate"
+        assert policy.severity == AlertSeverity.CRITICAL
+        assert policy.update(AlertSeverity.WARNING, 0.0, 600.0) is None  # nothing above critical
+        assert policy.get_status()["escalations"] == 2
+
+    def test_severity_escalation_can_be_disabled(self):
+        """Test that with escalate_on_severity off a rising severity waits for the re-notify."""
+        from src.sensors import AlertPolicy
+
+        policy = AlertPolicy(renotify_seconds=60.0, escalate_on_severity=False)
+        policy.update(AlertSeverity.WARNING, 0.0, 0.0)
+
+        assert policy.update(AlertSeverity.DANGER, 0.0, 1.0) is None
+        assert policy.update(AlertSeverity.WARNING, 0.0, 60.0) == "renotify"
+        assert policy.severity == AlertSeverity.DANGER
+
+    def test_hysteresis_and_dwell(self):
+        """Test that clearing needs readings outside the exit band after the minimum dwell."""
+        from src.sensors import AlertPolicy
+
+        policy = AlertPolicy(exit_samples=2, exit_band=0.1, min_dwell_seconds=10.0)
+        policy.update(AlertSeverity.DANGER, 0.0, 0.0)
+
+        # Below threshold but inside the band: still active
+        assert [policy.update(None, 0.05, t) for t in (1.0, 2.0, 3.0)] == [None] * 3
+        # Clear, but the incident is younger than the dwell time
+        assert [policy.update(None, 0.5, t) for t in (4.0, 5.0)] == [None, None]
+        assert policy.active
+
+        assert policy.update(None, 0.5, 10.0) == "resolve"
+        assert not policy.active
+        assert policy.last_severity == AlertSeverity.DANGER
+
+    @pytest.mark.asyncio
+    async def test_hovering_value_alerts_once(self, test_config):
+        """Test that a gas level hovering at its threshold records one alert per incident."""
+        test_config.sensors.alert_policy.min_dwell_seconds = 0.0
+        sensor = GasLeakSensor(
+            sensor_id="TEST-GLD-HOVER",
+            gas_type=GasType.NATURAL_GAS,
+            threshold_ppm=50.0,
+            simulation_mode=True,
+        )
+        values = iter([49.0, 51.0, 49.5, 52.0, 50.5, 49.8, 51.2, 40.0, 40.0, 40.0, 55.0])
+        sensor.read_value = lambda: next(values)
+
+        with patch.object(sensor, '_db') as mock_db, patch(
+            "src.sensors.base.emit_alert_resolved", new=AsyncMock()
+        ) as resolved:
+            mock_db.queue_reading = AsyncMock()
+            mock_db.record_alert = AsyncMock()
+            mock_db.update_open_alert = AsyncMock()
+            mock_db.resolve_alerts = AsyncMock()
+
+            readings = [await sensor.take_reading(emit=False) for _ in range(11)]
+
+        assert sum(r.is_alert for r in readings) == 5
+        assert mock_db.record_alert.call_count == 2  # first incident, then the new one at 55
+        mock_db.resolve_alerts.assert_awaited_once_with("TEST-GLD-HOVER")
+        assert resolved.call_args.kwargs["severity"] == "warning"
+
+    @pytest.mark.asyncio
+    async def test_escalation_updates_open_alert(self, test_config):
+        """Test that escalating updates the incident's alert row and emits ALERT_ESCALATED."""
+        sensor = GasLeakSensor(
+            sensor_id="TEST-GLD-ESC",
+            gas_type=GasType.NATURAL_GAS,
+            threshold_ppm=50.0,
+            simulation_mode=True,
+        )
+        sensor.danger_threshold = 100.0
+        sensor.critical_threshold = 500.0
+        values = iter([60.0, 70.0, 150.0])
+        sensor.read_value = lambda: next(values)
+
+        with patch.object(sensor, '_db') as mock_db, patch(
+            "src.sensors.base.emit_alert", new=AsyncMock()
+        ) as triggered, patch(
+            "src.sensors.base.emit_alert_escalated", new=AsyncMock()
+        ) as escalated:
+            mock_db.queue_reading = AsyncMock()
+            mock_db.record_alert = AsyncMock()
+            mock_db.update_open_alert = AsyncMock()
+
+            for _ in range(3):
+                await sensor.take_reading(emit=False)
+
+        mock_db.record_alert.assert_awaited_once()
+        triggered.assert_awaited_once()
+        assert mock_db.update_open_alert.call_args.kwargs["severity"] == AlertSeverity.DANGER
+        assert escalated.call_args.kwargs["severity"] == "danger"
+        assert escalated.call_args.kwargs["previous_severity"] == "warning"
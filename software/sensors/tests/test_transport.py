@@ -0,0 +1,137 @@
+"""
+Tests for the cross-process event transport.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.core import (
+    Event,
+    EventBus,
+    EventType,
+    HubAlreadyRunning,
+    UnixSocketBridge,
+    UnixSocketHub,
+    decode_event,
+    encode_event,
+    start_transport,
+)
+from src.core.config import EventTransportConfig
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (Unix socket paths are limited to ~100 bytes)."""
+    with tempfile.TemporaryDirectory(prefix="lx") as tmp:
+        yield str(Path(tmp) / "events.sock")
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestFraming:
+    """Tests for the binary event framing."""
+
+    def test_round_trip(self):
+        """Test that an event survives encode/decode."""
+        event = Event(
+            type=EventType.ALERT_TRIGGERED,
+            data={"sensor_id": "S1", "value": 12.5, "severity": "critical"},
+            source="S1",
+        )
+
+        frame = encode_event(event)
+        decoded = decode_event(frame[5:])
+
+        assert decoded == event
+
+
+class TestUnixSocketTransport:
+    """Tests for hub/bridge event forwarding."""
+
+    @pytest.mark.asyncio
+    async def test_events_cross_processes(self, socket_path):
+        """Test forwarding in both directions and relay between clients."""
+        hub_bus, api_bus, worker_bus = EventBus(), EventBus(), EventBus()
+        hub = UnixSocketHub(hub_bus, socket_path)
+        api = UnixSocketBridge(api_bus, socket_path, subscribe_patterns=["sensor.*"])
+        worker = UnixSocketBridge(worker_bus, socket_path, reconnect_interval=0.05)
+
+        api_received, worker_received, hub_received = [], [], []
+        api_bus.subscribe("*", api_received.append)
+        worker_bus.subscribe("*", worker_received.append)
+        hub_bus.subscribe("*", hub_received.append)
+
+        await hub.start()
+        await api.start()
+        await worker.start()
+        await api.wait_connected(timeout=2)
+        await worker.wait_connected(timeout=2)
+        await wait_for(lambda: hub.get_status()["clients"] == 2)
+        await asyncio.sleep(0.05)  # let SUBSCRIBE frames land
+
+        await hub_bus.emit(EventType.SENSOR_READING, {"value": 1.0}, source="S1")
+        await hub_bus.emit(EventType.VALVE_CLOSED, {}, source="V1")
+        await worker_bus.emit(EventType.SENSOR_ALERT, {"value": 2.0}, source="S2")
+
+        await wait_for(lambda: len(api_received) == 2 and len(hub_received) == 3)
+        await wait_for(lambda: len(worker_received) == 3)
+
+        # The API only asked for sensor.* events
+        assert [e.type for e in api_received] == [
+            EventType.SENSOR_READING,
+            EventType.SENSOR_ALERT,
+        ]
+        # Nothing is echoed back to where it came from
+        await asyncio.sleep(0.05)
+        assert len(worker_received) == 3
+        assert len(hub_received) == 3
+
+        await worker.stop()
+        await api.stop()
+        await hub.stop()
+
+    @pytest.mark.asyncio
+    async def test_second_hub_does_not_steal_socket(self, socket_path):
+        """Test that a live hub keeps its socket and auto role falls back to client."""
+        first = UnixSocketHub(EventBus(), socket_path)
+        await first.start()
+
+        with pytest.raises(HubAlreadyRunning):
+            await UnixSocketHub(EventBus(), socket_path).start()
+
+        second = await start_transport(
+            EventBus(), EventTransportConfig(role="auto", socket_path=socket_path)
+        )
+        assert isinstance(second, UnixSocketBridge)
+        await second.wait_connected(timeout=2)
+        await wait_for(lambda: first.get_status()["clients"] == 1)
+
+        await second.stop()
+        await first.stop()
+
+    @pytest.mark.asyncio
+    async def test_stale_socket_replaced(self, socket_path):
+        """Test that a socket file nobody listens on is taken over."""
+        import socket
+
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(socket_path)
+        stale.close()  # file left behind, nothing listening
+
+        hub = UnixSocketHub(EventBus(), socket_path)
+        await hub.start()
+        bridge = UnixSocketBridge(EventBus(), socket_path)
+        await bridge.start()
+        await bridge.wait_connected(timeout=2)
+
+        await bridge.stop()
+        await hub.stop()